@@ -0,0 +1,129 @@
+# analytics_engine.py
+"""Cross-dataset rollups over every CSV in the demo data tree."""
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from dataset_schema import (
+    BUCKET_FAILING, BUCKET_MISSING, BUCKET_TEXT_COLORS, BUCKET_UPPER_BOUNDS,
+)
+
+ROLLUP_LEVELS = ("Grade", "Subject", "Assignment")
+BUCKET_LABELS = ("Missing", "Failing", "Support", "Proficient", "Exceptional")
+
+
+def load_scores(path):
+    """Read just the Score column of one dataset as (score float array, submitted mask)."""
+    scores = pd.read_csv(path, usecols=["Score"], dtype={"Score": str})["Score"]
+    numeric = pd.to_numeric(scores, errors="coerce").to_numpy(dtype=np.float32)
+    return numeric, ~np.isnan(numeric)
+
+
+class AnalyticsEngine:
+    """One concatenated frame of every dataset's scores, rebuilt incrementally.
+
+    Each dataset is keyed by its (size, mtime_ns) stamp, so refresh() only
+    re-reads files that were added or changed. Grade, Subject and Assignment
+    are categoricals built from per-dataset codes, which keeps groupby
+    rollups cheap even across hundreds of thousands of rows.
+    """
+
+    def __init__(self, demo_manager, max_workers=None):
+        self.demo_manager = demo_manager
+        self.max_workers = max_workers
+        self._datasets = {}
+        self._frame = None
+
+    def refresh(self, datasets=None):
+        """Load new or changed datasets in parallel; return how many were (re)loaded.
+
+        ``datasets`` is a list of (key, path) pairs. Callers on another thread
+        pass a snapshot, because the demo manager's structure may change
+        under them; by default it is taken here.
+        """
+        if datasets is None:
+            datasets = self.demo_manager.dataset_files()
+        live = {}
+        for key, path in datasets:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            live[key] = (path, (stat.st_size, stat.st_mtime_ns))
+
+        stale = [
+            key for key, (_, stamp) in live.items()
+            if key not in self._datasets or self._datasets[key][0] != stamp
+        ]
+        removed = [key for key in self._datasets if key not in live]
+        for key in removed:
+            del self._datasets[key]
+
+        if stale:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                loaded = pool.map(self._load, [(key, *live[key]) for key in stale])
+                for key, stamp, data in loaded:
+                    if data is not None:
+                        self._datasets[key] = (stamp, *data)
+        if stale or removed or self._frame is None:
+            self._frame = self._build_frame()
+        return len(stale)
+
+    def frame(self):
+        if self._frame is None:
+            self.refresh()
+        return self._frame
+
+    def rollup(self, by=("Grade",)):
+        """Students, submission rate, average score and bucket shares per group."""
+        frame = self.frame()
+        by = list(by)
+        grouped = frame.groupby(by, observed=True, sort=True)
+        summary = grouped.agg(
+            Students=("Submitted", "size"),
+            Submitted=("Submitted", "sum"),
+            Average=("Score", "mean"),
+        )
+        summary["Submission Rate"] = summary["Submitted"] / summary["Students"]
+        buckets = pd.crosstab(
+            [frame[column] for column in by], frame["Bucket"], normalize="index"
+        ).reindex(columns=range(len(BUCKET_TEXT_COLORS)), fill_value=0.0)
+        buckets.columns = list(BUCKET_LABELS)
+        return summary.join(buckets)
+
+    # --- Internal helpers ---
+    @staticmethod
+    def _load(job):
+        key, path, stamp = job
+        try:
+            return key, stamp, load_scores(path)
+        except (OSError, ValueError, pd.errors.ParserError) as e:
+            logging.error("Skipping %s in analytics: %s", path, e)
+            return key, stamp, None
+
+    def _build_frame(self):
+        keys = sorted(self._datasets)
+        if not keys:
+            return pd.DataFrame({
+                "Grade": pd.Categorical([]), "Subject": pd.Categorical([]),
+                "Assignment": pd.Categorical([]), "Score": np.zeros(0, dtype=np.float32),
+                "Submitted": np.zeros(0, dtype=bool), "Bucket": np.zeros(0, dtype=np.int8),
+            })
+        lengths = [len(self._datasets[key][1]) for key in keys]
+        dataset_codes = np.repeat(np.arange(len(keys)), lengths)
+        scores = np.concatenate([self._datasets[key][1] for key in keys])
+        submitted = np.concatenate([self._datasets[key][2] for key in keys])
+
+        frame = {}
+        for position, column in enumerate(ROLLUP_LEVELS):
+            values = [key[position] for key in keys]
+            codes, categories = pd.factorize(pd.Series(values), sort=True)
+            frame[column] = pd.Categorical.from_codes(codes[dataset_codes], categories=categories)
+        buckets = np.digitize(np.nan_to_num(scores), BUCKET_UPPER_BOUNDS, right=True) + BUCKET_FAILING
+        frame["Score"] = scores
+        frame["Submitted"] = submitted
+        frame["Bucket"] = np.where(submitted, buckets, BUCKET_MISSING).astype(np.int8)
+        return pd.DataFrame(frame)
@@ -0,0 +1,40 @@
+# atomic_file.py
+"""Temp files for write-then-rename saves that keep normal file permissions."""
+import os
+import secrets
+
+_TEMP_FLAGS = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+_TEMP_ATTEMPTS = 100
+
+
+def create_temp_beside(path, suffix=".tmp"):
+    """Create an empty temp file next to path; returns (fd, temp path).
+
+    Unlike tempfile.mkstemp, which always creates 0600 files, the file gets
+    the mode a plain open() would: 0666 less the umask, applied by the
+    kernel, so the process umask is never read or changed. When path
+    already exists its permission bits are copied, so replacing it keeps
+    its mode.
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    for _ in range(_TEMP_ATTEMPTS):
+        tmp_path = os.path.join(directory, f".{name}.{secrets.token_hex(4)}{suffix}")
+        try:
+            fd = os.open(tmp_path, _TEMP_FLAGS, 0o666)
+            break
+        except FileExistsError:
+            continue
+    else:
+        raise FileExistsError(f"No unused temporary name next to {path}")
+
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except OSError:
+        return fd, tmp_path
+    try:
+        os.chmod(tmp_path, mode)
+    except OSError:
+        os.close(fd)
+        os.remove(tmp_path)
+        raise
+    return fd, tmp_path
@@ -0,0 +1,103 @@
+# benchmark_demo_data.py
+"""Compare CSV and sidecar load times for demo datasets.
+
+Usage:
+    python benchmark_demo_data.py [--files N] [--rows N] [--skip-shipped]
+
+Two trees are measured: the shipped demo_data datasets, and a synthetic tree
+of N files with --rows rows each. The synthetic tree is built in a temporary
+directory. Each pass uses a fresh DemoDataManager, so nothing is served from
+the in-memory cache. The CSV pass runs with sidecars disabled. A warm-up pass
+then writes the sidecars, and the sidecar pass loads them.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from dataset_schema import EXPECTED_HEADERS, NOT_SUBMITTED
+from demo_data_manager import DemoDataManager
+
+SUBJECTS = ("Math", "Science", "ELA", "Social Studies")
+RUBRICS = (
+    "Correctness → Excellent | Method → Advanced",
+    "Correctness → Good | Method → Proficient",
+    "Correctness → Developing | Method → Needs Work",
+)
+
+
+def write_synthetic_tree(root, files, rows):
+    """Spread files over grades 6-8 and four subjects, like demo_data/."""
+    rng = random.Random(0)
+    header = ",".join(EXPECTED_HEADERS) + "\n"
+    for number in range(files):
+        directory = Path(root) / str(6 + number % 3) / SUBJECTS[number // 3 % len(SUBJECTS)]
+        directory.mkdir(parents=True, exist_ok=True)
+        lines = [header]
+        for row in range(rows):
+            if rng.random() < 0.05:
+                score, feedback, rubric = NOT_SUBMITTED, "", ""
+            else:
+                score, feedback, rubric = rng.randint(40, 100), "Solid work", rng.choice(RUBRICS)
+            lines.append(f"Student {row},{score},{feedback},{rubric}\n")
+        (directory / f"Assignment {number:05d}.csv").write_text("".join(lines), encoding="utf-8")
+
+
+def load_all(data_dir, sidecar_dir, use_sidecars):
+    """Seconds to load every dataset once, with a fresh manager."""
+    manager = DemoDataManager(
+        data_dir=data_dir, sidecar_dir=sidecar_dir, use_sidecars=use_sidecars,
+        persist_index=False, cache_bytes=0,
+    )
+    datasets = manager.list_datasets()
+    started = time.perf_counter()
+    for key in datasets:
+        if manager.load_csv(*key)[0] is None:
+            raise RuntimeError(f"Failed to load {key}")
+    return time.perf_counter() - started, len(datasets)
+
+
+def compare(label, data_dir):
+    # Sidecars go to a scratch directory, never the real demo_data/.cache
+    with tempfile.TemporaryDirectory() as sidecar_dir:
+        csv_seconds, count = load_all(data_dir, sidecar_dir, use_sidecars=False)
+        load_all(data_dir, sidecar_dir, use_sidecars=True)
+        sidecar_seconds, _ = load_all(data_dir, sidecar_dir, use_sidecars=True)
+    print(f"{label}: {count} datasets")
+    print(f"  CSV:      {csv_seconds * 1000:9.1f} ms ({csv_seconds / count * 1000:.2f} ms/file)")
+    print(f"  sidecar:  {sidecar_seconds * 1000:9.1f} ms ({sidecar_seconds / count * 1000:.2f} ms/file)"
+          f"  {csv_seconds / sidecar_seconds:.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=10000)
+    parser.add_argument("--rows", type=int, default=30)
+    parser.add_argument("--skip-shipped", action="store_true",
+                        help="only measure the synthetic tree")
+    args = parser.parse_args()
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        sys.exit("Sidecars need the optional 'pyarrow' package")
+    # Keep one-off import costs out of the first timed pass
+    import pandas  # noqa: F401
+    import pyarrow.feather  # noqa: F401
+
+    if not args.skip_shipped:
+        compare("shipped demo_data",
+                os.path.join(os.path.dirname(os.path.abspath(__file__)), "demo_data"))
+
+    with tempfile.TemporaryDirectory() as root:
+        started = time.perf_counter()
+        write_synthetic_tree(root, args.files, args.rows)
+        print(f"(built synthetic tree in {time.perf_counter() - started:.1f} s)")
+        compare(f"synthetic tree, {args.rows} rows per file", root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# benchmark_export.py
+"""Compare export formats: file size, write time and read-back time.
+
+Usage:
+    python benchmark_export.py [--sizes N ...] [--formats SUFFIX ...]
+
+Each format is written by ExportWorker, the same code path as the Results
+Viewer's Export button, run synchronously. It is then read back with
+pandas, the way downstream analytics jobs consume it. Formats whose
+optional dependency (pyarrow, zstandard) is missing are reported and
+skipped.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from grading_results import GradingResults
+from results_export import EXPORT_FORMATS, ExportWorker
+
+FEEDBACK = (
+    "Excellent work! You clearly understand the material.",
+    "Good job. Review the last section for small errors.",
+    "You're getting there; revisit the worked examples.",
+)
+RUBRICS = (
+    "Content: Excellent | Analysis: Excellent",
+    "Content: Good | Analysis: Proficient",
+    "Content: Developing | Analysis: Needs Work",
+)
+
+
+def make_results(rows):
+    rng = np.random.default_rng(0)
+    submitted = rng.random(rows) > 0.05
+    band = rng.integers(0, 3, rows)
+    return GradingResults(
+        [f"Student {i}" for i in range(rows)],
+        np.where(submitted, rng.integers(60, 100, rows), 0),
+        submitted,
+        np.where(submitted, np.take(FEEDBACK, band), ""),
+        np.where(submitted, np.take(RUBRICS, band), ""),
+    )
+
+
+def read_back(path, suffix):
+    if suffix == ".parquet":
+        return pd.read_parquet(path)
+    if suffix == ".jsonl":
+        return pd.read_json(path, lines=True)
+    return pd.read_csv(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 1000000])
+    parser.add_argument("--formats", nargs="+", default=[suffix for suffix, _ in EXPORT_FORMATS])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for rows in args.sizes:
+            results = make_results(rows)
+            print(f"{rows:,} rows")
+            print(f"  {'format':<10} {'size':>10} {'write':>9} {'read':>9}")
+            for suffix in args.formats:
+                path = os.path.join(directory, f"results{suffix}")
+                worker = ExportWorker(results, path)
+                failures = []
+                worker.error.connect(failures.append)
+                started = time.perf_counter()
+                worker.run()
+                written = time.perf_counter() - started
+                if failures:
+                    print(f"  {suffix:<10} skipped: {failures[0]}")
+                    continue
+                started = time.perf_counter()
+                frame = read_back(path, suffix)
+                read = time.perf_counter() - started
+                if len(frame) != rows:
+                    raise RuntimeError(f"{suffix}: read {len(frame)} rows, expected {rows}")
+                print(f"  {suffix:<10} {os.path.getsize(path) / 1e6:8.2f} MB "
+                      f"{written * 1000:7.0f} ms {read * 1000:7.0f} ms")
+                os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
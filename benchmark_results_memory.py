@@ -0,0 +1,50 @@
+# benchmark_results_memory.py
+"""Compare the memory held by GradingResults and the legacy list of dicts.
+
+Usage:
+    python benchmark_results_memory.py [--rows N ...]
+
+Each size is built once as GradingResults, using the same synthetic data as
+benchmark_export.py, and once as the list of row dicts that
+current_results used to be, built by GradingResults.records(). Memory is
+what tracemalloc still sees allocated once construction has finished, so
+temporaries are excluded and numpy buffers are included. Timings are not
+reported because tracing slows allocation down.
+"""
+import argparse
+import gc
+import tracemalloc
+
+from benchmark_export import make_results
+
+
+def measure(build):
+    """Run build(); return (result, bytes it still holds)."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    held, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, held
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100000, 1000000])
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        results, typed = measure(lambda: make_results(rows))
+        records, legacy = measure(results.records)
+        if len(records) != rows:
+            raise RuntimeError(f"built {len(records)} records, expected {rows}")
+        del records
+
+        print(f"{rows:,} rows")
+        print(f"  GradingResults {typed / 1e6:8.1f} MB "
+              f"(memory_usage() estimate {results.memory_usage() / 1e6:.1f} MB)")
+        print(f"  list of dicts  {legacy / 1e6:8.1f} MB ({legacy / typed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
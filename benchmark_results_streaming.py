@@ -0,0 +1,96 @@
+# benchmark_results_streaming.py
+"""Measure UI frame times while graded rows stream into the Results Viewer.
+
+Usage:
+    python benchmark_results_streaming.py [--rows N] [--batch N] [--offscreen]
+
+The Results Viewer is left on screen and fed --rows synthetic results in
+--batch sized parts, the way Worker.partial delivers them during a run.
+Each frame is one part: appending it to the model, plus the legend update
+and repaint this triggers. The append on its own is reported separately. Slow frames are what a teacher feels as a stall
+while scrolling mid-run. Settings are written to a temporary directory,
+not the real settings.json.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--batch", type=int, default=2000)
+    parser.add_argument("--offscreen", action="store_true",
+                        help="use the Qt offscreen platform (headless machines)")
+    args = parser.parse_args()
+    if args.offscreen:
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+    import numpy as np
+    from PyQt5.QtWidgets import QApplication, QDialog
+
+    app = QApplication(sys.argv)
+    app.setStyle("Fusion")
+    # Keep the first-launch guided tour from blocking the run
+    QDialog.exec_ = lambda self: 0
+
+    import gradespark_gui
+    from grading_engine import FEEDBACK_TEMPLATES, RUBRIC_TEMPLATES
+    from grading_results import GradingResults
+
+    rng = np.random.default_rng(0)
+    parts = []
+    for start in range(0, args.rows, args.batch):
+        count = min(args.batch, args.rows - start)
+        band = rng.integers(0, 4, count)
+        parts.append(GradingResults(
+            [f"Student {i}" for i in range(start, start + count)],
+            rng.integers(60, 100, count),
+            rng.random(count) > 0.05,
+            np.take(FEEDBACK_TEMPLATES, band),
+            np.take(RUBRIC_TEMPLATES, band),
+        ))
+
+    working_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as settings_dir:
+        # settings.json is resolved against the working directory
+        os.chdir(settings_dir)
+        window = gradespark_gui.GradeSparkGUI()
+        window.show()
+        window.tabs.setCurrentIndex(gradespark_gui.RESULTS_TAB)
+        window.results_model.clear()
+        app.processEvents()
+
+        frames, appends = [], []
+        started = time.perf_counter()
+        for part in parts:
+            frame_started = time.perf_counter()
+            window.append_partial_results(part)
+            appends.append((time.perf_counter() - frame_started) * 1000)
+            app.processEvents()
+            window.repaint()
+            frames.append((time.perf_counter() - frame_started) * 1000)
+        total = time.perf_counter() - started
+        rows = window.results_model.rowCount()
+        window.close()
+        os.chdir(working_dir)
+
+    if rows != args.rows:
+        raise RuntimeError(f"model holds {rows} rows, expected {args.rows}")
+    # Frames that grow with the rows already shown mean appends are not O(batch)
+    tenth = max(len(frames) // 10, 1)
+    early, late = statistics.mean(frames[:tenth]), statistics.mean(frames[-tenth:])
+    ordered = sorted(frames)
+    print(f"{args.rows:,} rows in {len(parts)} parts of {args.batch}: {total:.2f} s total")
+    print(f"  frame median {statistics.median(ordered):.1f} ms, "
+          f"p95 {ordered[int(len(ordered) * 0.95) - 1]:.1f} ms, max {ordered[-1]:.1f} ms")
+    print(f"  first 10% of parts {early:.1f} ms/frame, last 10% {late:.1f} ms/frame")
+    print(f"  model append + legend: first 10% {statistics.mean(appends[:tenth]):.2f} ms, "
+          f"last 10% {statistics.mean(appends[-tenth:]):.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# benchmark_startup.py
+"""Measure cold-start cost: module import time and time to first paint.
+
+Usage:
+    python benchmark_startup.py [--runs N] [--offscreen]
+
+Each run is a fresh interpreter so nothing is served from a warm process.
+The import figure comes from ``python -X importtime``; time to first paint
+is measured from interpreter start until the main window's first paint event.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# Modules the GUI defers until first use. Not "platform": numpy imports it
+# itself, so it is always loaded and would say nothing about our imports.
+HEAVY_MODULES = ("pandas", "pyarrow", "urllib.request", "lead_capture")
+
+FIRST_PAINT_SCRIPT = r"""
+import sys, time
+started = time.perf_counter()
+from PyQt5.QtCore import QEvent, QObject, QTimer
+from PyQt5.QtWidgets import QApplication, QDialog
+app = QApplication(sys.argv)
+app.setStyle("Fusion")
+QDialog.exec_ = lambda self: 0
+import gradespark_gui
+
+class FirstPaint(QObject):
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            print(f"first_paint_ms={(time.perf_counter() - started) * 1000:.1f}")
+            print("loaded=" + ",".join(
+                name for name in %(heavy)r if name in sys.modules
+            ))
+            QTimer.singleShot(0, app.quit)
+            obj.removeEventFilter(self)
+        return False
+
+window = gradespark_gui.GradeSparkGUI()
+watcher = FirstPaint()
+window.installEventFilter(watcher)
+window.show()
+app.exec_()
+""" % {"heavy": HEAVY_MODULES}
+
+
+def import_time_ms(env):
+    """Cumulative import time of gradespark_gui as reported by -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import gradespark_gui"],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    for line in result.stderr.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == "gradespark_gui":
+            return int(fields[1]) / 1000
+    raise RuntimeError("gradespark_gui missing from -X importtime output")
+
+
+def first_paint(env):
+    result = subprocess.run(
+        [sys.executable, "-c", FIRST_PAINT_SCRIPT],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    values = dict(
+        line.split("=", 1) for line in result.stdout.splitlines() if "=" in line
+    )
+    return float(values["first_paint_ms"]), values.get("loaded", "")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--offscreen", action="store_true",
+                        help="use the Qt offscreen platform (headless machines)")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [os.path.dirname(os.path.abspath(__file__)), env.get("PYTHONPATH")])
+    )
+    if args.offscreen:
+        env["QT_QPA_PLATFORM"] = "offscreen"
+
+    imports = [import_time_ms(env) for _ in range(args.runs)]
+    paints = [first_paint(env) for _ in range(args.runs)]
+    print(f"import gradespark_gui: median {statistics.median(imports):.1f} ms "
+          f"(min {min(imports):.1f})")
+    paint_times = [elapsed for elapsed, _ in paints]
+    print(f"time to first paint:   median {statistics.median(paint_times):.1f} ms "
+          f"(min {min(paint_times):.1f})")
+    print(f"heavy modules loaded before first paint: {paints[-1][1] or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# benchmark_theme.py
+"""Measure dark/light theme toggle latency with a large Results Viewer table.
+
+Usage:
+    python benchmark_theme.py [--rows N] [--toggles N] [--offscreen]
+
+The Results Viewer is populated with N synthetic rows and left on screen, then
+the Dark Mode checkbox is toggled repeatedly. Each toggle is timed twice: until
+its handler returns control to the event loop, and until the pending events
+and repaint it causes have run, i.e. until the new theme is on screen.
+Settings are written to a temporary directory, not the real settings.json.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--toggles", type=int, default=20)
+    parser.add_argument("--offscreen", action="store_true",
+                        help="use the Qt offscreen platform (headless machines)")
+    args = parser.parse_args()
+    if args.offscreen:
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+    import numpy as np
+    from PyQt5.QtWidgets import QApplication, QDialog
+
+    app = QApplication(sys.argv)
+    app.setStyle("Fusion")
+    # Keep the first-launch guided tour from blocking the run
+    QDialog.exec_ = lambda self: 0
+
+    import gradespark_gui
+    from grading_results import GradingResults
+
+    rng = np.random.default_rng(0)
+    results = GradingResults(
+        [f"Student {i}" for i in range(args.rows)],
+        rng.integers(40, 101, args.rows),
+        rng.random(args.rows) > 0.05,
+        ["Solid work; review the final section."] * args.rows,
+        ["Content: Good | Analysis: Developing"] * args.rows,
+    )
+
+    working_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as settings_dir:
+        # settings.json is resolved against the working directory
+        os.chdir(settings_dir)
+        window = gradespark_gui.GradeSparkGUI()
+        window.show()
+        window.current_results = results
+        window.populate_results_table(results)
+        window.tabs.setCurrentIndex(gradespark_gui.RESULTS_TAB)
+        app.processEvents()
+
+        checkbox = window.dark_mode_checkbox
+        handler, on_screen = [], []
+        for _ in range(args.toggles):
+            started = time.perf_counter()
+            checkbox.setChecked(not checkbox.isChecked())
+            handled = time.perf_counter()
+            app.processEvents()
+            window.repaint()
+            handler.append((handled - started) * 1000)
+            on_screen.append((time.perf_counter() - started) * 1000)
+        window.close()
+        os.chdir(working_dir)
+
+    print(f"theme toggle with {args.rows} rows")
+    for label, samples in (("handler returns", handler), ("new theme on screen", on_screen)):
+        print(f"  {label + ':':21} median {statistics.median(samples):.1f} ms "
+              f"(min {min(samples):.1f}, max {max(samples):.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+# dataset_schema.py
+"""Dataset layout and score buckets, plus up-front checks that a CSV matches."""
+import csv
+import logging
+import re
+from collections import namedtuple
+from pathlib import Path
+
+EXPECTED_HEADERS = ["Student Name", "Score", "Feedback", "Rubric"]
+NOT_SUBMITTED = "Not submitted"
+# Graded results keep the dataset's column layout
+RESULT_COLUMNS = list(EXPECTED_HEADERS)
+MAX_SCORE = 100
+STRICT_CHUNK_ROWS = 20000
+DEFAULT_MAX_ISSUES = 100
+
+# --- Score buckets (single source for table colours, legend and summaries) ---
+BUCKET_MISSING, BUCKET_FAILING, BUCKET_SUPPORT, BUCKET_PROFICIENT, BUCKET_EXCEPTIONAL = range(5)
+BUCKET_UPPER_BOUNDS = [65, 75, 89]  # inclusive upper score of failing/support/proficient
+BUCKET_TEXT_COLORS = (
+    "#b91c1c",  # missing: treat non-submitters as failing
+    "#b91c1c",  # red
+    "#ca8a04",  # yellow
+    "#15803d",  # green
+    "#1d4ed8",  # blue for top performers
+)
+LEGEND_ENTRIES = (
+    ("#ef4444", "Red = Failed/Not Submitted", (BUCKET_MISSING, BUCKET_FAILING)),
+    ("#facc15", "Yellow = Needs Extra Support", (BUCKET_SUPPORT,)),
+    ("#16a34a", "Green = Proficient", (BUCKET_PROFICIENT,)),
+    ("#2563eb", "Blue = Exceptional Performance", (BUCKET_EXCEPTIONAL,)),
+)
+
+# line is the 1-based physical line in the file (the header is line 1), or None
+SchemaIssue = namedtuple("SchemaIssue", "line column message")
+_EXTRA_COLUMN = "_extra"
+
+
+def read_header(path):
+    """Parse only the first line of a CSV; returns [] for an empty file."""
+    with open(path, "r", encoding="utf-8-sig", newline="") as handle:
+        first_line = handle.readline()
+    return next(csv.reader([first_line]), [])
+
+
+def check_header(path):
+    """Return a list of SchemaIssues for the header line (empty if it matches)."""
+    try:
+        header = read_header(path)
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        return [SchemaIssue(1, None, f"Unreadable header: {e}")]
+    if header == EXPECTED_HEADERS:
+        return []
+    missing = [name for name in EXPECTED_HEADERS if name not in header]
+    unexpected = [name for name in header if name not in EXPECTED_HEADERS]
+    details = []
+    if missing:
+        details.append(f"missing {', '.join(missing)}")
+    if unexpected:
+        details.append(f"unexpected {', '.join(unexpected)}")
+    if not details:
+        details.append("columns out of order")
+    return [SchemaIssue(1, None, f"Header mismatch ({'; '.join(details)}). "
+                                 f"Expected: {', '.join(EXPECTED_HEADERS)}")]
+
+
+def check_rows(path, chunksize=STRICT_CHUNK_ROWS, max_issues=DEFAULT_MAX_ISSUES):
+    """Streaming type check of every row, reporting problems by line number.
+
+    Line numbers assume no quoted field spans several lines.
+    """
+    import pandas as pd
+
+    issues = check_header(path)
+    if issues:
+        return issues
+
+    line = 1
+    try:
+        # A spare trailing column catches rows with too many fields
+        with pd.read_csv(path, chunksize=chunksize, dtype=str, keep_default_na=False,
+                         skip_blank_lines=False, header=None, skiprows=1,
+                         names=EXPECTED_HEADERS + [_EXTRA_COLUMN]) as reader:
+            for chunk in reader:
+                issues.extend(_check_chunk(chunk, first_line=line + 1))
+                if len(issues) >= max_issues:
+                    return issues[:max_issues]
+                line += len(chunk)
+    except (OSError, ValueError, pd.errors.ParserError) as e:
+        # The tokenizer stops at the first badly broken row; keep its line number
+        match = re.search(r"line (\d+)", str(e))
+        issues.append(SchemaIssue(
+            int(match.group(1)) if match else None, None, f"Unparseable CSV: {str(e).strip()}"
+        ))
+    return issues
+
+
+def preflight_directory(directory, strict=False, pattern="**/*.csv"):
+    """Validate every CSV under a directory; returns {path: [SchemaIssue, ...]}.
+
+    Only files with problems appear in the result. The default header-only
+    pass reads a single line per file.
+    """
+    problems = {}
+    for path in sorted(Path(directory).glob(pattern)):
+        if any(part.startswith(".") for part in path.relative_to(directory).parts):
+            continue
+        issues = check_rows(path) if strict else check_header(path)
+        if issues:
+            logging.warning("%s failed validation: %s", path, issues[0].message)
+            problems[str(path)] = issues
+    return problems
+
+
+def _check_chunk(chunk, first_line):
+    """Vectorised per-column checks for one chunk of string-typed rows."""
+    import pandas as pd
+
+    lines = pd.RangeIndex(first_line, first_line + len(chunk))
+    names = chunk["Student Name"].str.strip()
+    scores = chunk["Score"].str.strip()
+    rubrics = chunk["Rubric"].str.strip()
+
+    numeric = pd.to_numeric(scores, errors="coerce")
+    bad_score = (scores != NOT_SUBMITTED) & ~(
+        scores.str.fullmatch(r"\d+") & numeric.between(0, MAX_SCORE)
+    )
+    # Every "|"-separated rubric part needs a "→" or ":" between criterion and level
+    rubric_parts = rubrics.str.count(r"\|") + 1
+    rubric_levels = rubrics.str.count("→") + rubrics.str.count(":")
+    bad_rubric = (rubrics != "") & (rubric_levels < rubric_parts)
+
+    checks = (
+        (None, chunk[_EXTRA_COLUMN] != "",
+         lambda row: f"Row has more than {len(EXPECTED_HEADERS)} fields"),
+        ("Student Name", names == "", lambda row: "Student name is empty"),
+        ("Score", bad_score, lambda row: (
+            f"Score {chunk['Score'].iat[row]!r} is not 0-{MAX_SCORE} or '{NOT_SUBMITTED}'"
+        )),
+        ("Rubric", bad_rubric,
+         lambda row: f"Rubric {chunk['Rubric'].iat[row]!r} is not 'Criterion: Level | ...'"),
+    )
+    issues = []
+    for column, failed, describe in checks:
+        for row in failed.to_numpy().nonzero()[0]:
+            issues.append(SchemaIssue(int(lines[row]), column, describe(row)))
+    issues.sort(key=lambda issue: issue.line)
+    return issues
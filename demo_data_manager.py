@@ -1,14 +1,307 @@
 # demo_data_manager.py
+import hashlib
+import json
 import logging
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import pandas as pd
+import numpy as np
+
+from dataset_schema import (
+    EXPECTED_HEADERS, NOT_SUBMITTED, SchemaIssue, check_header, check_rows,
+    preflight_directory,
+)
+
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+SIDECAR_DIRNAME = ".cache"
+SIDECAR_VERSION = 3
+SIDECAR_SUFFIX = ".feather"
+# Schema metadata key holding the source CSV stamp
+_SIDECAR_META_KEY = b"gradespark_sidecar"
+INDEX_FILENAME = "index.json"
+INDEX_VERSION = 1
+# Coarsest directory mtime resolution we expect (FAT); SMB and ext4 are finer
+DIR_MTIME_TICK_NS = 2 * 10**9
+DEFAULT_CHUNK_ROWS = 5000
+STREAMING_THRESHOLD_BYTES = 8 * 1024 * 1024
+_MISSING_TOKEN = np.frombuffer(f",{NOT_SUBMITTED},".encode("utf-8"), dtype=np.uint8)
+
+
+def _scan_score_bytes(data):
+    """(rows, 'Not submitted' rows) for an unquoted CSV with the expected header.
+
+    Returns None when quoting, blank lines or an unexpected header would make
+    a byte-level count unreliable.
+    """
+    header_end = data.find(b"\n")
+    if header_end < 0 or b'"' in data:
+        return None
+    try:
+        header = data[:header_end].rstrip(b"\r").decode("utf-8-sig")
+    except UnicodeDecodeError:
+        return None
+    if header != ",".join(EXPECTED_HEADERS):
+        return None
+    if header_end + 1 == len(data):
+        return 0, 0
+
+    raw = np.frombuffer(data, dtype=np.uint8, offset=header_end + 1)
+    newlines = np.flatnonzero(raw == ord("\n"))
+    starts = np.concatenate(([0], newlines + 1))
+    starts = starts[starts < len(raw)]
+    # Blank lines would be skipped by the CSV parser but counted here
+    line_lengths = np.diff(np.concatenate((starts, [len(raw)])))
+    if (line_lengths <= 1).any() or (raw[starts] == ord("\r")).any():
+        return None
+    commas = np.flatnonzero(raw == ord(","))
+    first = np.searchsorted(commas, starts)
+    if first[-1] >= len(commas):
+        return None
+    first_comma = commas[first]
+    if (first_comma[:-1] >= starts[1:]).any():
+        return None
+    # Score is the second column, so it sits right after each line's first comma
+    window = first_comma[:, None] + np.arange(len(_MISSING_TOKEN))
+    hits = (raw[np.minimum(window, len(raw) - 1)] == _MISSING_TOKEN).all(axis=1)
+    return len(starts), int(hits.sum())
+
+
+def _file_hash(path):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _sidecar_stamp(dataset_path):
+    stat = Path(dataset_path).stat()
+    return {
+        "version": SIDECAR_VERSION,
+        "source_size": stat.st_size,
+        "source_mtime_ns": stat.st_mtime_ns,
+        "source_hash": _file_hash(dataset_path),
+    }
+
+
+def _stamp_matches(stamp, dataset_path):
+    """True if the sidecar stamp still describes the CSV.
+
+    A changed mtime alone falls back to comparing content hashes: one-file
+    app builds re-extract the demo data with fresh mtimes on every launch.
+    """
+    stat = Path(dataset_path).stat()
+    if stamp.get("version") != SIDECAR_VERSION or stamp.get("source_size") != stat.st_size:
+        return False
+    if stamp.get("source_mtime_ns") == stat.st_mtime_ns:
+        return True
+    return stamp.get("source_hash") == _file_hash(dataset_path)
+
+
+def load_sidecar(dataset_path, sidecar):
+    """Return the Feather sidecar's frame for a CSV, or None if missing or stale.
+
+    Sidecars are plain Arrow data, so reading one never runs code from the
+    (possibly shared) data directory. They need the optional pyarrow package.
+    """
+    sidecar = Path(sidecar)
+    if not sidecar.exists():
+        return None
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return None
+    try:
+        with pa.memory_map(str(sidecar)) as source:
+            reader = pa.ipc.open_file(source)
+            # The stamp sits in the schema, so a stale sidecar is rejected unread
+            metadata = reader.schema.metadata or {}
+            stamp = json.loads(metadata.get(_SIDECAR_META_KEY, b"{}"))
+            if not _stamp_matches(stamp, dataset_path):
+                return None
+            return reader.read_all().to_pandas()
+    except Exception as e:
+        logging.debug("Ignoring unreadable sidecar %s: %s", sidecar, e)
+        return None
+
+
+def write_sidecar(dataset_path, sidecar, df):
+    try:
+        import pyarrow as pa
+        import pyarrow.feather as feather
+    except ImportError:
+        return
+    sidecar = Path(sidecar)
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[_SIDECAR_META_KEY] = json.dumps(_sidecar_stamp(dataset_path)).encode()
+        sidecar.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = sidecar.with_suffix(SIDECAR_SUFFIX + ".tmp")
+        feather.write_feather(table.replace_schema_metadata(metadata), str(tmp_path))
+        tmp_path.replace(sidecar)
+        # Pickle sidecars from older versions are never read; drop them
+        sidecar.with_suffix(".pkl").unlink(missing_ok=True)
+    except Exception as e:
+        # Read-only installs (e.g. bundled apps) simply fall back to CSV.
+        logging.debug("Could not write sidecar for %s: %s", dataset_path, e)
+
+
+def read_dataset(dataset_path, sidecar=None):
+    """Parse one dataset CSV, via its sidecar when one is given and fresh.
+
+    Raises ValueError for a header that does not match EXPECTED_HEADERS.
+    After a CSV parse the sidecar is (re)written. Safe to call from worker
+    processes, which have no DemoDataManager of their own.
+    """
+    import pandas as pd
+    df = load_sidecar(dataset_path, sidecar) if sidecar is not None else None
+    if df is not None:
+        return df
+    # Reject a bad header from its first line instead of after a full parse
+    header_issues = check_header(dataset_path)
+    if header_issues:
+        raise ValueError(f"{dataset_path}: {header_issues[0].message}")
+    df = pd.read_csv(dataset_path)
+    if list(df.columns) != EXPECTED_HEADERS:
+        raise ValueError(f"CSV header mismatch in {dataset_path}. Expected: {EXPECTED_HEADERS}")
+    if sidecar is not None:
+        write_sidecar(dataset_path, sidecar, df)
+    return df
+
+
+class DatasetCache:
+    """LRU cache of parsed datasets, invalidated by file size and mtime."""
+
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.current_bytes = 0
+        self._entries = OrderedDict()
+
+    def get(self, path):
+        key = self._key(path)
+        entry = self._entries.get(str(path))
+        if entry is None or entry["key"] != key:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(str(path))
+        self.hits += 1
+        return entry["value"]
+
+    def put(self, path, value, nbytes):
+        key = self._key(path)
+        if key is None or nbytes > self.max_bytes:
+            return
+        self.discard(path)
+        self._entries[str(path)] = {"key": key, "value": value, "nbytes": nbytes}
+        self.current_bytes += nbytes
+        while self.current_bytes > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self.current_bytes -= evicted["nbytes"]
+
+    def discard(self, path):
+        entry = self._entries.pop(str(path), None)
+        if entry is not None:
+            self.current_bytes -= entry["nbytes"]
+
+    def clear(self):
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    @staticmethod
+    def _key(path):
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+
+class DatasetStream:
+    """Iterate dataset rows chunk by chunk, tallying submissions as it goes.
+
+    Only one chunk of the CSV is held in memory at a time. The submitted,
+    total and missing counts are complete once iteration has finished.
+    ``iter_chunks`` yields whole DataFrame chunks for vectorised grading;
+    iterating the stream itself yields row dicts.
+    ``fraction_read`` reports progress by bytes, so no row count is needed
+    up front.
+    """
+
+    def __init__(self, path, chunksize=DEFAULT_CHUNK_ROWS, total_hint=None):
+        self.path = Path(path)
+        self.chunksize = chunksize
+        self.total_hint = total_hint
+        self.size_bytes = self.path.stat().st_size
+        self.submitted = 0
+        self.total = 0
+        self._handle = None
+
+    @property
+    def missing(self):
+        return self.total - self.submitted
+
+    @property
+    def fraction_read(self):
+        """Share of the file the parser has consumed so far (0.0-1.0)."""
+        if self._handle is None or self._handle.closed:
+            return 1.0 if self.total else 0.0
+        return min(self._handle.tell() / max(self.size_bytes, 1), 1.0)
+
+    def iter_chunks(self):
+        """Yield the dataset as DataFrames of up to ``chunksize`` rows."""
+        import pandas as pd
+        self.submitted = 0
+        self.total = 0
+        header_issues = check_header(self.path)
+        if header_issues:
+            raise ValueError(f"{self.path}: {header_issues[0].message}")
+        # Parse from our own handle so its position tracks progress
+        with open(self.path, "rb") as handle:
+            self._handle = handle
+            with pd.read_csv(handle, chunksize=self.chunksize) as reader:
+                for chunk in reader:
+                    if list(chunk.columns) != EXPECTED_HEADERS:
+                        raise ValueError(
+                            f"CSV header mismatch in {self.path}. Expected: {EXPECTED_HEADERS}"
+                        )
+                    self.total += len(chunk)
+                    self.submitted += int((chunk["Score"] != NOT_SUBMITTED).sum())
+                    yield chunk
+
+    def __iter__(self):
+        for chunk in self.iter_chunks():
+            yield from chunk.to_dict("records")
 
 
 class DemoDataManager:
-    def __init__(self, data_dir="demo_data"):
+    def __init__(self, data_dir="demo_data", cache_bytes=DEFAULT_CACHE_BYTES,
+                 sidecar_dir=None, use_sidecars=True, persist_index=True):
         self.data_dir = Path(data_dir)
-        self.structure = self._build_structure()
+        self.cache = DatasetCache(max_bytes=cache_bytes)
+        self.sidecar_dir = Path(sidecar_dir) if sidecar_dir else self.data_dir / SIDECAR_DIRNAME
+        self.use_sidecars = use_sidecars
+        self.persist_index = persist_index
+        self._index_dirty = False
+        self._content_hashes = {}
+        self._rubric_matrices = {}
+        self._summaries = {}
+        self.structure = {}
+        self._build_structure()
 
     def get_grades(self):
         return sorted(self.structure.keys())
@@ -19,6 +312,32 @@ class DemoDataManager:
     def get_assignments(self, grade, subject):
         return sorted(self.structure.get(grade, {}).get(subject, []))
 
+    def list_datasets(self, grade=None, subject=None):
+        """Return (grade, subject, assignment) tuples, optionally filtered."""
+        datasets = []
+        for grade_name in self.get_grades():
+            if grade and grade_name != grade:
+                continue
+            for subject_name in self.get_subjects(grade_name):
+                if subject and subject_name != subject:
+                    continue
+                for assignment in self.get_assignments(grade_name, subject_name):
+                    datasets.append((grade_name, subject_name, assignment))
+        return datasets
+
+    def dataset_files(self, grade=None, subject=None):
+        """Return ((grade, subject, assignment), path) pairs for datasets on disk.
+
+        A plain list, so it can be handed to a worker thread while the
+        structure keeps changing on the UI thread.
+        """
+        files = []
+        for key in self.list_datasets(grade=grade, subject=subject):
+            path = self._dataset_path(*key)
+            if path and path.exists():
+                files.append((key, str(path)))
+        return files
+
     def check_data_exists(self):
         return self.data_dir.exists() and bool(self.structure)
 
@@ -35,63 +354,404 @@ class DemoDataManager:
             logging.error("Demo CSV not found at path: %s", dataset_path)
             return None, 0, 0, 0
 
-        expected_headers = ["Student Name", "Score", "Feedback", "Rubric"]
+        # Cached frames are shared between callers; treat them as read-only.
+        cached = self.cache.get(dataset_path)
+        if cached is not None:
+            return cached
 
         try:
-            df = pd.read_csv(dataset_path)
-            if list(df.columns) != expected_headers:
-                logging.error(
-                    "CSV header mismatch in %s. Expected: %s",
-                    dataset_path,
-                    expected_headers
-                )
-                return None, 0, 0, 0
-
+            df = read_dataset(dataset_path, self.sidecar_path(dataset_path))
             total = len(df)
-            submitted_count = df[df["Score"] != "Not submitted"].shape[0]
+            submitted_count = int((df["Score"] != NOT_SUBMITTED).sum())
             missing_count = total - submitted_count
 
-            return df, submitted_count, total, missing_count
+            self._record_row_count(dataset_path, total)
+
+            loaded = (df, submitted_count, total, missing_count)
+            self.cache.put(dataset_path, loaded, int(df.memory_usage(deep=True).sum()))
+            return loaded
 
         except Exception as e:
             logging.error("Failed to load or parse CSV %s: %s", dataset_path, e)
             return None, 0, 0, 0
 
+    def validate_dataset(self, grade, subject, assignment, strict=False):
+        """SchemaIssues for one dataset: header only, or every row when strict."""
+        dataset_path = self._dataset_path(grade, subject, assignment)
+        if not dataset_path or not dataset_path.exists():
+            return [SchemaIssue(None, None, "File not found")]
+        return check_rows(dataset_path) if strict else check_header(dataset_path)
+
+    def preflight(self, strict=False):
+        """Validate every CSV under the data directory; {path: issues} for failures."""
+        return preflight_directory(self.data_dir, strict=strict)
+
+    def should_stream(self, grade, subject, assignment):
+        """Large rosters are streamed rather than loaded whole."""
+        dataset_path = self._dataset_path(grade, subject, assignment)
+        try:
+            return dataset_path.stat().st_size >= STREAMING_THRESHOLD_BYTES
+        except (AttributeError, OSError):
+            return False
+
+    def open_stream(self, grade, subject, assignment, chunksize=DEFAULT_CHUNK_ROWS):
+        dataset_path = self._dataset_path(grade, subject, assignment)
+        if not dataset_path or not dataset_path.exists():
+            logging.error("Demo CSV not found at path: %s", dataset_path)
+            return None
+
+        # Only a row count the index already knows; unknown files report by bytes
+        total_hint = self.get_row_count(grade, subject, assignment)
+        return DatasetStream(dataset_path, chunksize=chunksize, total_hint=total_hint)
+
     def get_dataset_summary(self, grade, subject, assignment):
-        df, submitted, total, missing = self.load_csv(grade, subject, assignment)
+        return self.get_dataset_summaries([(grade, subject, assignment)]).get(
+            (grade, subject, assignment)
+        )
+
+    def get_dataset_summaries(self, datasets=None, max_workers=1):
+        """Submitted/total/missing counts for many datasets in one call.
+
+        Only the Score column is read, and a summary is reused until its file's
+        size or mtime changes. Datasets that cannot be read are left out.
+        Pass max_workers > 1 (or None for the executor default) to read the
+        files on a thread pool.
+        """
+        if datasets is None:
+            datasets = self.list_datasets()
+        summaries, pending = {}, []
+        for key in datasets:
+            dataset_path = self._dataset_path(*key)
+            try:
+                stat = dataset_path.stat()
+            except (AttributeError, OSError):
+                continue
+            stamp = (stat.st_size, stat.st_mtime_ns)
+            known = self._summaries.get(str(dataset_path))
+            if known and known[0] == stamp:
+                summaries[key] = known[1]
+            else:
+                pending.append((key, dataset_path, stamp))
+
+        if max_workers == 1 or len(pending) < 2:
+            scanned = [self._scan_summary(dataset_path) for _, dataset_path, _ in pending]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                scanned = list(pool.map(self._scan_summary, [job[1] for job in pending]))
+
+        for (key, dataset_path, stamp), summary in zip(pending, scanned):
+            if summary is None:
+                continue
+            self._summaries[str(dataset_path)] = (stamp, summary)
+            summaries[key] = summary
+            self._record_row_count(dataset_path, summary["total"])
+        self.flush_index()
+        return summaries
+
+    def get_rubric_matrix(self, grade, subject, assignment):
+        """Parsed Rubric column for a dataset, reparsed only when the file changes."""
+        from rubric_matrix import RubricMatrix
+        dataset_path = self._dataset_path(grade, subject, assignment)
+        try:
+            stat = dataset_path.stat()
+        except (AttributeError, OSError):
+            return None
+        known = self._rubric_matrices.get(str(dataset_path))
+        if known and known[:2] == (stat.st_size, stat.st_mtime_ns):
+            return known[2]
+
+        df, _, _, _ = self.load_csv(grade, subject, assignment)
         if df is None:
             return None
-        return {"submitted": submitted, "total": total, "missing": missing}
+        matrix = RubricMatrix.from_column(df["Rubric"])
+        self._rubric_matrices[str(dataset_path)] = (stat.st_size, stat.st_mtime_ns, matrix)
+        return matrix
+
+    def content_hash(self, grade, subject, assignment):
+        """Hash of the dataset's bytes, recomputed only when size or mtime change."""
+        dataset_path = self._dataset_path(grade, subject, assignment)
+        try:
+            stat = dataset_path.stat()
+        except (AttributeError, OSError):
+            return None
+        known = self._content_hashes.get(str(dataset_path))
+        if known and known[:2] == (stat.st_size, stat.st_mtime_ns):
+            return known[2]
+
+        content_hash = _file_hash(dataset_path)
+        self._content_hashes[str(dataset_path)] = (stat.st_size, stat.st_mtime_ns, content_hash)
+        return content_hash
+
+    def get_row_count(self, grade, subject, assignment):
+        """Return the indexed row count, or None if it is unknown or stale."""
+        entry = self._index["files"].get(f"{grade}/{subject}/{assignment}.csv")
+        if not entry or entry.get("rows") is None:
+            return None
+        try:
+            mtime_ns = self._dataset_path(grade, subject, assignment).stat().st_mtime_ns
+        except OSError:
+            return None
+        return entry["rows"] if entry.get("mtime_ns") == mtime_ns else None
+
+    def watched_directories(self):
+        """Return every indexed directory, including subject folders with no CSVs yet."""
+        return [
+            str(self.data_dir / rel) if rel else str(self.data_dir)
+            for rel in self._index["dirs"]
+        ]
+
+    def cache_stats(self):
+        """Return hit/miss counters and occupancy of the parsed-dataset cache."""
+        return self.cache.stats()
 
     # --- Internal helpers ---
     def _build_structure(self):
+        """Seed the structure from the persisted index, then rescan deltas."""
+        self._index = self._load_index()
         structure = {}
+        for entry in self._index["files"].values():
+            self._add_to_structure(structure, entry["grade"], entry["subject"], entry["assignment"])
+        self.structure = structure
+
         if not self.data_dir.exists():
             logging.warning("Demo data directory not found at %s", self.data_dir)
-            return structure
+            self.structure.clear()
+            return self.structure
 
-        for grade_dir in sorted(self.data_dir.iterdir(), key=lambda p: p.name):
-            if not grade_dir.is_dir() or grade_dir.name.startswith('.'):
+        self.refresh()
+        return self.structure
+
+    @staticmethod
+    def _add_to_structure(structure, grade, subject, assignment):
+        assignments = structure.setdefault(grade, {}).setdefault(subject, [])
+        if assignment not in assignments:
+            assignments.append(assignment)
+            assignments.sort()
+
+    @staticmethod
+    def _remove_from_structure(structure, grade, subject, assignment):
+        subjects = structure.get(grade, {})
+        assignments = subjects.get(subject, [])
+        if assignment in assignments:
+            assignments.remove(assignment)
+        if subject in subjects and not assignments:
+            del subjects[subject]
+        if grade in structure and not subjects:
+            del structure[grade]
+
+    def _scan_children(self, directory):
+        return sorted(
+            child.name
+            for child in directory.iterdir()
+            if child.is_dir() and not child.name.startswith('.')
+        )
+
+    @staticmethod
+    def _list_csv_names(directory):
+        """CSV file names in a directory, from one listing and no per-file stat."""
+        with os.scandir(directory) as entries:
+            return {
+                entry.name for entry in entries
+                if entry.name.endswith(".csv") and entry.is_file()
+            }
+
+    def _rescan_subject(self, grade, subject, subject_dir, names, known_keys, seen):
+        """Apply one subject directory's CSV listing and return (added, removed) entries."""
+        index_files = self._index["files"]
+        prefix = f"{grade}/{subject}/"
+        before = set(known_keys)
+        added = []
+        for name in sorted(names):
+            key = prefix + name
+            seen.add(key)
+            if key in before:
+                before.discard(key)
                 continue
+            csv_file = subject_dir / name
+            index_files[key] = {
+                "grade": grade,
+                "subject": subject,
+                "assignment": csv_file.stem,
+                "mtime_ns": csv_file.stat().st_mtime_ns,
+                "rows": None,
+            }
+            added.append((grade, subject, csv_file.stem))
+        removed = []
+        for key in before:
+            entry = index_files.pop(key)
+            removed.append((entry["grade"], entry["subject"], entry["assignment"]))
+        return added, removed
 
-            subjects = {}
-            for subject_dir in sorted(grade_dir.iterdir(), key=lambda p: p.name):
-                if not subject_dir.is_dir() or subject_dir.name.startswith('.'):
-                    continue
+    def refresh(self):
+        """Apply on-disk changes to the structure and return the added/removed
+        (grade, subject, assignment) tuples.
+
+        A subject directory is listed only when its mtime differs from the
+        index, or when that mtime is within one timestamp tick of the last
+        scan: a file created in the same tick can leave the mtime unchanged
+        on coarse filesystems (FAT, SMB shares), so such a directory stays
+        suspect until a scan starts a full tick after its mtime. A CSV is
+        stat'ed just when it first appears."""
+        added, removed = [], []
+        if not self.data_dir.exists():
+            return {"added": added, "removed": removed}
 
-                assignments = sorted(
-                    csv_file.stem
-                    for csv_file in subject_dir.glob("*.csv")
-                    if csv_file.is_file()
+        scan_started_ns = time.time_ns()
+        # mtimes at or past this may hide a change made after the last listing
+        settled_before_ns = self._index.get("scanned_ns", 0) - DIR_MTIME_TICK_NS
+        dirs = self._index["dirs"]
+        files = self._index["files"]
+        keys_by_subject = {}
+        for key, entry in files.items():
+            keys_by_subject.setdefault((entry["grade"], entry["subject"]), []).append(key)
+        live_dirs = {"": self.data_dir.stat().st_mtime_ns}
+        seen = set()
+
+        for grade in self._scan_children(self.data_dir):
+            grade_dir = self.data_dir / grade
+            try:
+                live_dirs[grade] = grade_dir.stat().st_mtime_ns
+                subjects = self._scan_children(grade_dir)
+            except OSError:
+                continue
+
+            for subject in subjects:
+                subject_dir = grade_dir / subject
+                rel = f"{grade}/{subject}"
+                known_keys = keys_by_subject.get((grade, subject), [])
+                try:
+                    mtime_ns = live_dirs[rel] = subject_dir.stat().st_mtime_ns
+                    if dirs.get(rel) == mtime_ns and mtime_ns < settled_before_ns:
+                        seen.update(known_keys)
+                        continue
+                    names = self._list_csv_names(subject_dir)
+                except OSError:
+                    continue
+                prefix = rel + "/"
+                if names == {key[len(prefix):] for key in known_keys}:
+                    seen.update(known_keys)
+                    continue
+                subject_added, subject_removed = self._rescan_subject(
+                    grade, subject, subject_dir, names, known_keys, seen
                 )
+                added.extend(subject_added)
+                removed.extend(subject_removed)
+
+        # Anything not visited lives under a grade or subject that disappeared.
+        for key in [key for key in files if key not in seen]:
+            entry = files.pop(key)
+            removed.append((entry["grade"], entry["subject"], entry["assignment"]))
 
-                if assignments:
-                    subjects[subject_dir.name] = assignments
+        for grade, subject, assignment in removed:
+            self._remove_from_structure(self.structure, grade, subject, assignment)
+            dataset_path = str(self._dataset_path(grade, subject, assignment))
+            self._rubric_matrices.pop(dataset_path, None)
+            self._summaries.pop(dataset_path, None)
+        for grade, subject, assignment in added:
+            self._add_to_structure(self.structure, grade, subject, assignment)
 
-            if subjects:
-                structure[grade_dir.name] = subjects
+        if added or removed or live_dirs != dirs:
+            self._index_dirty = True
+        self._index["dirs"] = live_dirs
+        # Not a reason to write on its own: an older scan time on disk only
+        # means the next launch lists a few more directories
+        self._index["scanned_ns"] = scan_started_ns
+        # Row counts recorded by load_csv since the last refresh go out here too
+        self.flush_index()
+        return {"added": added, "removed": removed}
 
-        return structure
+    def _index_path(self):
+        return self.sidecar_dir / INDEX_FILENAME
+
+    def _load_index(self):
+        empty = {"version": INDEX_VERSION, "dirs": {}, "files": {}}
+        if not self.persist_index:
+            return empty
+        index_path = self._index_path()
+        if not index_path.exists():
+            return empty
+        try:
+            with index_path.open("r", encoding="utf-8") as handle:
+                index = json.load(handle)
+            if index.get("version") != INDEX_VERSION:
+                return empty
+            return index
+        except Exception as e:
+            logging.debug("Ignoring unreadable dataset index %s: %s", index_path, e)
+            return empty
+
+    def flush_index(self):
+        """Write index.json if row counts or the structure changed since the last write."""
+        if self._index_dirty:
+            self._save_index()
+
+    def _save_index(self):
+        self._index_dirty = False
+        if not self.persist_index:
+            return
+        index_path = self._index_path()
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = index_path.with_suffix(".json.tmp")
+            with tmp_path.open("w", encoding="utf-8") as handle:
+                json.dump(self._index, handle)
+            tmp_path.replace(index_path)
+        except Exception as e:
+            logging.debug("Could not write dataset index %s: %s", index_path, e)
+
+    def _record_row_count(self, dataset_path, rows):
+        """Store a row count in the index; it is written on the next flush_index()."""
+        try:
+            key = Path(dataset_path).relative_to(self.data_dir).as_posix()
+        except ValueError:
+            return False
+        entry = self._index["files"].get(key)
+        if entry is None:
+            return False
+        mtime_ns = Path(dataset_path).stat().st_mtime_ns
+        if entry.get("rows") == rows and entry.get("mtime_ns") == mtime_ns:
+            return False
+        entry["rows"] = rows
+        entry["mtime_ns"] = mtime_ns
+        self._index_dirty = True
+        return True
+
+    @staticmethod
+    def _scan_summary(dataset_path):
+        """Count rows and 'Not submitted' scores without building a DataFrame.
+
+        Plain unquoted files are counted straight from their bytes; anything
+        the byte scan cannot vouch for falls back to parsing only Score.
+        """
+        try:
+            counts = _scan_score_bytes(Path(dataset_path).read_bytes())
+        except Exception as e:
+            logging.debug("Byte scan failed for %s: %s", dataset_path, e)
+            counts = None
+        if counts is None:
+            try:
+                import pandas as pd
+                # Only Score is counted, so stray bytes in other text columns don't matter
+                scores = pd.read_csv(
+                    dataset_path, usecols=["Score"], dtype={"Score": str},
+                    encoding_errors="replace",
+                )["Score"]
+                counts = (len(scores), int((scores == NOT_SUBMITTED).sum()))
+            except Exception as e:
+                logging.error("Failed to summarise CSV %s: %s", dataset_path, e)
+                return None
+        total, missing = counts
+        return {"submitted": total - missing, "total": total, "missing": missing}
+
+    def sidecar_path(self, dataset_path):
+        """Where the dataset's sidecar lives, or None when sidecars are off."""
+        if not self.use_sidecars:
+            return None
+        try:
+            relative = Path(dataset_path).relative_to(self.data_dir)
+        except ValueError:
+            return None
+        return self.sidecar_dir / relative.with_suffix(SIDECAR_SUFFIX)
 
     def _dataset_path(self, grade, subject, assignment):
         if not all([grade, subject, assignment]):
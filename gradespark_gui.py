@@ -1,26 +1,25 @@
 # gradespark_gui.py - Public/Community Version
 import sys
 import os
+import math
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import logging
-import json
-import threading
-from datetime import datetime
 from pathlib import Path
-import pandas as pd
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QTabWidget, QVBoxLayout, QHBoxLayout, QWidget,
-    QLabel, QComboBox, QPushButton, QTableWidget, QTableWidgetItem, QMessageBox,
+    QLabel, QComboBox, QPushButton, QTableView, QMessageBox,
     QStatusBar, QCheckBox, QLineEdit, QGroupBox, QDialog,
-    QFileDialog, QHeaderView, QDesktopWidget, QFrame, QProgressBar, QFormLayout, QGridLayout
+    QFileDialog, QHeaderView, QDesktopWidget, QFrame, QProgressBar, QGridLayout,
+    QProgressDialog, QTableWidget, QTableWidgetItem, QStyledItemDelegate, QToolTip
 )
 from PyQt5.QtCore import (
-    Qt, QTimer, pyqtSignal, QUrl, QObject, QThread, QStandardPaths, QByteArray
+    Qt, QTimer, pyqtSignal, QUrl, QObject, QThread, QStandardPaths, QByteArray,
+    QFileSystemWatcher, QEvent
 )
-from PyQt5.QtGui import QBrush, QColor, QDesktopServices, QIcon
+from PyQt5.QtGui import QColor, QDesktopServices, QIcon, QPalette
 
-# For lead capture
-import urllib.request
-import platform
 
 # CRITICAL FIX FOR PYINSTALLER
 def resource_path(relative_path):
@@ -33,26 +32,116 @@ try:
 except ImportError:
     pass
 
+from grading_engine import (
+    FEEDBACK_TEMPLATES, RUBRIC_TEMPLATES, SIMULATED_SCORE_RANGE, dataset_key, dataset_seed,
+    grade_dataset, new_run_seed, score_band, simulate_frame, student_score
+)
+
+# Partial results are flushed to the UI after this many rows or seconds
+PARTIAL_RESULTS_ROWS = 2000
+PARTIAL_RESULTS_INTERVAL = 0.1
+
+
+# --- Progress throttling ---
+class ProgressThrottle:
+    """Coalesce progress updates by elapsed time and percent change.
+
+    Cross-thread signals are queued on the UI thread, so emitting once per
+    row floods the event loop on large rosters. 100% is always delivered.
+    """
+
+    def __init__(self, emit, max_hz=30, min_step=1):
+        self.emit = emit
+        self.min_interval = 1.0 / max_hz if max_hz else 0.0
+        self.min_step = max(min_step, 1)
+        self.emitted = 0
+        self._last_pct = None
+        self._last_time = 0.0
+
+    def update(self, pct, message):
+        if pct >= 100:
+            self.finish(message)
+            return
+        if self._last_pct is not None and pct - self._last_pct < self.min_step:
+            return
+        now = time.monotonic()
+        if now - self._last_time < self.min_interval:
+            return
+        self._send(pct, message, now)
+
+    def finish(self, message):
+        if self._last_pct != 100:
+            self._send(100, message, time.monotonic())
+
+    def _send(self, pct, message, now):
+        self._last_pct = pct
+        self._last_time = now
+        self.emitted += 1
+        self.emit(pct, message)
+
+
 # --- Background Worker for Demo Grading ---
 class Worker(QObject):
-    finished = pyqtSignal(list)
+    # object signals hand the Python list across threads without a QVariant copy
+    finished = pyqtSignal(object)
+    partial = pyqtSignal(object)
     progress = pyqtSignal(int, str)
+    error = pyqtSignal(str)
 
-    def __init__(self, assignments, subject, grade_level):
+    def __init__(self, assignments, subject, grade_level, total=None,
+                 progress_hz=30, progress_step=1, seed=None, per_student_seed=False,
+                 dataset="", keep_results=True):
         super().__init__()
+        # assignments may be a DataFrame, a DatasetStream graded chunk by chunk, or row dicts
         self.assignments = assignments
         self.subject = subject
         self.grade_level = grade_level
+        self.total = total
+        # A fixed seed makes runs over the same dataset reproducible
+        self.seed = seed
+        self.per_student_seed = per_student_seed
+        self.dataset = dataset
+        # Off when the receiver keeps the partial results; finished then carries None
+        self.keep_results = keep_results
+        self.progress_throttle = ProgressThrottle(
+            self.progress.emit, max_hz=progress_hz, min_step=progress_step
+        )
 
     def run(self):
-        results = self._simulate_grading(self.assignments, self.subject, self.grade_level)
+        import pandas as pd
+        try:
+            if isinstance(self.assignments, pd.DataFrame):
+                results = self._simulate_grading_batch(
+                    self.assignments, self.subject, self.grade_level
+                )
+            elif hasattr(self.assignments, "iter_chunks"):
+                results = self._simulate_grading_stream(
+                    self.assignments, self.subject, self.grade_level
+                )
+            else:
+                results = self._simulate_grading(self.assignments, self.subject, self.grade_level)
+        except Exception as e:  # noqa: BLE001 - surface stream/parse failures to the UI
+            logging.error("Demo grading failed: %s", e)
+            self.error.emit(str(e))
+            return
         self.finished.emit(results)
     
     def _simulate_grading(self, assignments, subject, grade_level):
         """Simulate grading for demo mode"""
         import random
+        from grading_results import GradingResults
+        rng = random.Random(self.seed)
+        # Row dicts only live until the next flush; finished rows are kept typed
         results = []
-        total = len(assignments)
+        parts = []
+        total = max(self.total if self.total is not None else len(assignments), 1)
+        last_flush = time.monotonic()
+
+        def flush(rows):
+            part = GradingResults.from_records(rows)
+            if self.keep_results:
+                parts.append(part)
+            self.partial.emit(part)
         
         for idx, assignment in enumerate(assignments):
             student_name = assignment.get('Student Name', 'Unknown')
@@ -67,7 +156,10 @@ class Worker(QObject):
                 })
             else:
                 # Generate simulated score
-                base_score = random.randint(70, 95)
+                if self.per_student_seed:
+                    base_score = student_score(self.seed, self.dataset, student_name)
+                else:
+                    base_score = rng.randint(*SIMULATED_SCORE_RANGE)
                 
                 # Generate grade-appropriate feedback
                 feedback = self._generate_feedback(base_score, subject, grade_level)
@@ -82,348 +174,244 @@ class Worker(QObject):
                     'Rubric': rubric
                 })
             
+            # Stream finished rows to the view in batches
+            if len(results) >= PARTIAL_RESULTS_ROWS or (
+                time.monotonic() - last_flush >= PARTIAL_RESULTS_INTERVAL
+            ):
+                flush(results)
+                results = []
+                last_flush = time.monotonic()
+
             # Emit progress
-            progress_pct = int((idx + 1) / total * 100)
-            self.progress.emit(progress_pct, f"Grading {student_name}...")
+            progress_pct = min(int((idx + 1) / total * 100), 100)
+            self.progress_throttle.update(progress_pct, f"Grading {student_name}...")
         
+        if results:
+            flush(results)
+        self.progress_throttle.finish("Grading complete")
+        return GradingResults.concat(parts) if self.keep_results else None
+
+    def _simulate_grading_batch(self, df, subject, grade_level):
+        """Vectorised equivalent of _simulate_grading for a whole DataFrame."""
+        results = simulate_frame(
+            df, subject, grade_level, seed=self.seed, per_student=self.per_student_seed,
+            key=self.dataset, progress=self.progress_throttle.update,
+            on_block=self.partial.emit
+        )
+        self.progress_throttle.finish("Grading complete")
         return results
     
+    def _simulate_grading_stream(self, stream, subject, grade_level):
+        """Vectorised grading of a DatasetStream, one parsed chunk at a time."""
+        import numpy as np
+        from grading_results import GradingResults
+        # One generator across chunks, so the run is reproducible from its seed
+        rng = np.random.default_rng(self.seed)
+        parts = []
+        graded = 0
+        for chunk in stream.iter_chunks():
+            part = simulate_frame(
+                chunk, subject, grade_level, seed=self.seed, per_student=self.per_student_seed,
+                key=self.dataset, rng=rng
+            )
+            if not len(part):
+                continue
+            if self.keep_results:
+                parts.append(part)
+            self.partial.emit(part)
+            graded += len(part)
+            # Without an indexed row count, progress follows the bytes parsed
+            done = stream.fraction_read if self.total is None else graded / max(self.total, 1)
+            self.progress_throttle.update(min(int(done * 100), 100), f"Grading {part.names[-1]}...")
+        self.progress_throttle.finish("Grading complete")
+        return GradingResults.concat(parts) if self.keep_results else None
+
     def _generate_feedback(self, score, subject, grade_level):
         """Generate appropriate feedback based on score and subject"""
-        if score >= 90:
-            feedback = f"Excellent work! Strong understanding of {subject} concepts at grade {grade_level} level."
-        elif score >= 80:
-            feedback = f"Good effort! Solid grasp of key {subject} concepts with room for deeper analysis."
-        elif score >= 70:
-            feedback = f"Satisfactory work. Review core {subject} concepts and practice application."
-        else:
-            feedback = f"Needs improvement. Schedule extra help to strengthen {subject} fundamentals."
-        
-        return feedback
+        template = FEEDBACK_TEMPLATES[score_band(score)]
+        return template.format(subject=subject, grade_level=grade_level)
     
     def _generate_rubric(self, score, subject):
         """Generate rubric scores based on overall score"""
-        if score >= 90:
-            return "Content: Excellent | Analysis: Excellent | Presentation: Good"
-        elif score >= 80:
-            return "Content: Good | Analysis: Good | Presentation: Satisfactory"
-        elif score >= 70:
-            return "Content: Satisfactory | Analysis: Needs Work | Presentation: Satisfactory"
-        else:
-            return "Content: Needs Work | Analysis: Needs Work | Presentation: Needs Work"
+        return RUBRIC_TEMPLATES[score_band(score)]
 
-# --- Settings Management ---
-from settings_store import SettingsStore
-
-# --- Demo Data Manager ---
-from demo_data_manager import DemoDataManager
-
-# --- Lead Capture Dialog ---
-class LeadCaptureDialog(QDialog):
-    def __init__(self, parent=None, feature_name="Premium Feature"):
-        super().__init__(parent)
-        self.feature_name = feature_name
-        self.webhook_url = os.environ.get(
-            "GRADESPARK_LEAD_WEBHOOK",
-            "https://hook.us2.make.com/3tsoiux2mb2pvmd9jh74mf45yfmvljlu"
-        )
-        self.setWindowTitle(f"{feature_name} - Full Version Only")
-        self.setModal(True)
-        self.setMinimumWidth(700)
-        self.setMinimumHeight(600)
-        self.init_ui()
-
-    def init_ui(self):
-        layout = QVBoxLayout(self)
-        layout.setAlignment(Qt.AlignCenter)
-
-        container = QFrame()
-        container.setObjectName("leadCaptureContainer")
-        container.setMaximumWidth(600)
-        container_layout = QVBoxLayout(container)
-
-        is_dark_mode = False
-        if hasattr(self.parent(), "settings"):
-            is_dark_mode = self.parent().settings.get("dark_mode_enabled", False)
-
-        lock_icon = QLabel("🔒")
-        lock_icon.setAlignment(Qt.AlignCenter)
-        lock_icon.setStyleSheet("font-size: 64px;")
-        container_layout.addWidget(lock_icon)
-
-        if "Google Classroom" in self.feature_name:
-            title_text = "Google Classroom Integration"
-            subtitle_text = "Full Version Only"
-        else:
-            title_text = self.feature_name
-            subtitle_text = "Full Version Only"
-
-        title = QLabel(title_text)
-        title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet("font-size: 22px; font-weight: bold; color: #1e66ff;")
-        container_layout.addWidget(title)
-
-        subtitle = QLabel(subtitle_text)
-        subtitle.setAlignment(Qt.AlignCenter)
-        subtitle.setStyleSheet("font-size: 18px; font-weight: 600; color: #666;")
-        container_layout.addWidget(subtitle)
-
-        desc = QLabel(
-            "This feature is available in the full version of GradeSpark.\n"
-            "Be among the first teachers to revolutionize your grading workflow!"
-        )
-        desc.setAlignment(Qt.AlignCenter)
-        desc.setWordWrap(True)
-        desc.setStyleSheet(
-            "font-size: 16px; "
-            + ("color: #B0B0B0; margin: 20px 0;" if is_dark_mode else "color: #666; margin: 20px 0;")
-        )
-        container_layout.addWidget(desc)
-
-        if is_dark_mode:
-            container.setStyleSheet(
-                """
-                QFrame#leadCaptureContainer {
-                    background-color: rgba(40, 40, 45, 0.95);
-                    border-radius: 12px;
-                    padding: 40px;
-                }
-                QFrame#leadCaptureContainer QLabel {
-                    color: #E0E0E0;
-                }
-                QLineEdit, QComboBox {
-                    background-color: #2C2C30;
-                    color: #E0E0E0;
-                    border: 1px solid #444;
-                    padding: 8px;
-                    border-radius: 4px;
-                }
-                QLineEdit:focus, QComboBox:focus {
-                    border: 1px solid #1e66ff;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                    width: 20px;
-                }
-                QComboBox::down-arrow {
-                    image: url(:/assets/chevron-down-dark.svg);
-                    width: 12px;
-                    height: 12px;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: #2C2C30;
-                    color: #E0E0E0;
-                    selection-background-color: #1e66ff;
-                    selection-color: white;
-                    border: 1px solid #444;
-                }
-            """
-            )
-        else:
-            container.setStyleSheet(
-                """
-                QFrame#leadCaptureContainer {
-                    background-color: rgba(255, 255, 255, 0.95);
-                    border-radius: 12px;
-                    padding: 40px;
-                }
-                QLineEdit, QComboBox {
-                    background-color: white;
-                    color: #333333;
-                    border: 1px solid #DDD;
-                    padding: 8px;
-                    border-radius: 4px;
-                }
-                QLineEdit:focus, QComboBox:focus {
-                    border: 1px solid #1e66ff;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                    width: 20px;
-                }
-                QComboBox::down-arrow {
-                    image: url(:/assets/chevron-down.svg);
-                    width: 12px;
-                    height: 12px;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: white;
-                    color: #333333;
-                    selection-background-color: #1e66ff;
-                    selection-color: white;
-                    border: 1px solid #DDD;
-                }
-            """
-            )
+# --- Background Worker for Batch Grading ---
+class BatchWorker(QObject):
+    """Grade many datasets on a process pool, reporting each one as it lands."""
+    dataset_finished = pyqtSignal(object, object)
+    dataset_failed = pyqtSignal(object, str)
+    progress = pyqtSignal(int, str)
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
 
-        form_widget = QWidget()
-        form_layout = QFormLayout(form_widget)
-        form_layout.setSpacing(15)
-
-        label_style = "color: #666;" if not is_dark_mode else "color: #999;"
-
-        self.name_input = QLineEdit()
-        self.name_input.setPlaceholderText("John Doe")
-        name_label = QLabel("Name:")
-        name_label.setStyleSheet(label_style)
-        form_layout.addRow(name_label, self.name_input)
-
-        self.email_input = QLineEdit()
-        self.email_input.setPlaceholderText("teacher@school.edu")
-        email_label = QLabel("Email:")
-        email_label.setStyleSheet(label_style)
-        form_layout.addRow(email_label, self.email_input)
-
-        self.school_input = QLineEdit()
-        self.school_input.setPlaceholderText("Lincoln Middle School")
-        school_label = QLabel("School/District:")
-        school_label.setStyleSheet(label_style)
-        form_layout.addRow(school_label, self.school_input)
-
-        self.role_combo = QComboBox()
-        self.role_combo.addItems(["I'm a Teacher", "I'm a School Administrator"])
-        role_label = QLabel("Role:")
-        role_label.setStyleSheet(label_style)
-        form_layout.addRow(role_label, self.role_combo)
-
-        self.size_combo = QComboBox()
-        self.size_combo.addItems([
-            "Just me (1 teacher)",
-            "Small team (2-5 teachers)",
-            "Department (6-20 teachers)",
-            "School-wide (20+ teachers)"
-        ])
-        size_label = QLabel("Team Size:")
-        size_label.setStyleSheet(label_style)
-        form_layout.addRow(size_label, self.size_combo)
-
-        self.timeline_combo = QComboBox()
-        self.timeline_combo.addItems([
-            "Ready now",
-            "This semester",
-            "Next school year",
-            "Just exploring"
-        ])
-        timeline_label = QLabel("Timeline:")
-        timeline_label.setStyleSheet(label_style)
-        form_layout.addRow(timeline_label, self.timeline_combo)
-
-        container_layout.addWidget(form_widget)
-
-        self.submit_btn = QPushButton("Get Early Access")
-        self.submit_btn.setObjectName("primaryButton")
-        self.submit_btn.clicked.connect(self.submit_lead)
-        container_layout.addWidget(self.submit_btn)
-
-        privacy = QLabel("We'll only use your email to send you updates about GradeSpark.")
-        privacy.setAlignment(Qt.AlignCenter)
-        privacy.setStyleSheet(
-            "font-size: 12px; "
-            + ("color: #888; margin-top: 10px;" if is_dark_mode else "color: #999; margin-top: 10px;")
-        )
-        container_layout.addWidget(privacy)
+    def __init__(self, jobs, base_seed, max_workers=None, per_student_seed=False):
+        super().__init__()
+        # jobs are (csv_path, sidecar_path, grade, subject, assignment) tuples
+        self.jobs = jobs
+        self.base_seed = base_seed
+        self.max_workers = max_workers or None
+        self.per_student_seed = per_student_seed
 
-        layout.addWidget(container)
+    def run(self):
+        results = {}
+        done = 0
+        try:
+            for key, rows, failure in self._iter_graded():
+                done += 1
+                grade, subject, assignment = key
+                if failure is not None:
+                    # A malformed file is skipped; the rest of the batch carries on
+                    logging.warning("Skipping dataset %s/%s/%s: %s", grade, subject, assignment, failure)
+                    self.dataset_failed.emit(key, failure)
+                    verb = "Skipped"
+                else:
+                    results[key] = rows
+                    self.dataset_finished.emit(key, rows)
+                    verb = "Graded"
+                self.progress.emit(
+                    int(done / len(self.jobs) * 100),
+                    f"{verb} {done}/{len(self.jobs)}: Grade {grade} {subject} - {assignment}"
+                )
+        except Exception as e:  # noqa: BLE001 - a crashed pool aborts the batch
+            logging.error("Batch grading failed: %s", e)
+            self.error.emit(str(e))
+            return
+        self.finished.emit(results)
 
-    def submit_lead(self):
-        """Validate input, queue background send, and thank the user"""
-        name = self.name_input.text().strip()
-        email = self.email_input.text().strip()
-        school = self.school_input.text().strip()
+    def _iter_graded(self):
+        seeded_jobs = [
+            (path, sidecar, grade, subject, assignment,
+             dataset_seed(self.base_seed, grade, subject, assignment), self.per_student_seed)
+            for path, sidecar, grade, subject, assignment in self.jobs
+        ]
+        if self.max_workers == 1:
+            for job in seeded_jobs:
+                yield grade_dataset(*job)
+            return
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [pool.submit(grade_dataset, *job) for job in seeded_jobs]
+            for future in as_completed(futures):
+                yield future.result()
+
+# --- Background Worker for Analytics ---
+def format_rollup_value(name, value, by):
+    """Text for one Grade Rollups cell; groups with no submissions show a dash."""
+    if name in by:
+        return str(value)
+    if name in ("Students", "Submitted"):
+        return str(int(value))
+    if math.isnan(value):
+        return "—"
+    if name == "Average":
+        return f"{value:.1f}"
+    return f"{value:.0%}"
+
+
+def describe_weakness(matrix):
+    """One line naming the weakest rubric criterion, or None if nothing is weak."""
+    weaknesses = matrix.weaknesses()
+    if not len(weaknesses) or weaknesses.iloc[0] <= 0:
+        return None
+    return (f"{weaknesses.index[0]} "
+            f"({weaknesses.iloc[0]:.0%} rated Developing or below)")
+
+
+class AnalyticsWorker(QObject):
+    """Refresh the analytics engine and build every rollup off the UI thread."""
+    # (engine, rollups); the engine is created here on first use, with pandas
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+    def __init__(self, demo_manager, datasets, engine=None):
+        super().__init__()
+        self.demo_manager = demo_manager
+        # (key, path) snapshot taken on the UI thread; the structure may change meanwhile
+        self.datasets = datasets
+        self.engine = engine
 
-        if not name or not email or not school:
-            QMessageBox.warning(
-                self,
-                "Incomplete Form",
-                "Please fill in all required fields (Name, Email, School)"
-            )
+    def run(self):
+        try:
+            from analytics_engine import ROLLUP_LEVELS, AnalyticsEngine
+
+            if self.engine is None:
+                self.engine = AnalyticsEngine(self.demo_manager)
+            reloaded = self.engine.refresh(self.datasets)
+            rollups = [
+                self.engine.rollup(ROLLUP_LEVELS[:depth]).reset_index()
+                for depth in range(1, len(ROLLUP_LEVELS) + 1)
+            ]
+        except Exception as e:  # noqa: BLE001 - reported in the UI
+            logging.error("Analytics refresh failed: %s", e)
+            self.error.emit(str(e))
             return
+        if reloaded:
+            logging.info("Analytics reloaded %s changed datasets", reloaded)
+        self.finished.emit((self.engine, rollups))
 
-        lead_payload = {
-            "name": name,
-            "email": email,
-            "school": school,
-            "role": self.role_combo.currentText(),
-            "size": self.size_combo.currentText(),
-            "timeline": self.timeline_combo.currentText(),
-            "feature": self.feature_name,
-            "timestamp": datetime.now().isoformat(),
-            "platform": platform.system()
-        }
-
-        self.send_to_webhook(lead_payload)
-        self._reset_form()
-
-        QMessageBox.information(
-            self,
-            "Thanks!",
-            f"Thanks {name}! We'll be in touch soon about early access to {self.feature_name}."
-        )
-        self.accept()
+# --- Settings Management ---
+from settings_store import WRITE_BEHIND_DELAY, SettingsStore
 
-    def _reset_form(self):
-        self.name_input.clear()
-        self.email_input.clear()
-        self.school_input.clear()
-        self.role_combo.setCurrentIndex(0)
-        self.size_combo.setCurrentIndex(0)
-        self.timeline_combo.setCurrentIndex(0)
+# --- Demo Data Manager ---
+from demo_data_manager import DemoDataManager
 
-    def send_to_webhook(self, payload):
-        """Send lead data asynchronously"""
+# --- Results Table Model ---
+from dataset_schema import BUCKET_MISSING, LEGEND_ENTRIES
+from results_model import RUBRIC_COLUMN, ResultsTableModel
 
-        def _post_lead(data):
-            try:
-                json_bytes = json.dumps(data).encode("utf-8")
-                request = urllib.request.Request(
-                    self.webhook_url,
-                    data=json_bytes,
-                    headers={"Content-Type": "application/json"}
-                )
+# --- Results Export ---
+from results_export import (
+    EXPORT_FILE_FILTER, ExportWorker, export_format_for, suffix_for_filter
+)
 
-                with urllib.request.urlopen(request, timeout=5) as response:
-                    if 200 <= response.status < 300:
-                        logging.info("Lead sent successfully: %s", data.get("email"))
-                        return
-                    logging.warning(
-                        "Lead webhook returned status %s for %s",
-                        response.status,
-                        data.get("email")
-                    )
-            except Exception as exc:  # noqa: BLE001 - log and fall back
-                logging.debug("Lead webhook failed: %s", exc)
-            self.save_lead_locally(data)
-
-        threading.Thread(target=_post_lead, args=(payload,), daemon=True).start()
-
-    def save_lead_locally(self, lead_data):
-        """Persist lead details in the user's application data folder."""
-        try:
-            target_dir = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
-            if not target_dir:
-                target_dir = str(Path.home() / ".gradespark")
+# --- Results Memoization ---
+from results_store import ResultsStore, make_results_key
 
-            storage_path = Path(target_dir)
-            storage_path.mkdir(parents=True, exist_ok=True)
+# --- Assignment Selector Badges ---
+ASSIGNMENT_BADGE_ROLE = Qt.UserRole + 1
 
-            leads_file = storage_path / "leads_backup.json"
-            existing_leads = []
 
-            if leads_file.exists():
-                try:
-                    with leads_file.open("r", encoding="utf-8") as handle:
-                        existing_leads = json.load(handle)
-                except json.JSONDecodeError:
-                    logging.warning("Failed to decode existing lead backup; starting fresh.")
+class AssignmentBadgeDelegate(QStyledItemDelegate):
+    """Draw a right-aligned summary badge (e.g. '13/15 in') beside each assignment.
 
-            existing_leads.append(lead_data)
+    tooltip_detail(index), if given, returns extra tooltip text for an item.
+    It is only called when a tooltip is shown, so it may do slow work.
+    """
 
-            with leads_file.open("w", encoding="utf-8") as handle:
-                json.dump(existing_leads, handle, indent=2)
+    BADGE_PADDING = 12
 
-            logging.info("Lead saved locally: %s", lead_data.get("email"))
-        except Exception as exc:  # noqa: BLE001 - capture unexpected filesystem issues
-            logging.error("Failed to save lead locally: %s", exc)
+    def __init__(self, parent=None, tooltip_detail=None):
+        super().__init__(parent)
+        self.tooltip_detail = tooltip_detail
+
+    def helpEvent(self, event, view, option, index):
+        if event.type() == QEvent.ToolTip and self.tooltip_detail is not None:
+            detail = self.tooltip_detail(index)
+            if detail:
+                summary = index.data(Qt.ToolTipRole)
+                QToolTip.showText(event.globalPos(),
+                                  f"{summary}\n{detail}" if summary else detail, view)
+                return True
+        return super().helpEvent(event, view, option, index)
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        badge = index.data(ASSIGNMENT_BADGE_ROLE)
+        if not badge:
+            return
+        painter.save()
+        painter.setPen(QColor("#6b7280"))
+        rect = option.rect.adjusted(0, 0, -self.BADGE_PADDING // 2, 0)
+        painter.drawText(rect, Qt.AlignRight | Qt.AlignVCenter, badge)
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        size = super().sizeHint(option, index)
+        badge = index.data(ASSIGNMENT_BADGE_ROLE)
+        if badge:
+            size.setWidth(
+                size.width() + option.fontMetrics.horizontalAdvance(badge) + self.BADGE_PADDING
+            )
+        return size
 
 
 class GuidedTourDialog(QDialog):
@@ -504,16 +492,84 @@ class GuidedTourDialog(QDialog):
         self.current_index += 1
         self.refresh_content()
 
+# --- Themes ---
+THEME_STYLESHEETS = {False: "styles.qss", True: "styles_dark.qss"}
+# Base colours live on the application palette rather than in the QSS, so
+# unstyled widgets and dialogs follow the theme without a stylesheet rule
+THEME_PALETTES = {
+    False: {
+        QPalette.Window: "#f6f7fb", QPalette.WindowText: "#1f2937",
+        QPalette.Base: "#ffffff", QPalette.AlternateBase: "#fafafa",
+        QPalette.Text: "#1f2937", QPalette.Button: "#ffffff",
+        QPalette.ButtonText: "#374151", QPalette.ToolTipBase: "#ffffff",
+        QPalette.ToolTipText: "#1f2937", QPalette.Highlight: "#1e66ff",
+        QPalette.HighlightedText: "#ffffff", QPalette.Link: "#1e66ff",
+    },
+    True: {
+        QPalette.Window: "#202124", QPalette.WindowText: "#E5E7EB",
+        QPalette.Base: "#292A2D", QPalette.AlternateBase: "#3C3E41",
+        QPalette.Text: "#E5E7EB", QPalette.Button: "#3C3E41",
+        QPalette.ButtonText: "#E5E7EB", QPalette.ToolTipBase: "#3C3E41",
+        QPalette.ToolTipText: "#E5E7EB", QPalette.Highlight: "#8AB4F8",
+        QPalette.HighlightedText: "#202124", QPalette.Link: "#8AB4F8",
+    },
+}
+THEME_DISABLED_TEXT = {False: "#9CA3AF", True: "#707070"}
+_theme_cache = {}
+
+
+def load_theme(dark):
+    """Return the (stylesheet, palette) for a theme, reading its QSS only once."""
+    if dark not in _theme_cache:
+        try:
+            with open(resource_path(THEME_STYLESHEETS[dark]), "r", encoding="utf-8") as f:
+                stylesheet = f.read()
+        except OSError as e:
+            logging.warning("Could not load theme stylesheet: %s", e)
+            stylesheet = ""
+        palette = QPalette()
+        for role, color in THEME_PALETTES[dark].items():
+            palette.setColor(role, QColor(color))
+        for role in (QPalette.WindowText, QPalette.Text, QPalette.ButtonText):
+            palette.setColor(QPalette.Disabled, role, QColor(THEME_DISABLED_TEXT[dark]))
+        _theme_cache[dark] = (stylesheet, palette)
+    return _theme_cache[dark]
+
+
 # --- Main GUI Application ---
+HOME_TAB, DEMO_TAB, CLASSROOM_TAB, LIVE_GRADING_TAB, RESULTS_TAB, SETTINGS_TAB = range(6)
+
+
 class GradeSparkGUI(QMainWindow):
     def __init__(self):
         super().__init__()
         
-        # Initialize settings manager
-        self.settings = SettingsStore()
+        # Initialize settings manager; writes are batched off the UI thread
+        self.settings = SettingsStore(write_delay=WRITE_BEHIND_DELAY)
         
         # Initialize demo data manager - FIX PATH HERE
-        self.demo_manager = DemoDataManager(data_dir=resource_path("demo_data"))
+        self.demo_manager = DemoDataManager(
+            data_dir=resource_path("demo_data"), sidecar_dir=self.demo_cache_dir()
+        )
+        # Built on first use; it pulls in pandas
+        self.analytics_engine = None
+        self.analytics_running = False
+
+        # Both themes are read once; apply_theme swaps between the cached copies
+        self._applied_theme = None
+        load_theme(False)
+        load_theme(True)
+
+        # Memoised results for reproducible (seeded) runs
+        self.results_store = self.create_results_store()
+        # The model outlives the Results Viewer widgets, which are built on demand
+        self.results_model = ResultsTableModel(self)
+        self.pending_results_key = None
+        self.results_streamed = False
+
+        # Views follow their settings directly instead of being rebuilt
+        self.settings.subscribe("show_rubric", self.set_rubric_column_visible)
+        self.settings.subscribe("dark_mode_enabled", lambda _enabled: self.apply_theme())
         
         # Setup logging
         logging.basicConfig(
@@ -532,6 +588,12 @@ class GradeSparkGUI(QMainWindow):
         
         # Initialize variables
         self.current_results = None
+
+        # Pick up datasets dropped into demo_data while the app is running
+        self.demo_watcher = None
+        if self.settings.get("watch_demo_data", True):
+            self.start_demo_data_watch()
+
         QTimer.singleShot(600, self.maybe_start_guided_tour)
     
     def init_ui(self):
@@ -553,13 +615,15 @@ class GradeSparkGUI(QMainWindow):
         self.tabs.setDocumentMode(True)
         layout.addWidget(self.tabs)
         
-        # Create tabs
-        self.create_home_tab()
-        self.create_demo_mode_tab()
-        self.create_classroom_mode_tab()
-        self.create_live_grading_tab()
-        self.create_results_viewer_tab()
-        self.create_settings_tab()
+        # Create tabs; all but Home and Demo are built the first time they are shown
+        self._lazy_tabs = {}
+        self.tabs.addTab(self.create_home_tab(), "Home")
+        self.tabs.addTab(self.create_demo_mode_tab(), "Demo Mode")
+        self.add_lazy_tab("Classroom Mode", self.create_classroom_mode_tab)
+        self.add_lazy_tab("Live Grading", self.create_live_grading_tab)
+        self.add_lazy_tab("Results Viewer", self.create_results_viewer_tab)
+        self.add_lazy_tab("Settings", self.create_settings_tab)
+        self.tabs.currentChanged.connect(self.build_tab)
         
         # Status bar
         self.status_bar = QStatusBar()
@@ -620,7 +684,7 @@ class GradeSparkGUI(QMainWindow):
         
         demo_btn = QPushButton("Try Demo Mode")
         demo_btn.setObjectName("primaryButton")
-        demo_btn.clicked.connect(lambda: self.tabs.setCurrentIndex(1))
+        demo_btn.clicked.connect(lambda: self.tabs.setCurrentIndex(DEMO_TAB))
         button_layout.addWidget(demo_btn)
         
         full_version_btn = QPushButton("Get Full Version")
@@ -630,8 +694,8 @@ class GradeSparkGUI(QMainWindow):
         
         layout.addLayout(button_layout)
 
-        self.tabs.addTab(home_widget, "Home")
         self.update_theme_dependent_styles()
+        return home_widget
     
     def create_demo_mode_tab(self):
         """Create the Demo Mode tab"""
@@ -665,6 +729,9 @@ class GradeSparkGUI(QMainWindow):
 
         assignment_label = QLabel("Assignment")
         self.assignment_combo = QComboBox()
+        self.assignment_combo.setItemDelegate(AssignmentBadgeDelegate(
+            self.assignment_combo, tooltip_detail=self.assignment_weakness
+        ))
         controls_layout.addWidget(assignment_label, 0, 4)
         controls_layout.addWidget(self.assignment_combo, 0, 5)
 
@@ -683,6 +750,21 @@ class GradeSparkGUI(QMainWindow):
         run_btn.setObjectName("primaryButton")
         run_btn.clicked.connect(self.run_demo_mode)
         layout.addWidget(run_btn)
+
+        # Batch grading across many datasets
+        batch_layout = QHBoxLayout()
+        self.batch_scope_combo = QComboBox()
+        self.batch_scope_combo.addItems(
+            ["All datasets", "Selected grade", "Selected grade & subject"]
+        )
+        batch_layout.addWidget(self.batch_scope_combo)
+        batch_btn = QPushButton("Grade Datasets in Batch")
+        batch_btn.clicked.connect(self.run_batch_mode)
+        batch_layout.addWidget(batch_btn)
+        analytics_btn = QPushButton("Grade Rollups...")
+        analytics_btn.clicked.connect(self.show_analytics)
+        batch_layout.addWidget(analytics_btn)
+        layout.addLayout(batch_layout)
         
         # Info button
         info_btn = QPushButton("How does it work?")
@@ -699,8 +781,8 @@ class GradeSparkGUI(QMainWindow):
         layout.addStretch()
         self.populate_demo_selectors()
 
-        self.tabs.addTab(demo_widget, "Demo Mode")
         self.update_theme_dependent_styles()
+        return demo_widget
     
     def create_classroom_mode_tab(self):
         """Create the Classroom Mode tab - shows lead capture"""
@@ -739,7 +821,7 @@ class GradeSparkGUI(QMainWindow):
 
         layout.addStretch()
 
-        self.tabs.addTab(classroom_widget, "Classroom Mode")
+        return classroom_widget
 
     def create_live_grading_tab(self):
         """Create the Live Grading tab - shows lead capture"""
@@ -778,7 +860,7 @@ class GradeSparkGUI(QMainWindow):
 
         layout.addStretch()
 
-        self.tabs.addTab(live_widget, "Live Grading")
+        return live_widget
     
     def create_results_viewer_tab(self):
         """Create the Results Viewer tab"""
@@ -790,7 +872,7 @@ class GradeSparkGUI(QMainWindow):
         # Export buttons
         button_layout = QHBoxLayout()
 
-        export_csv_btn = QPushButton("Export to CSV")
+        export_csv_btn = QPushButton("Export Results")
         export_csv_btn.clicked.connect(self.export_to_csv)
         button_layout.addWidget(export_csv_btn)
         
@@ -802,26 +884,30 @@ class GradeSparkGUI(QMainWindow):
         layout.addLayout(button_layout)
 
         # Results table
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(4)
-        self.results_table.setHorizontalHeaderLabels(["Student Name", "Score", "Feedback", "Rubric"])
-        self.results_table.setAlternatingRowColors(False)
+        self._results_table = QTableView()
+        self._results_table.setModel(self.results_model)
+        self._results_table.setAlternatingRowColors(False)
 
         # Set column widths
-        header = self.results_table.horizontalHeader()
+        header = self._results_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Interactive)
         header.setSectionResizeMode(1, QHeaderView.Fixed)
         header.setSectionResizeMode(2, QHeaderView.Stretch)
         header.setSectionResizeMode(3, QHeaderView.Stretch)
-        self.results_table.setColumnWidth(1, 80)
+        self._results_table.setColumnWidth(1, 80)
+        self._results_table.setColumnHidden(
+            RUBRIC_COLUMN, not self.settings.get("show_rubric", True)
+        )
 
-        layout.addWidget(self.results_table)
-        self.results_table.cellDoubleClicked.connect(self.show_feedback_spotlight)
+        layout.addWidget(self._results_table)
+        self._results_table.doubleClicked.connect(
+            lambda index: self.show_feedback_spotlight(index.row(), index.column())
+        )
 
         legend_bar = self._build_results_legend()
         layout.addWidget(legend_bar)
 
-        self.tabs.addTab(results_widget, "Results Viewer")
+        return results_widget
 
     def create_settings_tab(self):
         """Create the Settings tab"""
@@ -833,15 +919,15 @@ class GradeSparkGUI(QMainWindow):
         display_group = QGroupBox("Display Options")
         display_layout = QVBoxLayout()
         
-        self.rubric_checkbox = QCheckBox("Show rubric categories")
-        self.rubric_checkbox.setChecked(self.settings.get("show_rubric", True))
-        self.rubric_checkbox.stateChanged.connect(self.save_settings)
-        display_layout.addWidget(self.rubric_checkbox)
+        self._rubric_checkbox = QCheckBox("Show rubric categories")
+        self._rubric_checkbox.setChecked(self.settings.get("show_rubric", True))
+        self._rubric_checkbox.stateChanged.connect(self.save_settings)
+        display_layout.addWidget(self._rubric_checkbox)
         
-        self.dark_mode_checkbox = QCheckBox("Enable Dark Mode")
-        self.dark_mode_checkbox.setChecked(self.settings.get("dark_mode_enabled", False))
-        self.dark_mode_checkbox.stateChanged.connect(self.toggle_dark_mode)
-        display_layout.addWidget(self.dark_mode_checkbox)
+        self._dark_mode_checkbox = QCheckBox("Enable Dark Mode")
+        self._dark_mode_checkbox.setChecked(self.settings.get("dark_mode_enabled", False))
+        self._dark_mode_checkbox.stateChanged.connect(self.toggle_dark_mode)
+        display_layout.addWidget(self._dark_mode_checkbox)
         
         display_group.setLayout(display_layout)
         layout.addWidget(display_group)
@@ -850,6 +936,35 @@ class GradeSparkGUI(QMainWindow):
         advanced_group = QGroupBox("Advanced")
         advanced_layout = QVBoxLayout()
         
+        seed_row = QHBoxLayout()
+        seed_row.addWidget(QLabel("Grading seed"))
+        self.seed_input = QLineEdit()
+        self.seed_input.setPlaceholderText("Random each run")
+        seed_value = self.settings.get("grading_seed")
+        if seed_value is not None:
+            self.seed_input.setText(str(seed_value))
+        self.seed_input.editingFinished.connect(self.save_grading_seed)
+        seed_row.addWidget(self.seed_input)
+        advanced_layout.addLayout(seed_row)
+
+        self.per_student_checkbox = QCheckBox("Derive scores per student (stable across roster changes)")
+        self.per_student_checkbox.setChecked(self.settings.get("per_student_seed", False))
+        self.per_student_checkbox.stateChanged.connect(self.save_settings)
+        advanced_layout.addWidget(self.per_student_checkbox)
+
+        self.watch_checkbox = QCheckBox("Watch demo data folder for new datasets")
+        self.watch_checkbox.setChecked(self.settings.get("watch_demo_data", True))
+        self.watch_checkbox.stateChanged.connect(self.toggle_demo_data_watch)
+        advanced_layout.addWidget(self.watch_checkbox)
+
+        results_cache_btn = QPushButton("Results Cache...")
+        results_cache_btn.clicked.connect(self.show_results_store)
+        advanced_layout.addWidget(results_cache_btn)
+
+        validate_btn = QPushButton("Validate Demo Data...")
+        validate_btn.clicked.connect(self.validate_demo_data)
+        advanced_layout.addWidget(validate_btn)
+
         logs_btn = QPushButton("Open Logs Folder")
         logs_btn.clicked.connect(self.open_logs_folder)
         advanced_layout.addWidget(logs_btn)
@@ -865,8 +980,39 @@ class GradeSparkGUI(QMainWindow):
         
         layout.addStretch()
         
-        self.tabs.addTab(settings_widget, "Settings")
-    
+        return settings_widget
+
+    # --- Lazy Tabs ---
+    def add_lazy_tab(self, title, builder):
+        """Add a placeholder tab whose real contents come from builder() on first show."""
+        placeholder = QWidget()
+        placeholder_layout = QVBoxLayout(placeholder)
+        placeholder_layout.setContentsMargins(0, 0, 0, 0)
+        index = self.tabs.addTab(placeholder, title)
+        self._lazy_tabs[index] = builder
+        return index
+
+    def build_tab(self, index):
+        """Build a placeholder tab's widgets if that has not happened yet."""
+        builder = self._lazy_tabs.pop(index, None)
+        if builder is not None:
+            self.tabs.widget(index).layout().addWidget(builder())
+
+    @property
+    def results_table(self):
+        self.build_tab(RESULTS_TAB)
+        return self._results_table
+
+    @property
+    def rubric_checkbox(self):
+        self.build_tab(SETTINGS_TAB)
+        return self._rubric_checkbox
+
+    @property
+    def dark_mode_checkbox(self):
+        self.build_tab(SETTINGS_TAB)
+        return self._dark_mode_checkbox
+
     # --- Demo Mode Methods ---
     def populate_demo_selectors(self):
         """Initialise grade, subject, and assignment dropdowns from demo data."""
@@ -913,6 +1059,140 @@ class GradeSparkGUI(QMainWindow):
 
         if assignments:
             self.assignment_combo.setCurrentIndex(0)
+        self.update_assignment_badges()
+
+    def update_assignment_badges(self):
+        """Attach submitted/total badges to the listed assignments."""
+        grade = self.grade_combo.currentText()
+        subject = self.subject_combo.currentText()
+        combo = self.assignment_combo
+        datasets = [(grade, subject, combo.itemText(index)) for index in range(combo.count())]
+        summaries = self.demo_manager.get_dataset_summaries(datasets)
+        for index, key in enumerate(datasets):
+            summary = summaries.get(key)
+            badge = f"{summary['submitted']}/{summary['total']} in" if summary else None
+            combo.setItemData(index, badge, ASSIGNMENT_BADGE_ROLE)
+            tooltip = (
+                f"{summary['submitted']} submitted, {summary['missing']} missing"
+                if summary else None
+            )
+            combo.setItemData(index, tooltip, Qt.ToolTipRole)
+
+    def assignment_weakness(self, index):
+        """Tooltip line naming an assignment's weakest rubric criterion.
+
+        Built on hover rather than with the badges, which would load every
+        listed dataset (and pandas) before the first paint. The manager
+        caches the parsed rubric per file until it changes. Streamed rosters
+        are left out.
+        """
+        key = (self.grade_combo.currentText(), self.subject_combo.currentText(), index.data())
+        if self.demo_manager.should_stream(*key):
+            return None
+        matrix = self.demo_manager.get_rubric_matrix(*key)
+        weakness = describe_weakness(matrix) if matrix is not None else None
+        return f"Weakest criterion: {weakness}" if weakness else None
+
+    def start_demo_data_watch(self):
+        """Watch the demo data tree and apply changes after a short debounce."""
+        if self.demo_watcher is None:
+            self.demo_watcher = QFileSystemWatcher(self)
+            self.demo_watcher.directoryChanged.connect(self._schedule_demo_refresh)
+            self.demo_refresh_timer = QTimer(self)
+            self.demo_refresh_timer.setSingleShot(True)
+            self.demo_refresh_timer.setInterval(500)
+            self.demo_refresh_timer.timeout.connect(self.refresh_demo_data)
+        self._sync_watched_directories()
+
+    def stop_demo_data_watch(self):
+        if self.demo_watcher is None:
+            return
+        self.demo_refresh_timer.stop()
+        watched = self.demo_watcher.directories()
+        if watched:
+            self.demo_watcher.removePaths(watched)
+
+    def toggle_demo_data_watch(self):
+        enabled = self.watch_checkbox.isChecked()
+        self.settings["watch_demo_data"] = enabled
+        self.settings.save()
+        if enabled:
+            self.start_demo_data_watch()
+            self.refresh_demo_data()
+        else:
+            self.stop_demo_data_watch()
+
+    def _schedule_demo_refresh(self, _path):
+        # Batch uploads fire many events; restart the timer so we rescan once.
+        self.demo_refresh_timer.start()
+
+    def _sync_watched_directories(self):
+        wanted = set(self.demo_manager.watched_directories())
+        current = set(self.demo_watcher.directories())
+        stale = current - wanted
+        missing = wanted - current
+        if stale:
+            self.demo_watcher.removePaths(list(stale))
+        if missing:
+            self.demo_watcher.addPaths(sorted(missing))
+
+    def refresh_demo_data(self):
+        """Apply on-disk demo data changes to the selectors."""
+        delta = self.demo_manager.refresh()
+        if self.demo_watcher is not None and self.settings.get("watch_demo_data", True):
+            self._sync_watched_directories()
+        if not delta["added"] and not delta["removed"]:
+            # Edited files keep their place in the selector but may need new badges
+            self.update_assignment_badges()
+            return
+        self.apply_demo_structure_changes(delta)
+        self.update_assignment_badges()
+        self.status_bar.showMessage(
+            f"Demo data updated: {len(delta['added'])} added, {len(delta['removed'])} removed"
+        )
+
+    def apply_demo_structure_changes(self, delta):
+        """Refresh only the combo boxes touched by a refresh delta, keeping selections."""
+        changed = delta["added"] + delta["removed"]
+        changed_grades = {grade for grade, _, _ in changed}
+        changed_subjects = {(grade, subject) for grade, subject, _ in changed}
+
+        grade = self.grade_combo.currentText()
+        self._sync_combo_items(self.grade_combo, self.demo_manager.get_grades())
+        if self.grade_combo.currentText() != grade:
+            self.update_subject_list()
+            return
+        if grade not in changed_grades:
+            return
+
+        subject = self.subject_combo.currentText()
+        self._sync_combo_items(self.subject_combo, self.demo_manager.get_subjects(grade))
+        if self.subject_combo.currentText() != subject:
+            self.update_assignment_list()
+            return
+        if (grade, subject) in changed_subjects:
+            self._sync_combo_items(
+                self.assignment_combo, self.demo_manager.get_assignments(grade, subject)
+            )
+
+    @staticmethod
+    def _sync_combo_items(combo, items):
+        """Insert/remove combo entries to match a sorted list without a full clear."""
+        current = combo.currentText()
+        wanted = set(items)
+        combo.blockSignals(True)
+        for index in reversed(range(combo.count())):
+            if combo.itemText(index) not in wanted:
+                combo.removeItem(index)
+        existing = {combo.itemText(index) for index in range(combo.count())}
+        for position, text in enumerate(items):
+            if text not in existing:
+                combo.insertItem(position, text)
+        if current in wanted:
+            combo.setCurrentIndex(combo.findText(current))
+        elif combo.count():
+            combo.setCurrentIndex(0)
+        combo.blockSignals(False)
 
     def run_demo_mode(self):
         """Run the demo mode grading simulation"""
@@ -925,39 +1205,97 @@ class GradeSparkGUI(QMainWindow):
             QMessageBox.critical(self, "Demo Data Missing",
                 "Demo data files are missing. Please ensure the demo_data folder is in the application directory.")
             return
-        
-        # Load demo data
-        df, submitted, total, missing = self.demo_manager.load_csv(grade, subject, assignment)
-        if df is None:
-            QMessageBox.warning(self, "No Data",
-                f"No demo data available for Grade {grade} {subject} - {assignment}")
+
+        # A header check reads one line; reject a malformed file before any load
+        issues = self.demo_manager.validate_dataset(grade, subject, assignment)
+        if issues:
+            QMessageBox.warning(self, "Invalid Dataset",
+                f"Grade {grade} {subject} - {assignment} cannot be graded:\n{issues[0].message}")
             return
 
+        # Resolve the seed up front so an unchanged run can be served from the store
+        self.last_run_seed = self.resolve_grading_seed()
+        streaming = self.demo_manager.should_stream(grade, subject, assignment)
+        self.pending_results_key = self.results_key_for(
+            grade, subject, assignment, self.last_run_seed, streaming
+        )
+        self.pending_results_label = dataset_key(grade, subject, assignment)
+        if self.pending_results_key:
+            cached_results = self.results_store.get(self.pending_results_key)
+            if cached_results is not None:
+                logging.info("Serving %s/%s/%s from the results store", grade, subject, assignment)
+                self.pending_results_key = None
+                self.demo_grading_complete(cached_results)
+                return
+        
+        # Large rosters are streamed in chunks instead of materialised twice
+        if streaming:
+            stream = self.demo_manager.open_stream(grade, subject, assignment)
+            if stream is None:
+                QMessageBox.warning(self, "No Data",
+                    f"No demo data available for Grade {grade} {subject} - {assignment}")
+                return
+            assignments, total = stream, stream.total_hint
+            if total is not None:
+                status_detail = f"(streaming {total} rows)"
+            else:
+                status_detail = f"(streaming {stream.size_bytes / 1e6:.0f} MB)"
+        else:
+            # Load demo data
+            df, submitted, total, missing = self.demo_manager.load_csv(grade, subject, assignment)
+            logging.debug("Dataset cache: %s", self.demo_manager.cache_stats())
+            if df is None:
+                QMessageBox.warning(self, "No Data",
+                    f"No demo data available for Grade {grade} {subject} - {assignment}")
+                return
+            assignments = None
+            status_detail = f"({submitted} of {total} submissions, {missing} missing)"
+
         try:
-            # Load the CSV data
-            assignments = df.to_dict('records')
+            # Whole datasets go through the vectorised batch engine
+            if assignments is None:
+                assignments = df
             
             # Setup progress
             self.demo_progress.setVisible(True)
             self.demo_progress.setValue(0)
             self.status_bar.showMessage(
-                f"Running Demo Mode: Grade {grade} {subject} - {assignment} "
-                f"({submitted} of {total} submissions, {missing} missing)"
+                f"Running Demo Mode: Grade {grade} {subject} - {assignment} {status_detail}"
             )
             
             # Create worker thread
             self.thread = QThread()
-            self.worker = Worker(assignments, subject, grade)
+            logging.info("Grading %s/%s/%s with seed %d", grade, subject, assignment,
+                         self.last_run_seed)
+            self.worker = Worker(
+                assignments, subject, grade, total=total,
+                progress_hz=self.settings.get("progress_max_hz", 30),
+                progress_step=self.settings.get("progress_min_step", 1),
+                seed=self.last_run_seed,
+                per_student_seed=self.settings.get("per_student_seed", False),
+                dataset=dataset_key(grade, subject, assignment),
+                # Streamed rows accumulate in the results model only
+                keep_results=not streaming,
+            )
             self.worker.moveToThread(self.thread)
             
             # Connect signals
             self.thread.started.connect(self.worker.run)
             self.worker.progress.connect(self.update_demo_progress)
+            self.worker.partial.connect(self.append_partial_results)
             self.worker.finished.connect(self.demo_grading_complete)
             self.worker.finished.connect(self.thread.quit)
             self.worker.finished.connect(self.worker.deleteLater)
+            self.worker.error.connect(self.demo_grading_failed)
+            self.worker.error.connect(self.thread.quit)
+            self.worker.error.connect(self.worker.deleteLater)
             self.thread.finished.connect(self.thread.deleteLater)
             
+            # Rows appear in the Results Viewer as the worker produces them
+            self.current_results = None
+            self.results_model.clear()
+            self.results_streamed = True
+
             # Start grading
             self.thread.start()
 
@@ -969,20 +1307,296 @@ class GradeSparkGUI(QMainWindow):
         self.demo_progress.setValue(value)
         self.status_bar.showMessage(message)
     
+    def results_key_for(self, grade, subject, assignment, seed, streaming):
+        """Results-store key, or None when the run is not reproducible."""
+        if self.settings.get("grading_seed") is None:
+            return None
+        content_hash = self.demo_manager.content_hash(grade, subject, assignment)
+        if content_hash is None:
+            return None
+        return make_results_key(
+            content_hash,
+            grade=grade,
+            subject=subject,
+            assignment=assignment,
+            seed=seed,
+            per_student=self.settings.get("per_student_seed", False),
+            engine="stream" if streaming else "batch",
+        )
+
+    def demo_cache_dir(self):
+        """Per-user home for demo-data sidecars and index.json.
+
+        Bundled builds run from a read-only app bundle or a temporary
+        extraction directory, so nothing cached next to the data survives.
+        """
+        cache_dir = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+        if not cache_dir:
+            cache_dir = str(Path.home() / ".gradespark" / "cache")
+        return Path(cache_dir) / "demo_data"
+
+    def create_results_store(self):
+        """Build the results store, with a SQLite tier when enabled in settings."""
+        db_path = None
+        if self.settings.get("results_cache_disk", False):
+            target_dir = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+            if not target_dir:
+                target_dir = str(Path.home() / ".gradespark")
+            Path(target_dir).mkdir(parents=True, exist_ok=True)
+            db_path = Path(target_dir) / "results_cache.sqlite"
+        return ResultsStore(
+            max_rows=self.settings.get("results_cache_rows", 500000), db_path=db_path
+        )
+
+    def show_results_store(self):
+        """Report results-store occupancy and offer to clear it"""
+        stats = self.results_store.stats()
+        bullets = [
+            f"{stats['entries']} result sets in memory ({stats['rows']} of {stats['max_rows']} rows).",
+            f"{stats['hits']} hits, {stats['misses']} misses this session.",
+        ]
+        if "disk_entries" in stats:
+            bullets.append(
+                f"{stats['disk_entries']} result sets on disk ({stats['disk_bytes'] // 1024} KB)."
+            )
+        for entry in self.results_store.entries()[:5]:
+            bullets.append(f"{entry['label'] or entry['key']} - {entry['rows']} rows ({entry['tier']})")
+
+        dialog = QMessageBox(self)
+        dialog.setIcon(QMessageBox.Information)
+        dialog.setWindowTitle("Results Cache")
+        dialog.setText("<b>Results Cache</b>")
+        dialog.setInformativeText("<br>".join(f"• {point}" for point in bullets))
+        clear_button = dialog.addButton("Clear Cache", QMessageBox.DestructiveRole)
+        dialog.addButton(QMessageBox.Close)
+        dialog.exec_()
+        if dialog.clickedButton() is clear_button:
+            self.results_store.clear()
+            self.status_bar.showMessage("Results cache cleared")
+
+    def show_analytics(self):
+        """Load rollups across all datasets in the background, then show them"""
+        if self.analytics_running:
+            return  # a refresh is already running; its dialog opens when done
+        self.analytics_running = True
+
+        self.analytics_thread = QThread()
+        self.analytics_worker = AnalyticsWorker(
+            self.demo_manager, self.demo_manager.dataset_files(), self.analytics_engine
+        )
+        self.analytics_worker.moveToThread(self.analytics_thread)
+
+        self.analytics_thread.started.connect(self.analytics_worker.run)
+        self.analytics_worker.finished.connect(self.analytics_complete)
+        self.analytics_worker.error.connect(self.analytics_failed)
+        for signal in (self.analytics_worker.finished, self.analytics_worker.error):
+            signal.connect(self.analytics_thread.quit)
+            signal.connect(self.analytics_worker.deleteLater)
+        self.analytics_thread.finished.connect(self.analytics_thread.deleteLater)
+
+        self.status_bar.showMessage("Loading grade rollups...")
+        self.analytics_thread.start()
+
+    def analytics_failed(self, message):
+        self.analytics_running = False
+        self.status_bar.showMessage("Grade rollups failed")
+        QMessageBox.critical(self, "Error", f"Failed to build grade rollups: {message}")
+
+    def analytics_complete(self, loaded):
+        """Show averages, submission rates and buckets rolled up across all datasets"""
+        from analytics_engine import ROLLUP_LEVELS
+
+        self.analytics_engine, rollups = loaded
+        self.analytics_running = False
+        self.status_bar.clearMessage()
+
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Grade Rollups")
+        dialog.resize(760, 420)
+        dialog_layout = QVBoxLayout(dialog)
+
+        level_combo = QComboBox()
+        level_combo.addItems(["By grade", "By grade & subject", "By assignment"])
+        dialog_layout.addWidget(level_combo)
+        table = QTableWidget()
+        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        table.verticalHeader().setVisible(False)
+        dialog_layout.addWidget(table)
+
+        def show_rollup(index):
+            by = ROLLUP_LEVELS[:index + 1]
+            rollup = rollups[index]
+            table.clear()
+            table.setColumnCount(len(rollup.columns))
+            table.setRowCount(len(rollup))
+            table.setHorizontalHeaderLabels([str(column) for column in rollup.columns])
+            for row, values in enumerate(rollup.itertuples(index=False)):
+                for column, value in enumerate(values):
+                    table.setItem(row, column, QTableWidgetItem(
+                        format_rollup_value(rollup.columns[column], value, by)
+                    ))
+            table.resizeColumnsToContents()
+
+        level_combo.currentIndexChanged.connect(show_rollup)
+        show_rollup(0)
+
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(dialog.accept)
+        dialog_layout.addWidget(close_button)
+        dialog.exec_()
+
+    def validate_demo_data(self):
+        """Check every demo CSV row by row and report problems with line numbers"""
+        problems = self.demo_manager.preflight(strict=True)
+        if not problems:
+            QMessageBox.information(
+                self, "Demo Data Valid", "Every demo dataset matches the expected format."
+            )
+            return
+
+        bullets = []
+        for path, issues in list(problems.items())[:5]:
+            name = os.path.relpath(path, self.demo_manager.data_dir)
+            for issue in issues[:3]:
+                where = f"line {issue.line}" if issue.line else "file"
+                bullets.append(f"{name} ({where}): {issue.message}")
+            if len(issues) > 3:
+                bullets.append(f"{name}: {len(issues) - 3} more issues")
+        if len(problems) > 5:
+            bullets.append(f"{len(problems) - 5} more files with issues")
+
+        dialog = QMessageBox(self)
+        dialog.setIcon(QMessageBox.Warning)
+        dialog.setWindowTitle("Demo Data Problems")
+        dialog.setText(f"<b>{len(problems)} demo datasets failed validation</b>")
+        dialog.setInformativeText("\n".join(f"• {point}" for point in bullets))
+        dialog.exec_()
+
+    def resolve_grading_seed(self):
+        """Return the configured grading seed, or a fresh one for this run."""
+        seed = self.settings.get("grading_seed")
+        return seed if seed is not None else new_run_seed()
+
+    def run_batch_mode(self):
+        """Grade every dataset in the chosen scope across a process pool"""
+        scope = self.batch_scope_combo.currentIndex()
+        grade = self.grade_combo.currentText() if scope >= 1 else None
+        subject = self.subject_combo.currentText() if scope == 2 else None
+
+        # Workers read through the same sidecars as the manager
+        jobs = [
+            (path, self.demo_manager.sidecar_path(path), *key)
+            for key, path in self.demo_manager.dataset_files(grade=grade, subject=subject)
+        ]
+        if not jobs:
+            QMessageBox.warning(self, "No Data", "No demo datasets match the selected scope.")
+            return
+
+        self.batch_seed = self.resolve_grading_seed()
+        self.batch_results = {}
+        self.batch_failures = {}
+        logging.info("Batch grading %d datasets with seed %d", len(jobs), self.batch_seed)
+
+        self.demo_progress.setVisible(True)
+        self.demo_progress.setValue(0)
+        self.status_bar.showMessage(f"Batch grading {len(jobs)} datasets...")
+
+        self.batch_thread = QThread()
+        self.batch_worker = BatchWorker(
+            jobs, self.batch_seed, max_workers=self.settings.get("batch_workers", 0),
+            per_student_seed=self.settings.get("per_student_seed", False)
+        )
+        self.batch_worker.moveToThread(self.batch_thread)
+
+        self.batch_thread.started.connect(self.batch_worker.run)
+        self.batch_worker.progress.connect(self.update_demo_progress)
+        self.batch_worker.dataset_finished.connect(self.batch_dataset_complete)
+        self.batch_worker.dataset_failed.connect(self.batch_dataset_failed)
+        self.batch_worker.finished.connect(self.batch_grading_complete)
+        self.batch_worker.error.connect(self.demo_grading_failed)
+        for signal in (self.batch_worker.finished, self.batch_worker.error):
+            signal.connect(self.batch_thread.quit)
+            signal.connect(self.batch_worker.deleteLater)
+        self.batch_thread.finished.connect(self.batch_thread.deleteLater)
+
+        self.batch_thread.start()
+
+    def batch_dataset_complete(self, key, results):
+        """Keep each dataset's results as soon as its process finishes"""
+        self.batch_results[key] = results
+
+    def batch_dataset_failed(self, key, message):
+        """Remember a dataset the batch had to skip"""
+        self.batch_failures[key] = message
+
+    def batch_grading_complete(self, all_results):
+        """Combine batch results into the Results Viewer"""
+        self.demo_progress.setVisible(False)
+        from grading_results import GradingResults
+
+        combined = GradingResults.concat([
+            results.with_columns(Grade=grade, Subject=subject, Assignment=assignment)
+            for (grade, subject, assignment), results in sorted(all_results.items())
+        ])
+
+        self.current_results = combined
+        self.populate_results_table(combined)
+        skipped = f", {len(self.batch_failures)} skipped" if self.batch_failures else ""
+        self.status_bar.showMessage(
+            f"Batch grading complete - {len(all_results)} datasets{skipped}, {len(combined)} assignments "
+            f"({combined.submitted_count} graded, {combined.missing_count} missing)"
+        )
+        if self.batch_failures:
+            lines = [
+                f"• Grade {grade} {subject} - {assignment}: {message}"
+                for (grade, subject, assignment), message in sorted(self.batch_failures.items())
+            ]
+            if len(lines) > 10:
+                lines[10:] = [f"...and {len(lines) - 10} more"]
+            QMessageBox.warning(
+                self, "Datasets Skipped",
+                "These datasets could not be read and were left out of the batch:\n\n" + "\n".join(lines)
+            )
+
+    def append_partial_results(self, rows):
+        """Append a batch of graded rows while the run is still going"""
+        self.results_model.append_results(rows)
+
+    def demo_grading_failed(self, message):
+        """Handle a dataset that could not be read while grading"""
+        self.demo_progress.setVisible(False)
+        self.results_streamed = False
+        self.status_bar.showMessage("Demo grading failed")
+        QMessageBox.critical(self, "Error", f"Failed to load demo data: {message}")
+
     def demo_grading_complete(self, results):
         """Handle completion of demo grading"""
         self.demo_progress.setVisible(False)
+        if results is None:
+            # A streamed run: every row is already in the results model
+            results = self.results_model.results()
+            if results is None:
+                from grading_results import GradingResults
+                results = GradingResults.empty()
         self.current_results = results
 
-        # Populate results table
-        self.populate_results_table(results)
+        if self.pending_results_key:
+            self.results_store.put(
+                self.pending_results_key, results, label=self.pending_results_label
+            )
+            self.pending_results_key = None
+
+        # Populate results table unless the rows were already streamed in
+        if not self.results_streamed or self.results_model.rowCount() != len(results):
+            self.populate_results_table(results)
+        self.results_streamed = False
         self.status_bar.showMessage(
             f"Demo grading complete - {len(results)} assignments processed"
         )
 
-        submitted = sum(1 for r in results if r['Score'] != 'Not submitted')
-        missing = len(results) - submitted
-        missing_names = [r['Student Name'] for r in results if r['Score'] == 'Not submitted']
+        missing = results.missing_count
+        submitted = results.submitted_count
+        missing_names = self.results_model.names_in_bucket(BUCKET_MISSING, limit=6)
 
         summary_lines = [
             f"Assignments graded: {submitted}",
@@ -993,6 +1607,9 @@ class GradeSparkGUI(QMainWindow):
             if len(missing_names) > 5:
                 preview += ", ..."
             summary_lines.append(f"Missing students: {preview}")
+        weakness = describe_weakness(results.rubric_matrix())
+        if weakness:
+            summary_lines.append(f"Class weakness: {weakness}")
 
         msg_box = QMessageBox(self)
         msg_box.setWindowTitle("Demo Complete")
@@ -1003,7 +1620,7 @@ class GradeSparkGUI(QMainWindow):
         msg_box.exec_()
 
         if msg_box.clickedButton() is view_button:
-            self.tabs.setCurrentIndex(4)
+            self.tabs.setCurrentIndex(RESULTS_TAB)
     
     def show_demo_info(self):
         """Show information about demo mode"""
@@ -1049,45 +1666,27 @@ class GradeSparkGUI(QMainWindow):
     # --- Lead Capture Methods ---
     def show_lead_capture(self, feature_name):
         """Show lead capture dialog for premium features"""
+        from lead_capture import LeadCaptureDialog
         dialog = LeadCaptureDialog(self, feature_name)
         dialog.exec_()
     
     def show_full_version_info(self):
         """Show information about the full version"""
+        from lead_capture import LeadCaptureDialog
         dialog = LeadCaptureDialog(self, "Full Version Features")
         dialog.exec_()
     
     # --- Results Methods ---
     def populate_results_table(self, results):
         """Populate the results table with grading data"""
-        self.results_table.setRowCount(len(results))
-
-        for row, result in enumerate(results):
-            # Student Name
-            self.results_table.setItem(row, 0, QTableWidgetItem(result['Student Name']))
-
-            # Score
-            score_item = QTableWidgetItem(str(result['Score']))
-            self.results_table.setItem(row, 1, score_item)
-            score_item.setForeground(QBrush(self._score_bucket_color(result['Score'])))
-
-            # Feedback
-            self.results_table.setItem(row, 2, QTableWidgetItem(result['Feedback']))
-
-            # Rubric
-            if self.settings.get("show_rubric", True):
-                self.results_table.setItem(row, 3, QTableWidgetItem(result['Rubric']))
-            else:
-                self.results_table.setItem(row, 3, QTableWidgetItem(""))
-
-            self._apply_score_styling(row, result['Score'])
+        self.results_model.set_results(results)
 
     def show_feedback_spotlight(self, row, _column):
         """Display a focused view of the student's feedback with an upgrade CTA."""
-        if not self.current_results or row >= len(self.current_results):
+        if row >= self.results_model.rowCount():
             return
 
-        result = self.current_results[row]
+        result = self.results_model.row_dict(row)
         dialog = QDialog(self)
         dialog.setWindowTitle(f"Feedback Spotlight - {result['Student Name']}")
         dialog.setModal(True)
@@ -1122,54 +1721,6 @@ class GradeSparkGUI(QMainWindow):
 
         dialog.exec_()
 
-    def _apply_score_styling(self, row_index, score_value):
-        """Apply subtle row tinting based on score bucket."""
-        palette = {
-            "missing": "#ef4444",
-            "failing": "#ef4444",
-            "needs_improvement": "#facc15",
-            "understanding": "#4ade80",
-            "proficient": "#16a34a",
-        }
-
-        category = "missing"
-        numeric_score = None
-        try:
-            numeric_score = float(score_value)
-        except (TypeError, ValueError):
-            pass
-
-        if numeric_score is not None:
-            if numeric_score <= 65:
-                category = "failing"
-            elif numeric_score <= 75:
-                category = "needs_improvement"
-            elif numeric_score <= 89:
-                category = "understanding"
-            else:
-                category = "proficient"
-
-        for column in range(self.results_table.columnCount()):
-            item = self.results_table.item(row_index, column)
-            if not item:
-                continue
-            item.setBackground(QBrush(Qt.transparent))
-
-    def _score_bucket_color(self, score_value):
-        """Return a text color for the score column based on bucket."""
-        try:
-            numeric_score = float(score_value)
-        except (TypeError, ValueError):
-            return QColor("#b91c1c")  # treat non-submitters as failing
-
-        if numeric_score <= 65:
-            return QColor("#b91c1c")  # red
-        if numeric_score <= 75:
-            return QColor("#ca8a04")  # yellow
-        if numeric_score <= 89:
-            return QColor("#15803d")  # green
-        return QColor("#1d4ed8")  # blue for top performers
-
     def _build_results_legend(self):
         """Create the color legend for score buckets."""
         legend_frame = QFrame()
@@ -1177,40 +1728,92 @@ class GradeSparkGUI(QMainWindow):
         legend_layout.setContentsMargins(0, 12, 0, 0)
         legend_layout.setSpacing(18)
 
-        entries = [
-            ("#ef4444", "Red = Failed/Not Submitted"),
-            ("#facc15", "Yellow = Needs Extra Support"),
-            ("#16a34a", "Green = Proficient"),
-            ("#2563eb", "Blue = Exceptional Performance"),
-        ]
-
-        for color, text in entries:
-            label = QLabel(f"<span style='color:{color}; font-weight:700;'>•</span> {text}")
+        self.legend_labels = []
+        for _color, _text, _buckets in LEGEND_ENTRIES:
+            label = QLabel()
             legend_layout.addWidget(label)
+            self.legend_labels.append(label)
+        self.update_results_legend()
+
+        # Counts follow the model's cached bucket array
+        self.results_model.modelReset.connect(self.update_results_legend)
+        self.results_model.rowsInserted.connect(self.update_results_legend)
 
         legend_layout.addStretch()
         return legend_frame
 
+    def update_results_legend(self, *_args):
+        """Refresh legend labels with per-bucket counts for the loaded results."""
+        counts = self.results_model.bucket_counts()
+        has_rows = self.results_model.rowCount() > 0
+        for label, (color, text, buckets) in zip(self.legend_labels, LEGEND_ENTRIES):
+            suffix = f" ({sum(int(counts[b]) for b in buckets)})" if has_rows else ""
+            label.setText(
+                f"<span style='color:{color}; font-weight:700;'>•</span> {text}{suffix}"
+            )
+
     def export_to_csv(self):
-        """Export results to CSV file"""
+        """Export results; the file extension picks CSV, compressed CSV, JSON Lines or Parquet"""
         if not self.current_results:
             QMessageBox.warning(self, "No Results", "No results to export. Run Demo Mode first.")
             return
         
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, "Save Results", "", "CSV Files (*.csv)")
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            self, "Save Results", "", EXPORT_FILE_FILTER)
         
-        if file_path:
-            try:
-                df = pd.DataFrame(self.current_results)
-                df.to_csv(file_path, index=False)
-                QMessageBox.information(self, "Success", f"Results exported to {file_path}")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to export: {str(e)}")
+        if not file_path:
+            return
+        # The format follows the extension; fall back to the chosen filter's
+        if export_format_for(file_path) is None:
+            file_path += suffix_for_filter(selected_filter)
+
+        self.export_thread = QThread()
+        self.export_worker = ExportWorker(self.current_results, file_path)
+        self.export_worker.moveToThread(self.export_thread)
+
+        self.export_dialog = QProgressDialog("Exporting results...", "Cancel", 0, 100, self)
+        self.export_dialog.setWindowTitle("Export")
+        self.export_dialog.setMinimumDuration(300)
+        self.export_dialog.setValue(0)
+        # Direct: the worker thread is busy inside run() and never gets to a
+        # queued cancel; cancel() only sets a threading.Event, so this is safe
+        self.export_dialog.canceled.connect(self.export_worker.cancel, Qt.DirectConnection)
+
+        self.export_thread.started.connect(self.export_worker.run)
+        self.export_worker.progress.connect(self.update_export_progress)
+        self.export_worker.finished.connect(self.export_complete)
+        self.export_worker.cancelled.connect(self.export_cancelled)
+        self.export_worker.error.connect(self.export_failed)
+        for signal in (self.export_worker.finished, self.export_worker.cancelled,
+                       self.export_worker.error):
+            signal.connect(self.export_thread.quit)
+            signal.connect(self.export_worker.deleteLater)
+        self.export_thread.finished.connect(self.export_thread.deleteLater)
+
+        self.status_bar.showMessage(f"Exporting results to {file_path}...")
+        self.export_thread.start()
+
+    def update_export_progress(self, value, message):
+        self.export_dialog.setValue(value)
+        self.status_bar.showMessage(message)
+
+    def export_complete(self, file_path):
+        self.export_dialog.reset()
+        self.status_bar.showMessage(f"Results exported to {file_path}")
+        QMessageBox.information(self, "Success", f"Results exported to {file_path}")
+
+    def export_cancelled(self):
+        self.export_dialog.reset()
+        self.status_bar.showMessage("Export cancelled")
+
+    def export_failed(self, message):
+        self.export_dialog.reset()
+        self.status_bar.showMessage("Export failed")
+        QMessageBox.critical(self, "Error", f"Failed to export: {message}")
     
     def clear_results(self):
         """Clear the results table"""
-        self.results_table.setRowCount(0)
+        self.results_model.clear()
         self.current_results = None
         self.status_bar.showMessage("Results cleared")
     
@@ -1218,33 +1821,43 @@ class GradeSparkGUI(QMainWindow):
     def save_settings(self):
         """Save current settings"""
         self.settings["show_rubric"] = self.rubric_checkbox.isChecked()
+        self.settings["per_student_seed"] = self.per_student_checkbox.isChecked()
+        self.settings.save()
+
+    def save_grading_seed(self):
+        """Persist the grading seed; blank means a fresh seed every run"""
+        text = self.seed_input.text().strip()
+        if not text:
+            self.settings["grading_seed"] = None
+        else:
+            try:
+                self.settings["grading_seed"] = int(text) & 0xFFFFFFFF
+            except ValueError:
+                self.status_bar.showMessage("Grading seed must be a whole number")
+                return
         self.settings.save()
     
     def toggle_dark_mode(self):
-        """Toggle dark mode theme"""
+        """Toggle dark mode theme; apply_theme runs as a settings subscriber"""
         self.settings["dark_mode_enabled"] = self.dark_mode_checkbox.isChecked()
         self.settings.save()
-        self.apply_theme()
-        QApplication.processEvents()  # Force UI refresh
-    
+
+    def set_rubric_column_visible(self, visible):
+        """Show or hide the Rubric column; the rows themselves are untouched"""
+        # An unbuilt Results Viewer picks the setting up when it is created
+        if RESULTS_TAB not in self._lazy_tabs:
+            self._results_table.setColumnHidden(RUBRIC_COLUMN, not visible)
+
     def apply_theme(self):
-        """Apply the selected theme"""
-        if self.settings.get("dark_mode_enabled", False):
-            # Apply dark theme - FIX PATH HERE
-            try:
-                with open(resource_path("styles_dark.qss"), "r") as f:
-                    self.setStyleSheet(f.read())
-            except:
-                # Fallback if file not found
-                self.setStyleSheet("")
-        else:
-            # Apply light theme - FIX PATH HERE
-            try:
-                with open(resource_path("styles.qss"), "r") as f:
-                    self.setStyleSheet(f.read())
-            except:
-                # Fallback if file not found
-                self.setStyleSheet("")
+        """Apply the selected theme; a no-op if it is already showing"""
+        dark = bool(self.settings.get("dark_mode_enabled", False))
+        if dark == self._applied_theme:
+            return
+        stylesheet, palette = load_theme(dark)
+        # Palette first: the stylesheet swap re-polishes every widget against it
+        QApplication.setPalette(palette)
+        self.setStyleSheet(stylesheet)
+        self._applied_theme = dark
 
         self.update_theme_dependent_styles()
 
@@ -1265,14 +1878,9 @@ class GradeSparkGUI(QMainWindow):
     
     def apply_saved_settings(self):
         """Apply saved settings on startup"""
-        # Apply theme
+        # Apply theme; the Settings and Results tabs read their settings when built
         if self.settings.get("dark_mode_enabled", False):
-            self.dark_mode_checkbox.setChecked(True)
             self.apply_theme()
-        
-        # Apply other settings
-        if not self.settings.get("show_rubric", True):
-            self.rubric_checkbox.setChecked(False)
 
     def maybe_start_guided_tour(self):
         """Show the guided tour on first launch of the community edition."""
@@ -1297,7 +1905,8 @@ class GradeSparkGUI(QMainWindow):
         # Save window geometry
         geometry_bytes = self.saveGeometry().toBase64().data().decode("utf-8")
         self.settings["window_geometry"] = geometry_bytes
-        self.settings.save()
+        self.settings.flush()
+        self.demo_manager.flush_index()
         event.accept()
 
     def update_theme_dependent_styles(self):
@@ -1327,4 +1936,6 @@ def main():
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
+    # Required for the batch process pool in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     main()
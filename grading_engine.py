@@ -0,0 +1,139 @@
+# grading_engine.py
+"""Qt-free simulated grading, shared by the GUI worker and batch processes."""
+import bisect
+import hashlib
+import os
+import zlib
+
+import numpy as np
+
+# --- Simulated grading templates (indexed by score band, lowest first) ---
+SCORE_BAND_EDGES = [70, 80, 90]
+FEEDBACK_TEMPLATES = (
+    "Needs improvement. Schedule extra help to strengthen {subject} fundamentals.",
+    "Satisfactory work. Review core {subject} concepts and practice application.",
+    "Good effort! Solid grasp of key {subject} concepts with room for deeper analysis.",
+    "Excellent work! Strong understanding of {subject} concepts at grade {grade_level} level.",
+)
+RUBRIC_TEMPLATES = (
+    "Content: Needs Work | Analysis: Needs Work | Presentation: Needs Work",
+    "Content: Satisfactory | Analysis: Needs Work | Presentation: Satisfactory",
+    "Content: Good | Analysis: Good | Presentation: Satisfactory",
+    "Content: Excellent | Analysis: Excellent | Presentation: Good",
+)
+SIMULATED_SCORE_RANGE = (70, 95)
+BATCH_BLOCK_ROWS = 50000
+
+
+def score_band(score):
+    """Return the template index for a simulated score."""
+    return bisect.bisect_right(SCORE_BAND_EDGES, score)
+
+
+def new_run_seed():
+    """Fresh 32-bit seed for runs without a configured one."""
+    return int.from_bytes(os.urandom(4), "little")
+
+
+def dataset_key(grade, subject, assignment):
+    return f"{grade}/{subject}/{assignment}"
+
+
+def dataset_seed(base_seed, grade, subject, assignment):
+    """Derive a stable per-dataset seed so batch order never affects results."""
+    key = dataset_key(grade, subject, assignment).encode("utf-8")
+    return int(np.random.SeedSequence([base_seed, zlib.crc32(key)]).generate_state(1)[0])
+
+
+def student_score(seed, key, student_name):
+    """Score derived only from run seed, dataset and student name.
+
+    Unlike a shared generator, this does not depend on row order, so a
+    student keeps their score when the roster is re-sorted or extended.
+    """
+    digest = hashlib.blake2b(
+        f"{seed}|{key}|{student_name}".encode("utf-8"), digest_size=8
+    ).digest()
+    low, high = SIMULATED_SCORE_RANGE
+    return low + int.from_bytes(digest, "little") % (high - low + 1)
+
+
+def simulate_frame(df, subject, grade_level, seed=None, per_student=False, key="",
+                   progress=None, on_block=None, rng=None):
+    """Vectorised grading of a whole DataFrame into a GradingResults.
+
+    Scores are drawn in one call per block (or derived per student when
+    ``per_student`` is set), bucketed with np.digitize and mapped onto the
+    feedback/rubric templates by index lookup. The same ``seed`` always
+    yields the same results. ``progress`` is called as
+    ``progress(pct, message)`` and ``on_block`` with each block's
+    GradingResults. Pass one ``rng`` to a run of calls (e.g. chunks of a
+    stream) to continue its draws instead of restarting from ``seed``.
+    """
+    import pandas as pd
+    from grading_results import GradingResults
+
+    if rng is None:
+        rng = np.random.default_rng(seed)
+    low, high = SIMULATED_SCORE_RANGE
+    # Code 0 of each categorical is the blank entry for non-submitters
+    feedback_categories = [""] + [
+        t.format(subject=subject, grade_level=grade_level) for t in FEEDBACK_TEMPLATES
+    ]
+    rubric_categories = [""] + list(RUBRIC_TEMPLATES)
+
+    total = len(df)
+    names = df["Student Name"].fillna("Unknown").astype(str).to_numpy(dtype=object)
+    missing = df["Score"].astype(str).str.contains("Not submitted", regex=False).to_numpy()
+    parts = []
+
+    for start in range(0, total, BATCH_BLOCK_ROWS):
+        stop = min(start + BATCH_BLOCK_ROWS, total)
+        block_missing = missing[start:stop]
+        if per_student:
+            scores = np.fromiter(
+                (student_score(seed, key, name) for name in names[start:stop]),
+                dtype=np.int64,
+                count=stop - start,
+            )
+        else:
+            scores = rng.integers(low, high + 1, size=stop - start)
+
+        codes = np.where(block_missing, 0, np.digitize(scores, SCORE_BAND_EDGES) + 1)
+        block = GradingResults(
+            names[start:stop],
+            np.where(block_missing, 0, scores),
+            ~block_missing,
+            pd.Categorical.from_codes(codes, categories=feedback_categories),
+            pd.Categorical.from_codes(codes, categories=rubric_categories),
+        )
+        parts.append(block)
+
+        if on_block is not None:
+            on_block(block)
+        if progress is not None:
+            progress(int(stop / total * 100), f"Grading {names[stop - 1]}...")
+
+    return GradingResults.concat(parts)
+
+
+def grade_dataset(csv_path, sidecar, grade, subject, assignment, seed, per_student=False):
+    """Grade one dataset file; runs in a worker process during batch mode.
+
+    Loads through the demo data loader, so the header is checked and a fresh
+    sidecar is used instead of the CSV. Returns ``(key, results, error)``;
+    an unreadable or malformed file gives ``results=None`` and an error
+    message rather than raising, so one bad file does not end the batch.
+    """
+    from demo_data_manager import read_dataset
+
+    key = (grade, subject, assignment)
+    try:
+        df = read_dataset(csv_path, sidecar)
+    except (OSError, ValueError) as e:
+        return key, None, str(e)
+    results = simulate_frame(
+        df, subject, grade, seed=seed, per_student=per_student,
+        key=dataset_key(grade, subject, assignment),
+    )
+    return key, results, None
@@ -0,0 +1,191 @@
+# grading_results.py
+"""Typed, columnar container for grading results."""
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from dataset_schema import MAX_SCORE, NOT_SUBMITTED, RESULT_COLUMNS
+from rubric_matrix import RubricMatrix
+
+
+def _score_array(scores, submitted):
+    """int16 scores, zero where nothing was submitted.
+
+    Submitted scores outside 0..MAX_SCORE raise ValueError rather than
+    wrapping around in the int16 cast.
+    """
+    raw = np.asarray(scores)
+    if not raw.size:
+        return raw.astype(np.int16)
+    graded = raw[submitted]
+    if graded.size:
+        low, high = graded.min(), graded.max()
+        if not (0 <= low and high <= MAX_SCORE):
+            bad = low if not 0 <= low else high
+            raise ValueError(f"Score {bad} is outside 0-{MAX_SCORE}")
+    return np.where(submitted, raw, 0).astype(np.int16)
+
+
+def _categorical(values):
+    if isinstance(values, pd.Categorical):
+        return values
+    return pd.Categorical(np.asarray(values, dtype=object))
+
+
+class GradingResults:
+    """Grading results held as typed columns instead of a list of dicts.
+
+    Scores are an int16 array paired with a boolean ``submitted`` mask
+    (a nullable integer column). Feedback, rubric and any extra columns
+    (e.g. Grade/Subject/Assignment from batch runs) are categoricals, so
+    each distinct string is stored once. Consumers read these arrays
+    directly; ``record``/``records`` rebuild the legacy dict rows on demand.
+
+    SCHEMA_VERSION is stored with pickled copies (see ResultsStore); bump it
+    whenever the attributes change.
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, names, scores, submitted, feedback, rubric, extra=None):
+        self.names = np.asarray(names, dtype=object)
+        self.submitted = np.asarray(submitted, dtype=bool)
+        self.scores = _score_array(scores, self.submitted)
+        self.feedback = _categorical(feedback)
+        self.rubric = _categorical(rubric)
+        self.extra = {name: _categorical(values) for name, values in (extra or {}).items()}
+        self._rubric_matrix = None
+
+    @classmethod
+    def empty(cls):
+        return cls([], [], [], [], [])
+
+    @classmethod
+    def from_records(cls, records):
+        """Build from legacy row dicts ('Score' may be 'Not submitted')."""
+        records = list(records)
+        raw_scores = pd.to_numeric(
+            pd.Series([r.get("Score") for r in records], dtype=object), errors="coerce"
+        )
+        extra_columns = [key for key in (records[0] if records else {}) if key not in RESULT_COLUMNS]
+        return cls(
+            [r.get("Student Name", "") for r in records],
+            raw_scores.fillna(0).to_numpy(),
+            raw_scores.notna().to_numpy(),
+            [r.get("Feedback", "") for r in records],
+            [r.get("Rubric", "") for r in records],
+            extra={key: [r.get(key, "") for r in records] for key in extra_columns},
+        )
+
+    @classmethod
+    def concat(cls, parts):
+        parts = [part for part in parts if len(part)]
+        if not parts:
+            return cls.empty()
+        if len(parts) == 1:
+            return parts[0]
+
+        def _union(values):
+            return union_categoricals(values, ignore_order=True)
+
+        extra_columns = list(parts[0].extra)
+        return cls(
+            np.concatenate([part.names for part in parts]),
+            np.concatenate([part.scores for part in parts]),
+            np.concatenate([part.submitted for part in parts]),
+            _union([part.feedback for part in parts]),
+            _union([part.rubric for part in parts]),
+            extra={
+                name: _union([part.extra[name] for part in parts]) for name in extra_columns
+            },
+        )
+
+    def rubric_matrix(self):
+        """Criterion x level view of the Rubric column, parsed on first use."""
+        if self._rubric_matrix is None:
+            self._rubric_matrix = RubricMatrix.from_column(self.rubric)
+        return self._rubric_matrix
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def columns(self):
+        return RESULT_COLUMNS + list(self.extra)
+
+    @property
+    def submitted_count(self):
+        return int(self.submitted.sum())
+
+    @property
+    def missing_count(self):
+        return len(self) - self.submitted_count
+
+    def with_columns(self, **constants):
+        """Copy with extra constant columns, e.g. Grade="7" for batch runs."""
+        extra = dict(self.extra)
+        for name, value in constants.items():
+            extra[name] = pd.Categorical.from_codes(
+                np.zeros(len(self), dtype=np.int8), categories=[str(value)]
+            )
+        return GradingResults(
+            self.names, self.scores, self.submitted, self.feedback, self.rubric, extra
+        )
+
+    def slice(self, start, stop):
+        return GradingResults(
+            self.names[start:stop],
+            self.scores[start:stop],
+            self.submitted[start:stop],
+            self.feedback[start:stop],
+            self.rubric[start:stop],
+            extra={name: values[start:stop] for name, values in self.extra.items()},
+        )
+
+    def score_text(self, row):
+        return str(int(self.scores[row])) if self.submitted[row] else NOT_SUBMITTED
+
+    def record(self, row):
+        result = {
+            "Student Name": self.names[row],
+            "Score": self.score_text(row),
+            "Feedback": self.feedback[row],
+            "Rubric": self.rubric[row],
+        }
+        for name, values in self.extra.items():
+            result[name] = values[row]
+        return result
+
+    def records(self, start=0, stop=None):
+        """Legacy dict rows for a slice, built column-wise."""
+        part = self.slice(start, len(self) if stop is None else stop)
+        score_text = np.where(
+            part.submitted, part.scores.astype(str), NOT_SUBMITTED
+        ).astype(object)
+        columns = [part.names, score_text, np.asarray(part.feedback, dtype=object),
+                   np.asarray(part.rubric, dtype=object)]
+        columns += [np.asarray(values, dtype=object) for values in part.extra.values()]
+        return [dict(zip(self.columns, values)) for values in zip(*columns)]
+
+    def to_frame(self):
+        """Typed DataFrame: nullable Int16 Score, categorical text columns."""
+        frame = pd.DataFrame({
+            "Student Name": self.names,
+            "Score": pd.arrays.IntegerArray(self.scores, ~self.submitted),
+            "Feedback": self.feedback,
+            "Rubric": self.rubric,
+        })
+        for name, values in self.extra.items():
+            frame[name] = values
+        return frame
+
+    def memory_usage(self):
+        """Approximate bytes held, including the name strings.
+
+        Measured on the arrays themselves: to_frame() may convert the names
+        to a more compact string dtype than the object array kept here.
+        """
+        names = pd.Series(self.names, dtype=object).memory_usage(deep=True, index=False)
+        categoricals = [self.feedback, self.rubric, *self.extra.values()]
+        return int(names + self.scores.nbytes + self.submitted.nbytes
+                   + sum(values.memory_usage(deep=True) for values in categoricals))
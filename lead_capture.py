@@ -0,0 +1,323 @@
+# lead_capture.py
+"""Full-version lead capture dialog, imported only when a locked feature is clicked."""
+import json
+import logging
+import os
+import platform
+import threading
+import urllib.request
+from datetime import datetime
+from pathlib import Path
+
+from PyQt5.QtCore import QStandardPaths, Qt
+from PyQt5.QtWidgets import (
+    QComboBox, QDialog, QFormLayout, QFrame, QLabel, QLineEdit, QMessageBox, QPushButton,
+    QVBoxLayout, QWidget
+)
+
+
+class LeadCaptureDialog(QDialog):
+    def __init__(self, parent=None, feature_name="Premium Feature"):
+        super().__init__(parent)
+        self.feature_name = feature_name
+        self.webhook_url = os.environ.get(
+            "GRADESPARK_LEAD_WEBHOOK",
+            "https://hook.us2.make.com/3tsoiux2mb2pvmd9jh74mf45yfmvljlu"
+        )
+        self.setWindowTitle(f"{feature_name} - Full Version Only")
+        self.setModal(True)
+        self.setMinimumWidth(700)
+        self.setMinimumHeight(600)
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setAlignment(Qt.AlignCenter)
+
+        container = QFrame()
+        container.setObjectName("leadCaptureContainer")
+        container.setMaximumWidth(600)
+        container_layout = QVBoxLayout(container)
+
+        is_dark_mode = False
+        if hasattr(self.parent(), "settings"):
+            is_dark_mode = self.parent().settings.get("dark_mode_enabled", False)
+
+        lock_icon = QLabel("🔒")
+        lock_icon.setAlignment(Qt.AlignCenter)
+        lock_icon.setStyleSheet("font-size: 64px;")
+        container_layout.addWidget(lock_icon)
+
+        if "Google Classroom" in self.feature_name:
+            title_text = "Google Classroom Integration"
+            subtitle_text = "Full Version Only"
+        else:
+            title_text = self.feature_name
+            subtitle_text = "Full Version Only"
+
+        title = QLabel(title_text)
+        title.setAlignment(Qt.AlignCenter)
+        title.setStyleSheet("font-size: 22px; font-weight: bold; color: #1e66ff;")
+        container_layout.addWidget(title)
+
+        subtitle = QLabel(subtitle_text)
+        subtitle.setAlignment(Qt.AlignCenter)
+        subtitle.setStyleSheet("font-size: 18px; font-weight: 600; color: #666;")
+        container_layout.addWidget(subtitle)
+
+        desc = QLabel(
+            "This feature is available in the full version of GradeSpark.\n"
+            "Be among the first teachers to revolutionize your grading workflow!"
+        )
+        desc.setAlignment(Qt.AlignCenter)
+        desc.setWordWrap(True)
+        desc.setStyleSheet(
+            "font-size: 16px; "
+            + ("color: #B0B0B0; margin: 20px 0;" if is_dark_mode else "color: #666; margin: 20px 0;")
+        )
+        container_layout.addWidget(desc)
+
+        if is_dark_mode:
+            container.setStyleSheet(
+                """
+                QFrame#leadCaptureContainer {
+                    background-color: rgba(40, 40, 45, 0.95);
+                    border-radius: 12px;
+                    padding: 40px;
+                }
+                QFrame#leadCaptureContainer QLabel {
+                    color: #E0E0E0;
+                }
+                QLineEdit, QComboBox {
+                    background-color: #2C2C30;
+                    color: #E0E0E0;
+                    border: 1px solid #444;
+                    padding: 8px;
+                    border-radius: 4px;
+                }
+                QLineEdit:focus, QComboBox:focus {
+                    border: 1px solid #1e66ff;
+                }
+                QComboBox::drop-down {
+                    border: none;
+                    width: 20px;
+                }
+                QComboBox::down-arrow {
+                    image: url(:/assets/chevron-down-dark.svg);
+                    width: 12px;
+                    height: 12px;
+                }
+                QComboBox QAbstractItemView {
+                    background-color: #2C2C30;
+                    color: #E0E0E0;
+                    selection-background-color: #1e66ff;
+                    selection-color: white;
+                    border: 1px solid #444;
+                }
+            """
+            )
+        else:
+            container.setStyleSheet(
+                """
+                QFrame#leadCaptureContainer {
+                    background-color: rgba(255, 255, 255, 0.95);
+                    border-radius: 12px;
+                    padding: 40px;
+                }
+                QLineEdit, QComboBox {
+                    background-color: white;
+                    color: #333333;
+                    border: 1px solid #DDD;
+                    padding: 8px;
+                    border-radius: 4px;
+                }
+                QLineEdit:focus, QComboBox:focus {
+                    border: 1px solid #1e66ff;
+                }
+                QComboBox::drop-down {
+                    border: none;
+                    width: 20px;
+                }
+                QComboBox::down-arrow {
+                    image: url(:/assets/chevron-down.svg);
+                    width: 12px;
+                    height: 12px;
+                }
+                QComboBox QAbstractItemView {
+                    background-color: white;
+                    color: #333333;
+                    selection-background-color: #1e66ff;
+                    selection-color: white;
+                    border: 1px solid #DDD;
+                }
+            """
+            )
+
+        form_widget = QWidget()
+        form_layout = QFormLayout(form_widget)
+        form_layout.setSpacing(15)
+
+        label_style = "color: #666;" if not is_dark_mode else "color: #999;"
+
+        self.name_input = QLineEdit()
+        self.name_input.setPlaceholderText("John Doe")
+        name_label = QLabel("Name:")
+        name_label.setStyleSheet(label_style)
+        form_layout.addRow(name_label, self.name_input)
+
+        self.email_input = QLineEdit()
+        self.email_input.setPlaceholderText("teacher@school.edu")
+        email_label = QLabel("Email:")
+        email_label.setStyleSheet(label_style)
+        form_layout.addRow(email_label, self.email_input)
+
+        self.school_input = QLineEdit()
+        self.school_input.setPlaceholderText("Lincoln Middle School")
+        school_label = QLabel("School/District:")
+        school_label.setStyleSheet(label_style)
+        form_layout.addRow(school_label, self.school_input)
+
+        self.role_combo = QComboBox()
+        self.role_combo.addItems(["I'm a Teacher", "I'm a School Administrator"])
+        role_label = QLabel("Role:")
+        role_label.setStyleSheet(label_style)
+        form_layout.addRow(role_label, self.role_combo)
+
+        self.size_combo = QComboBox()
+        self.size_combo.addItems([
+            "Just me (1 teacher)",
+            "Small team (2-5 teachers)",
+            "Department (6-20 teachers)",
+            "School-wide (20+ teachers)"
+        ])
+        size_label = QLabel("Team Size:")
+        size_label.setStyleSheet(label_style)
+        form_layout.addRow(size_label, self.size_combo)
+
+        self.timeline_combo = QComboBox()
+        self.timeline_combo.addItems([
+            "Ready now",
+            "This semester",
+            "Next school year",
+            "Just exploring"
+        ])
+        timeline_label = QLabel("Timeline:")
+        timeline_label.setStyleSheet(label_style)
+        form_layout.addRow(timeline_label, self.timeline_combo)
+
+        container_layout.addWidget(form_widget)
+
+        self.submit_btn = QPushButton("Get Early Access")
+        self.submit_btn.setObjectName("primaryButton")
+        self.submit_btn.clicked.connect(self.submit_lead)
+        container_layout.addWidget(self.submit_btn)
+
+        privacy = QLabel("We'll only use your email to send you updates about GradeSpark.")
+        privacy.setAlignment(Qt.AlignCenter)
+        privacy.setStyleSheet(
+            "font-size: 12px; "
+            + ("color: #888; margin-top: 10px;" if is_dark_mode else "color: #999; margin-top: 10px;")
+        )
+        container_layout.addWidget(privacy)
+
+        layout.addWidget(container)
+
+    def submit_lead(self):
+        """Validate input, queue background send, and thank the user"""
+        name = self.name_input.text().strip()
+        email = self.email_input.text().strip()
+        school = self.school_input.text().strip()
+
+        if not name or not email or not school:
+            QMessageBox.warning(
+                self,
+                "Incomplete Form",
+                "Please fill in all required fields (Name, Email, School)"
+            )
+            return
+
+        lead_payload = {
+            "name": name,
+            "email": email,
+            "school": school,
+            "role": self.role_combo.currentText(),
+            "size": self.size_combo.currentText(),
+            "timeline": self.timeline_combo.currentText(),
+            "feature": self.feature_name,
+            "timestamp": datetime.now().isoformat(),
+            "platform": platform.system()
+        }
+
+        self.send_to_webhook(lead_payload)
+        self._reset_form()
+
+        QMessageBox.information(
+            self,
+            "Thanks!",
+            f"Thanks {name}! We'll be in touch soon about early access to {self.feature_name}."
+        )
+        self.accept()
+
+    def _reset_form(self):
+        self.name_input.clear()
+        self.email_input.clear()
+        self.school_input.clear()
+        self.role_combo.setCurrentIndex(0)
+        self.size_combo.setCurrentIndex(0)
+        self.timeline_combo.setCurrentIndex(0)
+
+    def send_to_webhook(self, payload):
+        """Send lead data asynchronously"""
+
+        def _post_lead(data):
+            try:
+                json_bytes = json.dumps(data).encode("utf-8")
+                request = urllib.request.Request(
+                    self.webhook_url,
+                    data=json_bytes,
+                    headers={"Content-Type": "application/json"}
+                )
+
+                with urllib.request.urlopen(request, timeout=5) as response:
+                    if 200 <= response.status < 300:
+                        logging.info("Lead sent successfully: %s", data.get("email"))
+                        return
+                    logging.warning(
+                        "Lead webhook returned status %s for %s",
+                        response.status,
+                        data.get("email")
+                    )
+            except Exception as exc:  # noqa: BLE001 - log and fall back
+                logging.debug("Lead webhook failed: %s", exc)
+            self.save_lead_locally(data)
+
+        threading.Thread(target=_post_lead, args=(payload,), daemon=True).start()
+
+    def save_lead_locally(self, lead_data):
+        """Persist lead details in the user's application data folder."""
+        try:
+            target_dir = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+            if not target_dir:
+                target_dir = str(Path.home() / ".gradespark")
+
+            storage_path = Path(target_dir)
+            storage_path.mkdir(parents=True, exist_ok=True)
+
+            leads_file = storage_path / "leads_backup.json"
+            existing_leads = []
+
+            if leads_file.exists():
+                try:
+                    with leads_file.open("r", encoding="utf-8") as handle:
+                        existing_leads = json.load(handle)
+                except json.JSONDecodeError:
+                    logging.warning("Failed to decode existing lead backup; starting fresh.")
+
+            existing_leads.append(lead_data)
+
+            with leads_file.open("w", encoding="utf-8") as handle:
+                json.dump(existing_leads, handle, indent=2)
+
+            logging.info("Lead saved locally: %s", lead_data.get("email"))
+        except Exception as exc:  # noqa: BLE001 - capture unexpected filesystem issues
+            logging.error("Failed to save lead locally: %s", exc)
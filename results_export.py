@@ -0,0 +1,174 @@
+# results_export.py
+"""Background export of grading results."""
+import csv
+import gzip
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from atomic_file import create_temp_beside
+
+EXPORT_CHUNK_ROWS = 5000
+
+# (suffix, file-dialog filter) pairs; longer suffixes are matched first
+EXPORT_FORMATS = (
+    (".csv.gz", "Compressed CSV (*.csv.gz)"),
+    (".csv.zst", "Zstandard CSV (*.csv.zst)"),
+    (".jsonl", "JSON Lines (*.jsonl)"),
+    (".parquet", "Parquet (*.parquet)"),
+    (".csv", "CSV Files (*.csv)"),
+)
+EXPORT_FILE_FILTER = ";;".join(
+    label for _, label in sorted(EXPORT_FORMATS, key=lambda item: item[0] != ".csv")
+)
+CATEGORICAL_COLUMNS = ("Feedback", "Rubric", "Grade", "Subject", "Assignment")
+
+
+def export_format_for(file_path):
+    """Return the export suffix matching a file name, or None."""
+    name = str(file_path).lower()
+    for suffix, _ in EXPORT_FORMATS:
+        if name.endswith(suffix):
+            return suffix
+    if name.endswith(".ndjson"):
+        return ".jsonl"
+    return None
+
+
+def suffix_for_filter(selected_filter):
+    for suffix, label in EXPORT_FORMATS:
+        if label == selected_filter:
+            return suffix
+    return ".csv"
+
+
+def _open_zstd(path, mode, **kwargs):
+    try:
+        from compression import zstd  # Python 3.14+
+        return zstd.open(path, mode, **kwargs)
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError as e:
+        raise RuntimeError("Zstandard export requires the 'zstandard' package") from e
+    return zstandard.open(path, mode, **kwargs)
+
+
+class ExportCancelled(Exception):
+    pass
+
+
+class ExportWorker(QObject):
+    """Write results in chunks to a temp file, then rename it into place.
+
+    An interrupted or cancelled export never leaves a half-written file at
+    the destination path.
+    """
+    progress = pyqtSignal(int, str)
+    finished = pyqtSignal(str)
+    cancelled = pyqtSignal()
+    error = pyqtSignal(str)
+
+    def __init__(self, results, file_path, chunk_rows=EXPORT_CHUNK_ROWS):
+        super().__init__()
+        self.results = results
+        self.file_path = Path(file_path)
+        self.export_format = export_format_for(file_path) or ".csv"
+        self.chunk_rows = chunk_rows
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        """Thread-safe; connect with Qt.DirectConnection while run() is busy."""
+        self._cancel.set()
+
+    def run(self):
+        tmp_path = None
+        try:
+            # Created with the overwritten file's mode, or 0666 less the umask
+            fd, tmp_name = create_temp_beside(self.file_path, suffix=".part")
+            os.close(fd)
+            tmp_path = Path(tmp_name)
+            self._write(tmp_path)
+            os.replace(tmp_path, self.file_path)
+            tmp_path = None
+        except ExportCancelled:
+            logging.info("Export to %s cancelled", self.file_path)
+            self.cancelled.emit()
+            return
+        except Exception as e:  # noqa: BLE001 - report any filesystem failure
+            logging.error("Failed to export results to %s: %s", self.file_path, e)
+            self.error.emit(str(e))
+            return
+        finally:
+            if tmp_path is not None and tmp_path.exists():
+                tmp_path.unlink()
+        self.finished.emit(str(self.file_path))
+
+    def _chunks(self):
+        """Yield row slices, honouring cancellation and reporting progress."""
+        total = len(self.results)
+        for start in range(0, total, self.chunk_rows):
+            if self._cancel.is_set():
+                raise ExportCancelled()
+            stop = min(start + self.chunk_rows, total)
+            yield self.results.slice(start, stop)
+            self.progress.emit(int(stop / total * 100), f"Exported {stop} of {total} rows")
+
+    def _write(self, path):
+        if self.export_format == ".parquet":
+            self._write_parquet(path)
+            return
+        if self.export_format == ".csv.gz":
+            opener = gzip.open
+        elif self.export_format == ".csv.zst":
+            opener = _open_zstd
+        else:
+            opener = open
+        with opener(path, "wt", encoding="utf-8", newline="") as handle:
+            if self.export_format == ".jsonl":
+                self._write_jsonl(handle)
+            else:
+                self._write_csv(handle)
+
+    def _write_csv(self, handle):
+        writer = csv.DictWriter(
+            handle, fieldnames=self.results.columns, lineterminator=os.linesep, extrasaction="ignore"
+        )
+        writer.writeheader()
+        for chunk in self._chunks():
+            writer.writerows(chunk.records())
+
+    def _write_jsonl(self, handle):
+        for chunk in self._chunks():
+            handle.write(
+                "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in chunk.records())
+            )
+
+    def _write_parquet(self, path):
+        """One row group per chunk: nullable int Score, dictionary-encoded text."""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise RuntimeError("Parquet export requires the 'pyarrow' package") from e
+
+        fieldnames = self.results.columns
+        schema = pa.schema([
+            (
+                name,
+                pa.int32() if name == "Score"
+                else pa.dictionary(pa.int32(), pa.string()) if name in CATEGORICAL_COLUMNS
+                else pa.string(),
+            )
+            for name in fieldnames
+        ])
+        with pq.ParquetWriter(str(path), schema) as writer:
+            for chunk in self._chunks():
+                frame = chunk.to_frame()
+                frame["Score"] = frame["Score"].astype("Int32")
+                writer.write_table(pa.Table.from_pandas(frame, schema=schema, preserve_index=False))
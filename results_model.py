@@ -0,0 +1,141 @@
+# results_model.py
+"""Model/view backing for the Results Viewer table."""
+import bisect
+
+import numpy as np
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt5.QtGui import QBrush, QColor
+
+from dataset_schema import (
+    BUCKET_FAILING, BUCKET_MISSING, BUCKET_TEXT_COLORS, BUCKET_UPPER_BOUNDS,
+    RESULT_COLUMNS,
+)
+
+SCORE_COLUMN = RESULT_COLUMNS.index("Score")
+FEEDBACK_COLUMN = RESULT_COLUMNS.index("Feedback")
+RUBRIC_COLUMN = RESULT_COLUMNS.index("Rubric")
+
+
+def classify_results(results):
+    """Bucket a GradingResults straight from its typed score/submitted arrays."""
+    buckets = np.digitize(results.scores, BUCKET_UPPER_BOUNDS, right=True) + BUCKET_FAILING
+    return np.where(results.submitted, buckets, BUCKET_MISSING).astype(np.int8)
+
+
+class ResultsTableModel(QAbstractTableModel):
+    """Table model over a GradingResults; cells are formatted on demand in data().
+
+    Only rows the view actually paints cost anything, so loading a result
+    set allocates no per-cell objects. Streamed results are kept as the
+    parts they arrived in, located by row offset, and only concatenated
+    when the whole set is asked for, so each append costs O(part).
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Empty until the first results arrive, so building the view needs no pandas
+        self._parts = []
+        self._bucket_parts = []
+        self._starts = []
+        self._rows = 0
+        self._bucket_counts = np.zeros(len(BUCKET_TEXT_COLORS), dtype=np.int64)
+        self._bucket_brushes = [QBrush(QColor(color)) for color in BUCKET_TEXT_COLORS]
+
+    def set_results(self, results):
+        self.beginResetModel()
+        self._parts, self._bucket_parts, self._starts = [], [], []
+        self._rows = 0
+        self._bucket_counts[:] = 0
+        if results is not None:
+            self._add_part(results)
+        self.endResetModel()
+
+    def append_results(self, results):
+        """Insert rows at the end without resetting the view."""
+        if not len(results):
+            return
+        first = self._rows
+        self.beginInsertRows(QModelIndex(), first, first + len(results) - 1)
+        self._add_part(results)
+        self.endInsertRows()
+
+    def results(self):
+        """The GradingResults on display, or None before any arrive."""
+        if not self._parts:
+            return None
+        if len(self._parts) > 1:
+            from grading_results import GradingResults
+            self._parts = [GradingResults.concat(self._parts)]
+            self._bucket_parts = [np.concatenate(self._bucket_parts)]
+            self._starts = [0]
+        return self._parts[0]
+
+    def row_dict(self, row):
+        part, offset = self._locate(row)
+        return self._parts[part].record(offset)
+
+    def bucket_counts(self):
+        """Rows per bucket, indexed by the BUCKET_* constants."""
+        return self._bucket_counts.copy()
+
+    def names_in_bucket(self, bucket, limit=None):
+        names = []
+        for part, buckets in zip(self._parts, self._bucket_parts):
+            rows = np.flatnonzero(buckets == bucket)
+            names.extend(part.names[rows[:None if limit is None else limit - len(names)]])
+            if limit is not None and len(names) >= limit:
+                break
+        return names
+
+    def clear(self):
+        self.set_results(None)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._rows
+
+    def columns(self):
+        """Dataset columns plus any extras, e.g. Grade/Subject/Assignment from batch runs."""
+        return self._parts[0].columns if self._parts else RESULT_COLUMNS
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns())
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        column = index.column()
+        if role == Qt.DisplayRole:
+            part, row = self._locate(index.row())
+            results = self._parts[part]
+            if column == SCORE_COLUMN:
+                return results.score_text(row)
+            if column == RUBRIC_COLUMN:
+                return results.rubric[row]
+            if column == FEEDBACK_COLUMN:
+                return results.feedback[row]
+            if column >= len(RESULT_COLUMNS):
+                return results.extra[self.columns()[column]][row]
+            return str(results.names[row])
+        if role == Qt.ForegroundRole and column == SCORE_COLUMN:
+            part, row = self._locate(index.row())
+            return self._bucket_brushes[self._bucket_parts[part][row]]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.columns()[section]
+        return super().headerData(section, orientation, role)
+
+    # --- Internal helpers ---
+    def _add_part(self, results):
+        buckets = classify_results(results)
+        self._parts.append(results)
+        self._bucket_parts.append(buckets)
+        self._starts.append(self._rows)
+        self._rows += len(results)
+        self._bucket_counts += np.bincount(buckets, minlength=len(BUCKET_TEXT_COLORS))
+
+    def _locate(self, row):
+        """(part index, row within that part) for a model row."""
+        part = bisect.bisect_right(self._starts, row) - 1
+        return part, row - self._starts[part]
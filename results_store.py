@@ -0,0 +1,191 @@
+# results_store.py
+"""Memoised grading results keyed by dataset content and grading parameters."""
+import hashlib
+import json
+import logging
+import pickle
+import sqlite3
+import time
+import zlib
+from collections import OrderedDict
+
+DEFAULT_MAX_ROWS = 500000
+DEFAULT_MAX_DISK_BYTES = 256 * 1024 * 1024
+
+
+def make_results_key(content_hash, **params):
+    """Combine a dataset content hash with the parameters that shape results."""
+    blob = json.dumps({"content": content_hash, **params}, sort_keys=True, default=str)
+    return hashlib.blake2b(blob.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class ResultsStore:
+    """LRU store of GradingResults, with an optional SQLite tier behind it.
+
+    The in-memory tier is bounded by total rows; the disk tier by payload
+    bytes. Disk hits are promoted back into memory.
+    """
+
+    def __init__(self, max_rows=DEFAULT_MAX_ROWS, db_path=None,
+                 max_disk_bytes=DEFAULT_MAX_DISK_BYTES):
+        self.max_rows = max_rows
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.misses = 0
+        self.current_rows = 0
+        self._entries = OrderedDict()
+        self._db = None
+        if db_path:
+            self._open_db(db_path)
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry["results"]
+
+        results = self._db_get(key)
+        if results is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._remember(key, results)
+        return results
+
+    def put(self, key, results, label=""):
+        self._remember(key, results, label)
+        self._db_put(key, results, label)
+
+    def clear(self):
+        self._entries.clear()
+        self.current_rows = 0
+        if self._db is not None:
+            with self._db:
+                self._db.execute("DELETE FROM results")
+
+    def stats(self):
+        stats = {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "rows": self.current_rows,
+            "max_rows": self.max_rows,
+        }
+        if self._db is not None:
+            count, size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(payload)), 0) FROM results"
+            ).fetchone()
+            stats.update({"disk_entries": count, "disk_bytes": size})
+        return stats
+
+    def entries(self):
+        """Describe stored result sets, most recently used first."""
+        listing = [
+            {"key": key, "label": entry["label"], "rows": len(entry["results"]), "tier": "memory"}
+            for key, entry in reversed(self._entries.items())
+        ]
+        if self._db is not None:
+            in_memory = set(self._entries)
+            for key, label, rows in self._db.execute(
+                "SELECT key, label, rows FROM results ORDER BY last_used DESC"
+            ):
+                if key not in in_memory:
+                    listing.append({"key": key, "label": label, "rows": rows, "tier": "disk"})
+        return listing
+
+    # --- Internal helpers ---
+    def _remember(self, key, results, label=None):
+        if len(results) > self.max_rows:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.current_rows -= len(previous["results"])
+            if label is None:
+                label = previous["label"]
+        self._entries[key] = {"results": results, "label": label or ""}
+        self.current_rows += len(results)
+        while self.current_rows > self.max_rows and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self.current_rows -= len(evicted["results"])
+
+    def _open_db(self, db_path):
+        try:
+            self._db = sqlite3.connect(str(db_path))
+            with self._db:
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS results ("
+                    "key TEXT PRIMARY KEY, label TEXT, rows INTEGER, "
+                    "last_used REAL, payload BLOB)"
+                )
+        except sqlite3.Error as e:
+            logging.error("Could not open results cache %s: %s", db_path, e)
+            self._db = None
+
+    def _db_get(self, key):
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute("SELECT payload FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            with self._db:
+                self._db.execute(
+                    "UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key)
+                )
+        except sqlite3.Error as e:
+            logging.error("Failed to read cached results %s: %s", key, e)
+            return None
+        # Deferred: grading_results pulls in pandas
+        from grading_results import GradingResults
+        try:
+            payload = pickle.loads(zlib.decompress(row[0]))
+            if payload.get("version") != GradingResults.SCHEMA_VERSION:
+                raise ValueError(f"schema version {payload.get('version')!r}")
+            return payload["results"]
+        except Exception as e:  # noqa: BLE001 - stale pickles fail in many ways
+            # Written by an older GradingResults; treat as a miss and drop it
+            logging.warning("Discarding unreadable cached results %s: %s", key, e)
+            self._db_delete(key)
+            return None
+
+    def _db_delete(self, key):
+        try:
+            with self._db:
+                self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            logging.error("Failed to delete cached results %s: %s", key, e)
+
+    def _db_put(self, key, results, label):
+        if self._db is None:
+            return
+        from grading_results import GradingResults
+        try:
+            payload = zlib.compress(pickle.dumps(
+                {"version": GradingResults.SCHEMA_VERSION, "results": results},
+                protocol=pickle.HIGHEST_PROTOCOL,
+            ))
+            if len(payload) > self.max_disk_bytes:
+                return
+            with self._db:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                    (key, label, len(results), time.time(), payload),
+                )
+                self._evict_disk()
+        except sqlite3.Error as e:
+            logging.error("Failed to store cached results %s: %s", key, e)
+
+    def _evict_disk(self):
+        total = self._db.execute(
+            "SELECT COALESCE(SUM(LENGTH(payload)), 0) FROM results"
+        ).fetchone()[0]
+        if total <= self.max_disk_bytes:
+            return
+        for key, size in self._db.execute(
+            "SELECT key, LENGTH(payload) FROM results ORDER BY last_used ASC"
+        ).fetchall():
+            self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_disk_bytes:
+                break
@@ -0,0 +1,104 @@
+# rubric_matrix.py
+"""Structured view of free-text rubric strings.
+
+Rubrics arrive as e.g. ``Correctness → Excellent | Method → Advanced`` (demo
+CSVs) or ``Content: Good | Analysis: Good`` (simulated grading). A column
+rarely holds more than a handful of distinct strings, so each distinct
+string is parsed once and the result is broadcast to every row.
+"""
+import numpy as np
+import pandas as pd
+
+CRITERION_SEPARATOR = "|"
+LEVEL_SEPARATORS = ("→", ":")
+MISSING_LEVEL = -1
+
+# Known levels, weakest first; anything else is appended in order of appearance
+RUBRIC_LEVEL_ORDER = (
+    "Needs Work",
+    "Needs Improvement",
+    "Developing",
+    "Satisfactory",
+    "Proficient",
+    "Good",
+    "Advanced",
+    "Excellent",
+)
+WEAK_LEVELS = frozenset(("Needs Work", "Needs Improvement", "Developing"))
+
+
+def split_rubric(text):
+    """Split one rubric string into (criterion, level) pairs."""
+    pairs = []
+    for part in str(text).split(CRITERION_SEPARATOR):
+        for separator in LEVEL_SEPARATORS:
+            criterion, found, level = part.partition(separator)
+            if found:
+                pairs.append((criterion.strip(), level.strip()))
+                break
+    return pairs
+
+
+class RubricMatrix:
+    """Criterion x level matrix for a rubric column.
+
+    ``codes[row, column]`` indexes into ``levels`` for criterion
+    ``criteria[column]``, or is MISSING_LEVEL when the row has no rating
+    for that criterion (e.g. nothing was submitted).
+    """
+
+    def __init__(self, criteria, levels, codes):
+        self.criteria = list(criteria)
+        self.levels = list(levels)
+        self.codes = codes
+
+    @classmethod
+    def from_column(cls, rubrics):
+        """Parse a rubric column (Series, Categorical or sequence of strings)."""
+        if isinstance(rubrics, pd.Series) and isinstance(rubrics.dtype, pd.CategoricalDtype):
+            rubrics = rubrics.array
+        if isinstance(rubrics, pd.Categorical):
+            row_codes, uniques = rubrics.codes, list(rubrics.categories)
+        else:
+            row_codes, uniques = pd.factorize(pd.Series(rubrics, dtype=object), sort=False)
+            uniques = list(uniques)
+
+        parsed = [split_rubric(text) for text in uniques]
+        criteria = list(dict.fromkeys(criterion for pairs in parsed for criterion, _ in pairs))
+        seen = set(level for pairs in parsed for _, level in pairs)
+        levels = [level for level in RUBRIC_LEVEL_ORDER if level in seen]
+        levels += sorted(seen.difference(levels))
+
+        criterion_index = {criterion: i for i, criterion in enumerate(criteria)}
+        level_index = {level: i for i, level in enumerate(levels)}
+        # One row per distinct string, plus a trailing all-missing row for NaN codes
+        unique_codes = np.full((len(uniques) + 1, len(criteria)), MISSING_LEVEL, dtype=np.int8)
+        for row, pairs in enumerate(parsed):
+            for criterion, level in pairs:
+                unique_codes[row, criterion_index[criterion]] = level_index[level]
+        return cls(criteria, levels, unique_codes[np.asarray(row_codes)])
+
+    def __len__(self):
+        return len(self.codes)
+
+    def level_counts(self):
+        """Criterion x level DataFrame of how many students landed at each level."""
+        counts = np.zeros((len(self.criteria), len(self.levels)), dtype=np.int64)
+        for column in range(len(self.criteria)):
+            rated = self.codes[:, column]
+            counts[column] = np.bincount(rated[rated >= 0], minlength=len(self.levels))
+        return pd.DataFrame(counts, index=self.criteria, columns=self.levels)
+
+    def level_distribution(self):
+        """Like level_counts, normalised to the share of rated students per criterion."""
+        counts = self.level_counts()
+        totals = counts.sum(axis=1).replace(0, np.nan)
+        return counts.div(totals, axis=0).fillna(0.0)
+
+    def weaknesses(self):
+        """Share of rated students at a weak level per criterion, weakest first."""
+        if not self.criteria:
+            return pd.Series(dtype=float)
+        weak = [level in WEAK_LEVELS for level in self.levels]
+        shares = self.level_distribution().loc[:, weak].sum(axis=1)
+        return shares.sort_values(ascending=False, kind="stable")
@@ -1,11 +1,37 @@
 # settings_store.py
+import atexit
 import os
 import json
 import logging
+import threading
+
+from atomic_file import create_temp_beside
+
+# Seconds a write-behind store waits for more changes before writing
+WRITE_BEHIND_DELAY = 0.5
+
 
 class SettingsStore:
-    def __init__(self, filename="settings.json"):
+    """Settings dict persisted to JSON.
+
+    subscribe() registers a callback for one key; it is called with the new
+    value, on the thread that set it, whenever that value changes.
+
+    save() is a no-op unless a value actually changed. With write_delay set,
+    save() only schedules the write: every change made within the delay is
+    written once, from a background thread. Writes go to a temp file that
+    replaces settings.json, so a crash never leaves it truncated.
+    """
+
+    def __init__(self, filename="settings.json", write_delay=None):
         self.filepath = filename
+        self.write_delay = write_delay
+        self._dirty = False
+        self._timer = None
+        self._subscribers = {}
+        # _lock guards the dict and timer; _write_lock keeps writes in order
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
         self.defaults = {
             "api_key": "",
             "show_rubric_categories": True,
@@ -15,10 +41,20 @@ class SettingsStore:
             "last_selection": {"grade": "", "subject": "", "assignment": ""},
             "env_imported": False,
             "window_geometry": None,
-            "tour_completed": False
+            "tour_completed": False,
+            "watch_demo_data": True,
+            "progress_max_hz": 30,
+            "progress_min_step": 1,
+            "batch_workers": 0,
+            "grading_seed": None,
+            "per_student_seed": False,
+            "results_cache_rows": 500000,
+            "results_cache_disk": False
         }
         self.settings = self.load()
         self._import_from_env_once()
+        if write_delay is not None:
+            atexit.register(self.flush)
 
     def load(self):
         try:
@@ -52,19 +88,78 @@ class SettingsStore:
         return self.settings.get(key, default)
 
     def set(self, key, value):
-        self.settings[key] = value
+        with self._lock:
+            if key in self.settings and self.settings[key] == value:
+                return
+            self.settings[key] = value
+            self._dirty = True
+        for callback in list(self._subscribers.get(key, ())):
+            callback(value)
+
+    def subscribe(self, key, callback):
+        """Call callback(value) whenever the setting for key changes."""
+        self._subscribers.setdefault(key, []).append(callback)
+
+    def unsubscribe(self, key, callback):
+        callbacks = self._subscribers.get(key, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
     
     def __setitem__(self, key, value):
         """Allow dictionary-style assignment"""
-        self.settings[key] = value
+        self.set(key, value)
     
     def __getitem__(self, key):
         """Allow dictionary-style access"""
         return self.settings.get(key)
 
     def save(self):
+        """Write changed settings, now or (in write-behind mode) shortly."""
+        if self.write_delay is None:
+            self.flush()
+            return
+        with self._lock:
+            if not self._dirty or self._timer is not None:
+                return
+            self._timer = threading.Timer(self.write_delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """Write any pending changes immediately, e.g. on shutdown."""
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not self._dirty:
+                    return
+                try:
+                    data = json.dumps(self.settings, indent=2)
+                except (TypeError, ValueError) as e:
+                    logging.error("Settings are not JSON serialisable: %s", e)
+                    return
+                self._dirty = False
+            if not self._write(data):
+                with self._lock:
+                    self._dirty = True
+
+    def _write(self, data):
+        """Replace the settings file with data via a temp file; returns success."""
+        tmp_path = None
         try:
-            with open(self.filepath, 'w') as f:
-                json.dump(self.settings, f, indent=2)
-        except Exception as e:
-            logging.error(f"Failed to save settings to {self.filepath}: {e}")
+            # Keeps an existing settings.json's mode; mkstemp would reset it to 0600
+            fd, tmp_path = create_temp_beside(self.filepath)
+            with os.fdopen(fd, "w") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.filepath)
+            tmp_path = None
+            return True
+        except OSError as e:
+            logging.error("Failed to save settings to %s: %s", self.filepath, e)
+            return False
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
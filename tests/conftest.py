@@ -0,0 +1,42 @@
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PyQt5.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def roster_csv():
+    """A two-student dataset in the demo CSV layout: one graded, one missing."""
+    return (
+        "Student Name,Score,Feedback,Rubric\n"
+        "Ada,91,Great work,Correctness → Excellent\n"
+        "Ben,Not submitted,,\n"
+    )
+
+
+@pytest.fixture
+def make_results():
+    """Factory for all-submitted GradingResults with scores 80, 81, ... 99, 80, ..."""
+    import numpy as np
+    from grading_results import GradingResults
+
+    def make(rows=3):
+        return GradingResults(
+            [f"Student {i}" for i in range(rows)],
+            80 + np.arange(rows) % 20,
+            np.ones(rows, dtype=bool),
+            ["Solid work"] * rows,
+            ["Content: Good"] * rows,
+        )
+
+    return make
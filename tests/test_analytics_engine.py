@@ -0,0 +1,63 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_import_does_not_load_qt():
+    # A fresh interpreter: this test session has already imported PyQt5
+    result = subprocess.run(
+        [sys.executable, "-c",
+         "import sys, analytics_engine; print(any(m.startswith('PyQt5') for m in sys.modules))"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_worker_builds_rollups_and_formats_empty_groups(qapp, tmp_path):
+    from analytics_engine import ROLLUP_LEVELS
+    from demo_data_manager import DemoDataManager
+    from gradespark_gui import AnalyticsWorker, format_rollup_value
+
+    header = "Student Name,Score,Feedback,Rubric\n"
+    for grade, body in (("6", "Ada,91,Great,\n"), ("7", "Ben,Not submitted,,\n")):
+        subject = tmp_path / grade / "Math"
+        subject.mkdir(parents=True)
+        (subject / "Fractions.csv").write_text(header + body, encoding="utf-8")
+    manager = DemoDataManager(data_dir=tmp_path, use_sidecars=False,
+                              persist_index=False, cache_bytes=0)
+
+    worker = AnalyticsWorker(manager, manager.dataset_files())
+    finished = []
+    worker.finished.connect(finished.append)
+    worker.run()
+
+    engine, rollups = finished[0]
+    assert engine.demo_manager is manager
+    assert len(rollups) == len(ROLLUP_LEVELS)
+    by_grade = rollups[0].set_index("Grade")
+    assert format_rollup_value("Average", by_grade.loc["6", "Average"], ("Grade",)) == "91.0"
+    assert format_rollup_value("Average", by_grade.loc["7", "Average"], ("Grade",)) == "—"
+    assert format_rollup_value("Submission Rate", by_grade.loc["7", "Submission Rate"], ("Grade",)) == "0%"
+
+
+def test_worker_reads_only_its_snapshot(qapp, tmp_path):
+    from demo_data_manager import DemoDataManager
+    from gradespark_gui import AnalyticsWorker
+
+    subject = tmp_path / "6" / "Math"
+    subject.mkdir(parents=True)
+    (subject / "Fractions.csv").write_text(
+        "Student Name,Score,Feedback,Rubric\nAda,91,Great,\n", encoding="utf-8"
+    )
+    manager = DemoDataManager(data_dir=tmp_path, use_sidecars=False,
+                              persist_index=False, cache_bytes=0)
+    worker = AnalyticsWorker(manager, manager.dataset_files())
+    # The watcher may rebuild the structure on the UI thread while the worker runs
+    manager.structure.clear()
+
+    finished = []
+    worker.finished.connect(finished.append)
+    worker.run()
+    assert list(finished[0][1][0]["Grade"]) == ["6"]
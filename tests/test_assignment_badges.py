@@ -0,0 +1,31 @@
+from PyQt5.QtCore import QEvent, QPoint, Qt
+from PyQt5.QtGui import QHelpEvent, QStandardItem, QStandardItemModel
+from PyQt5.QtWidgets import QListView, QStyleOptionViewItem, QToolTip
+
+
+def test_tooltip_detail_is_built_only_when_shown(qapp):
+    from gradespark_gui import AssignmentBadgeDelegate
+
+    model = QStandardItemModel()
+    item = QStandardItem("Fractions")
+    item.setData("13 submitted, 2 missing", Qt.ToolTipRole)
+    model.appendRow(item)
+    view = QListView()
+    view.setModel(model)
+    asked = []
+    delegate = AssignmentBadgeDelegate(
+        view, tooltip_detail=lambda index: asked.append(index.data()) or "Weakest criterion: Thesis"
+    )
+    view.setItemDelegate(delegate)
+    view.show()
+
+    index = model.index(0, 0)
+    # Painting and sizing the items never ask for the detail
+    view.grab()
+    assert asked == []
+
+    event = QHelpEvent(QEvent.ToolTip, QPoint(1, 1), view.mapToGlobal(QPoint(1, 1)))
+    assert delegate.helpEvent(event, view, QStyleOptionViewItem(), index)
+    assert asked == ["Fractions"]
+    assert QToolTip.text() == "13 submitted, 2 missing\nWeakest criterion: Thesis"
+    QToolTip.hideText()
@@ -0,0 +1,64 @@
+import os
+
+import pytest
+
+from gradespark_gui import BatchWorker
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_batch(jobs, base_seed=1, max_workers=1):
+    worker = BatchWorker(jobs, base_seed=base_seed, max_workers=max_workers)
+    failed, finished, errors = {}, [], []
+    worker.dataset_failed.connect(failed.__setitem__)
+    worker.finished.connect(finished.append)
+    worker.error.connect(errors.append)
+    worker.run()
+    return failed, finished, errors
+
+
+def test_malformed_file_is_skipped_not_fatal(qapp, tmp_path, roster_csv):
+    good = tmp_path / "Fractions.csv"
+    good.write_text(roster_csv, encoding="utf-8")
+    bad = tmp_path / "Decimals.csv"
+    bad.write_text("Name,Points\nAda,91\n", encoding="utf-8")
+
+    failed, finished, errors = run_batch([
+        (str(good), None, "6", "Math", "Fractions"),
+        (str(bad), None, "6", "Math", "Decimals"),
+        (str(tmp_path / "Missing.csv"), None, "6", "Math", "Missing"),
+    ])
+
+    assert not errors
+    assert set(failed) == {("6", "Math", "Decimals"), ("6", "Math", "Missing")}
+    assert list(finished[0]) == [("6", "Math", "Fractions")]
+    assert len(finished[0][("6", "Math", "Fractions")]) == 2
+
+
+def test_batch_writes_and_reuses_sidecars(qapp, tmp_path, roster_csv):
+    pytest.importorskip("pyarrow")
+    good = tmp_path / "Fractions.csv"
+    good.write_text(roster_csv, encoding="utf-8")
+    sidecar = tmp_path / "sidecars" / "Fractions.feather"
+    job = (str(good), str(sidecar), "6", "Math", "Fractions")
+
+    _, first, _ = run_batch([job])
+    assert sidecar.exists()
+    _, second, _ = run_batch([job])
+    key = ("6", "Math", "Fractions")
+    assert list(second[0][key].scores) == list(first[0][key].scores)
+
+
+def test_pool_matches_sequential_run(qapp):
+    from demo_data_manager import DemoDataManager
+
+    manager = DemoDataManager(data_dir=os.path.join(ROOT, "demo_data"), use_sidecars=False,
+                              persist_index=False, cache_bytes=0)
+    jobs = [(manager.get_demo_file(*key), None, *key) for key in manager.list_datasets()]
+    assert len(jobs) > 3
+
+    _, (by_sequential,), _ = run_batch(jobs, base_seed=7, max_workers=1)
+    _, (by_pool,), _ = run_batch(jobs, base_seed=7, max_workers=3)
+    assert sorted(by_sequential) == sorted(by_pool)
+    for key, results in by_sequential.items():
+        assert results.records() == by_pool[key].records()
@@ -0,0 +1,47 @@
+from dataset_schema import check_header, check_rows, preflight_directory
+from demo_data_manager import DemoDataManager
+
+HEADER = "Student Name,Score,Feedback,Rubric\n"
+
+
+def test_check_rows_reports_physical_line_numbers(tmp_path):
+    path = tmp_path / "roster.csv"
+    path.write_text(
+        HEADER
+        + "Ada,91,Great,Content: Good\n"            # line 2
+        + "Ben,101,Too high,\n"                      # line 3
+        + "\n"                                       # line 4: blank rows still count
+        + "Cy,Not submitted,,\n"                     # line 5
+        + "Dee,80,Fine,Content Good\n"               # line 6
+        + "Eve,70,Fine,Content: Good,extra\n",       # line 7
+        encoding="utf-8",
+    )
+    # Two-row chunks put each problem in a different chunk
+    issues = check_rows(path, chunksize=2)
+    assert [(issue.line, issue.column) for issue in issues] == [
+        (3, "Score"), (4, "Student Name"), (4, "Score"), (6, "Rubric"), (7, None),
+    ]
+    assert check_rows(path, chunksize=2, max_issues=2) == issues[:2]
+
+
+def test_bad_header_is_rejected_without_reading_rows(tmp_path):
+    path = tmp_path / "roster.csv"
+    path.write_text("Name,Score,Feedback,Rubric\nAda,not a score,,\n", encoding="utf-8")
+    (issue,) = check_rows(path)
+    assert issue.line == 1 and "missing Student Name" in issue.message
+    assert check_header(path) == [issue]
+    assert list(preflight_directory(tmp_path)) == [str(path)]
+
+
+def test_validate_dataset(tmp_path):
+    subject = tmp_path / "6" / "Math"
+    subject.mkdir(parents=True)
+    (subject / "Fractions.csv").write_text(HEADER + "Ada,91,Great,\n", encoding="utf-8")
+    (subject / "Decimals.csv").write_text(HEADER + "Ada,ninety,Great,\n", encoding="utf-8")
+    manager = DemoDataManager(data_dir=tmp_path, use_sidecars=False,
+                              persist_index=False, cache_bytes=0)
+
+    assert manager.validate_dataset("6", "Math", "Fractions", strict=True) == []
+    assert manager.validate_dataset("6", "Math", "Decimals") == []
+    assert [issue.line for issue in manager.validate_dataset("6", "Math", "Decimals", strict=True)] == [2]
+    assert manager.validate_dataset("6", "Math", "Percents")[0].message == "File not found"
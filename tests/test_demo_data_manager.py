@@ -0,0 +1,142 @@
+import os
+import pickle
+
+import pytest
+
+from demo_data_manager import DemoDataManager, load_sidecar
+
+
+@pytest.fixture
+def data_dir(tmp_path, roster_csv):
+    subject = tmp_path / "data" / "6" / "Math"
+    subject.mkdir(parents=True)
+    (subject / "Fractions.csv").write_text(roster_csv, encoding="utf-8")
+    return tmp_path / "data"
+
+
+def make_manager(data_dir, tmp_path):
+    return DemoDataManager(data_dir=data_dir, sidecar_dir=tmp_path / "sidecars",
+                           persist_index=False, cache_bytes=0)
+
+
+def test_sidecar_round_trip(data_dir, tmp_path):
+    pytest.importorskip("pyarrow")
+    first, submitted, total, missing = make_manager(data_dir, tmp_path).load_csv("6", "Math", "Fractions")
+    assert (tmp_path / "sidecars" / "6" / "Math" / "Fractions.feather").exists()
+
+    manager = make_manager(data_dir, tmp_path)
+    csv_path = data_dir / "6" / "Math" / "Fractions.csv"
+    assert load_sidecar(csv_path, manager.sidecar_path(csv_path)) is not None
+    second = manager.load_csv("6", "Math", "Fractions")
+    assert second[0].equals(first)
+    assert second[1:] == (submitted, total, missing) == (1, 2, 1)
+
+
+def test_changed_csv_ignores_stale_sidecar(data_dir, tmp_path, roster_csv):
+    pytest.importorskip("pyarrow")
+    make_manager(data_dir, tmp_path).load_csv("6", "Math", "Fractions")
+    csv_path = data_dir / "6" / "Math" / "Fractions.csv"
+    csv_path.write_text(roster_csv + "Cy,75,Good,Correctness → Good\n", encoding="utf-8")
+
+    manager = make_manager(data_dir, tmp_path)
+    assert load_sidecar(csv_path, manager.sidecar_path(csv_path)) is None
+    assert manager.load_csv("6", "Math", "Fractions")[2] == 3
+
+
+def test_sidecar_survives_reextraction_with_new_mtime(data_dir, tmp_path, roster_csv):
+    pytest.importorskip("pyarrow")
+    make_manager(data_dir, tmp_path).load_csv("6", "Math", "Fractions")
+    csv_path = data_dir / "6" / "Math" / "Fractions.csv"
+    manager = make_manager(data_dir, tmp_path)
+
+    # One-file builds unpack identical bytes with a fresh mtime each launch
+    stat = csv_path.stat()
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert load_sidecar(csv_path, manager.sidecar_path(csv_path)) is not None
+
+    # Same size, different bytes: the hash catches it
+    csv_path.write_text(roster_csv.replace("91", "19"), encoding="utf-8")
+    assert load_sidecar(csv_path, manager.sidecar_path(csv_path)) is None
+
+
+def test_pickle_in_cache_dir_is_never_loaded(data_dir, tmp_path):
+    class Boom:
+        def __reduce__(self):
+            return (os.system, ("touch " + str(tmp_path / "pwned"),))
+
+    sidecar = tmp_path / "sidecars" / "6" / "Math"
+    sidecar.mkdir(parents=True)
+    (sidecar / "Fractions.pkl").write_bytes(pickle.dumps(Boom()))
+    (sidecar / "Fractions.feather").write_bytes(pickle.dumps(Boom()))
+
+    assert make_manager(data_dir, tmp_path).load_csv("6", "Math", "Fractions")[2] == 2
+    assert not (tmp_path / "pwned").exists()
+
+
+def test_summary_survives_undecodable_header(tmp_path):
+    subject = tmp_path / "data" / "6" / "Math"
+    subject.mkdir(parents=True)
+    # A cp1252 non-breaking space, as some spreadsheet exports write it
+    (subject / "Fractions.csv").write_bytes(
+        b"Student\xa0Name,Score,Feedback,Rubric\nAda,91,Great,\nBen,Not submitted,,\n"
+    )
+    manager = make_manager(tmp_path / "data", tmp_path)
+    assert manager.get_dataset_summary("6", "Math", "Fractions") == {
+        "submitted": 1, "total": 2, "missing": 1,
+    }
+
+
+def test_refresh_sees_files_added_within_one_mtime_tick(data_dir, tmp_path, roster_csv):
+    manager = DemoDataManager(data_dir=data_dir, sidecar_dir=tmp_path / "sidecars", cache_bytes=0)
+    subject = data_dir / "6" / "Math"
+    tick = subject.stat().st_mtime_ns
+    (subject / "Decimals.csv").write_text(roster_csv, encoding="utf-8")
+    # A FAT/SMB share can leave the directory mtime where it was
+    os.utime(subject, ns=(tick, tick))
+
+    assert manager.refresh()["added"] == [("6", "Math", "Decimals")]
+    reopened = DemoDataManager(data_dir=data_dir, sidecar_dir=tmp_path / "sidecars", cache_bytes=0)
+    assert reopened.get_assignments("6", "Math") == ["Decimals", "Fractions"]
+
+
+def test_refresh_lists_only_directories_that_changed(data_dir, tmp_path, roster_csv, monkeypatch):
+    subject = data_dir / "6" / "Math"
+    settled = subject.stat().st_mtime_ns - 10 * 10**9
+    os.utime(subject, ns=(settled, settled))
+    manager = DemoDataManager(data_dir=data_dir, sidecar_dir=tmp_path / "sidecars", cache_bytes=0)
+    listed, list_csv_names = [], manager._list_csv_names
+    monkeypatch.setattr(manager, "_list_csv_names",
+                        lambda directory: (listed.append(directory), list_csv_names(directory))[1])
+
+    assert manager.refresh() == {"added": [], "removed": []}
+    assert listed == []
+
+    (subject / "Decimals.csv").write_text(roster_csv, encoding="utf-8")
+    assert manager.refresh()["added"] == [("6", "Math", "Decimals")]
+    assert listed == [subject]
+
+
+def test_loads_write_the_index_once_per_flush(data_dir, tmp_path, monkeypatch):
+    manager = DemoDataManager(data_dir=data_dir, sidecar_dir=tmp_path / "sidecars", cache_bytes=0)
+    writes, save_index = [], manager._save_index
+    monkeypatch.setattr(manager, "_save_index", lambda: (writes.append(1), save_index()))
+
+    manager.load_csv("6", "Math", "Fractions")
+    assert writes == []
+    manager.refresh()
+    assert writes == [1]
+    manager.flush_index()
+    assert writes == [1]
+
+
+def test_rubric_matrix_is_cached_until_the_file_changes(data_dir, tmp_path, roster_csv):
+    manager = make_manager(data_dir, tmp_path)
+    matrix = manager.get_rubric_matrix("6", "Math", "Fractions")
+    assert matrix.criteria == ["Correctness"]
+    assert manager.get_rubric_matrix("6", "Math", "Fractions") is matrix
+
+    csv_path = data_dir / "6" / "Math" / "Fractions.csv"
+    csv_path.write_text(roster_csv + "Cy,62,Keep going,Correctness → Developing\n", encoding="utf-8")
+    changed = manager.get_rubric_matrix("6", "Math", "Fractions")
+    assert changed is not matrix
+    assert changed.weaknesses()["Correctness"] == 0.5
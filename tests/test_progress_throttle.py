@@ -0,0 +1,77 @@
+import itertools
+
+import pandas as pd
+import pytest
+
+import gradespark_gui
+from gradespark_gui import ProgressThrottle, Worker
+
+ROWS = 100_000
+
+
+def make_roster(rows):
+    return pd.DataFrame({
+        "Student Name": [f"Student {i}" for i in range(rows)],
+        "Score": ["Not submitted" if i % 20 == 0 else "80" for i in range(rows)],
+        "Feedback": [""] * rows,
+        "Rubric": [""] * rows,
+    })
+
+
+def run_worker(assignments, **kwargs):
+    worker = Worker(assignments, "Math", "6", total=ROWS, **kwargs)
+    emitted = []
+    worker.progress.connect(lambda pct, message: emitted.append(pct))
+    finished = []
+    worker.finished.connect(finished.append)
+    worker.run()
+    assert len(finished[0]) == ROWS
+    return emitted
+
+
+def test_throttle_emits_at_most_once_per_percent():
+    emitted = []
+    throttle = ProgressThrottle(lambda pct, message: emitted.append(pct), max_hz=0)
+    for row in range(ROWS):
+        throttle.update(int((row + 1) / ROWS * 100), "Grading...")
+    throttle.finish("Grading complete")
+
+    # 0% through 100%
+    assert len(emitted) <= 101
+    assert emitted == sorted(set(emitted))
+    assert emitted[-1] == 100
+
+
+def test_throttle_limits_rate(monkeypatch):
+    # Every update moves a whole percent, 10 ms of fake time apart: 0.99 s at 5 Hz
+    clock = itertools.count(step=0.01)
+    monkeypatch.setattr(gradespark_gui.time, "monotonic", lambda: next(clock))
+    emitted = []
+    throttle = ProgressThrottle(lambda pct, message: emitted.append(pct), max_hz=5)
+    for pct in range(100):
+        throttle.update(pct, "Grading...")
+
+    assert len(emitted) <= 6
+    throttle.finish("Grading complete")
+    assert emitted[-1] == 100
+
+
+def test_finish_always_delivers_100_once():
+    emitted = []
+    throttle = ProgressThrottle(lambda pct, message: emitted.append(pct), max_hz=1)
+    throttle.update(99, "Grading...")
+    throttle.finish("Grading complete")
+    throttle.finish("Grading complete")
+    assert emitted == [99, 100]
+
+
+@pytest.mark.parametrize("as_frame", [True, False], ids=["vectorised", "row-by-row"])
+def test_worker_progress_signals_on_100k_rows(qapp, as_frame):
+    roster = make_roster(ROWS)
+    assignments = roster if as_frame else roster.to_dict("records")
+    emitted = run_worker(assignments, seed=1)
+
+    assert 1 <= len(emitted) <= 101
+    assert emitted == sorted(emitted)
+    assert emitted[-1] == 100
+    assert emitted.count(100) == 1
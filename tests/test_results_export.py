@@ -0,0 +1,79 @@
+import os
+
+from PyQt5.QtCore import QEventLoop, QObject, QThread, QTimer, Qt, pyqtSignal
+
+from results_export import ExportWorker
+
+
+class CancelButton(QObject):
+    canceled = pyqtSignal()
+
+
+def run_export(worker, on_progress=None, timeout_ms=60000):
+    """Run worker on its own thread, the way the GUI does; return the outcome signal names."""
+    thread = QThread()
+    worker.moveToThread(thread)
+    loop = QEventLoop()
+    outcome = []
+    worker.finished.connect(lambda _path: (outcome.append("finished"), loop.quit()))
+    worker.cancelled.connect(lambda: (outcome.append("cancelled"), loop.quit()))
+    worker.error.connect(lambda message: (outcome.append(message), loop.quit()))
+    if on_progress is not None:
+        worker.progress.connect(on_progress)
+    thread.started.connect(worker.run)
+    QTimer.singleShot(timeout_ms, loop.quit)
+    thread.start()
+    loop.exec_()
+    thread.quit()
+    thread.wait()
+    return outcome
+
+
+def test_cancel_stops_large_export_and_writes_nothing(qapp, tmp_path, make_results):
+    destination = tmp_path / "results.csv"
+    worker = ExportWorker(make_results(1_000_000), destination)
+    button = CancelButton()
+    # Wired exactly like the export dialog's Cancel button
+    button.canceled.connect(worker.cancel, Qt.DirectConnection)
+
+    outcome = run_export(worker, on_progress=lambda *_: button.canceled.emit())
+
+    assert outcome == ["cancelled"]
+    assert not destination.exists()
+    assert os.listdir(tmp_path) == []
+
+
+def test_export_writes_every_row(qapp, tmp_path, make_results):
+    destination = tmp_path / "results.csv"
+    outcome = run_export(ExportWorker(make_results(12000), destination))
+
+    assert outcome == ["finished"]
+    with open(destination, encoding="utf-8") as handle:
+        assert sum(1 for _ in handle) == 12001
+
+
+def test_export_follows_umask(qapp, tmp_path, make_results):
+    destination = tmp_path / "results.jsonl"
+    previous = os.umask(0o022)
+    try:
+        assert run_export(ExportWorker(make_results(10), destination)) == ["finished"]
+    finally:
+        os.umask(previous)
+    assert destination.stat().st_mode & 0o777 == 0o644
+
+
+def test_export_keeps_mode_of_overwritten_file(qapp, tmp_path, make_results):
+    destination = tmp_path / "results.csv"
+    destination.write_text("old export\n")
+    destination.chmod(0o664)
+    assert run_export(ExportWorker(make_results(10), destination)) == ["finished"]
+    assert destination.stat().st_mode & 0o777 == 0o664
+    assert destination.read_text().startswith("Student Name")
+
+
+def test_export_never_changes_the_process_umask(qapp, tmp_path, make_results, monkeypatch):
+    def no_umask(_mask):
+        raise AssertionError("os.umask is process-wide; other threads would see it change")
+
+    monkeypatch.setattr(os, "umask", no_umask)
+    assert run_export(ExportWorker(make_results(10), tmp_path / "results.csv")) == ["finished"]
@@ -0,0 +1,41 @@
+from PyQt5.QtCore import Qt
+
+from dataset_schema import BUCKET_MISSING
+from grading_results import GradingResults
+from results_model import ResultsTableModel
+
+
+def test_batch_columns_are_displayed(qapp):
+    model = ResultsTableModel()
+    assert model.columnCount() == 4
+
+    results = GradingResults(["Ada", "Ben"], [91, 0], [True, False], ["Great", ""], ["", ""])
+    model.set_results(results.with_columns(Grade="6", Subject="Math", Assignment="Fractions"))
+
+    headers = [model.headerData(column, Qt.Horizontal) for column in range(model.columnCount())]
+    assert headers == ["Student Name", "Score", "Feedback", "Rubric", "Grade", "Subject", "Assignment"]
+    assert [model.index(1, column).data() for column in range(4, 7)] == ["6", "Math", "Fractions"]
+
+
+def test_streamed_parts_read_like_one_result_set(qapp):
+    whole = GradingResults(
+        [f"Student {i}" for i in range(10)],
+        [50, 0, 70, 95, 0, 60, 80, 0, 90, 100],
+        [True, False, True, True, False, True, True, False, True, True],
+        ["f"] * 10, ["r"] * 10,
+    )
+    streamed = ResultsTableModel()
+    for start in range(0, 10, 3):
+        streamed.append_results(whole.slice(start, start + 3))
+    loaded = ResultsTableModel()
+    loaded.set_results(whole)
+
+    assert streamed.rowCount() == 10
+    for row in range(10):
+        for column in range(4):
+            assert streamed.index(row, column).data() == loaded.index(row, column).data()
+        assert streamed.row_dict(row) == loaded.row_dict(row)
+    assert list(streamed.bucket_counts()) == list(loaded.bucket_counts())
+    assert streamed.names_in_bucket(BUCKET_MISSING, limit=2) == ["Student 1", "Student 4"]
+    assert streamed.names_in_bucket(BUCKET_MISSING) == ["Student 1", "Student 4", "Student 7"]
+    assert streamed.results().records() == whole.records()
@@ -0,0 +1,54 @@
+import pickle
+import zlib
+
+import pytest
+
+from grading_results import GradingResults
+from results_store import ResultsStore
+
+
+def test_disk_tier_round_trip(tmp_path, make_results):
+    db_path = tmp_path / "cache.sqlite"
+    ResultsStore(db_path=db_path).put("key", make_results(), "6/Math/Fractions")
+
+    loaded = ResultsStore(db_path=db_path).get("key")
+    assert list(loaded.scores) == [80, 81, 82]
+
+
+@pytest.mark.parametrize("stale_payload", [
+    pickle.dumps,                                                       # pre-versioning row
+    lambda results: pickle.dumps({"version": -1, "results": results}),  # old schema
+    lambda _: b"\x80\x04\x95\x10\x00\x00\x00\x00\x00\x00\x00\x8c\x06nosuch",  # truncated pickle
+    lambda _: pickle.dumps({"version": GradingResults.SCHEMA_VERSION}),  # missing results
+])
+def test_stale_row_is_a_miss_and_deleted(tmp_path, make_results, stale_payload):
+    db_path = tmp_path / "cache.sqlite"
+    store = ResultsStore(db_path=db_path)
+    results = make_results()
+    store.put("key", results)
+    payload = stale_payload(results)
+    with store._db:
+        store._db.execute("UPDATE results SET payload = ?", (zlib.compress(payload),))
+
+    fresh = ResultsStore(db_path=db_path)
+    assert fresh.get("key") is None
+    assert fresh.stats()["misses"] == 1
+    assert fresh.stats()["disk_entries"] == 0
+
+
+def test_out_of_range_scores_are_rejected():
+    with pytest.raises(ValueError, match="40000"):
+        GradingResults.from_records([{"Student Name": "Ada", "Score": "40000"}])
+    with pytest.raises(ValueError, match="-1"):
+        GradingResults(["Ada"], [-1], [True], [""], [""])
+    # Placeholder scores of non-submitters are ignored
+    results = GradingResults(["Ada", "Ben"], [90, 999], [True, False], ["", ""], ["", ""])
+    assert list(results.scores) == [90, 0]
+
+
+def test_memory_usage_counts_the_name_strings(make_results):
+    results = make_results(1000)
+    longer = GradingResults([name * 10 for name in results.names], results.scores,
+                            results.submitted, results.feedback, results.rubric)
+    # ASCII names: one byte per extra character
+    assert longer.memory_usage() - results.memory_usage() == 9 * sum(map(len, results.names))
@@ -0,0 +1,96 @@
+import json
+import time
+
+import pytest
+
+import settings_store
+from settings_store import SettingsStore
+
+
+@pytest.fixture
+def settings_path(tmp_path, monkeypatch):
+    # The store imports a .env from the working directory on first run
+    monkeypatch.chdir(tmp_path)
+    return tmp_path / "settings.json"
+
+
+def counting_writes(store):
+    writes = []
+    write = store._write
+
+    def _write(data):
+        writes.append(json.loads(data))
+        return write(data)
+
+    store._write = _write
+    return writes
+
+
+def wait_for_write_behind(store, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while store._timer is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    # flush() clears the timer before writing; the write holds _write_lock
+    with store._write_lock:
+        pass
+
+
+def test_burst_of_changes_is_written_once(settings_path):
+    store = SettingsStore(str(settings_path), write_delay=0.05)
+    writes = counting_writes(store)
+    for hz in (10, 20, 40):
+        store.set("progress_max_hz", hz)
+        store.save()
+    store.set("dark_mode_enabled", True)
+    store.save()
+    wait_for_write_behind(store)
+
+    assert len(writes) == 1
+    saved = json.loads(settings_path.read_text())
+    assert (saved["progress_max_hz"], saved["dark_mode_enabled"]) == (40, True)
+
+
+def test_unchanged_values_are_not_written(settings_path):
+    store = SettingsStore(str(settings_path))
+    writes = counting_writes(store)
+    store.set("dark_mode_enabled", store.get("dark_mode_enabled"))
+    store.save()
+    store.flush()
+    assert writes == []
+    assert not settings_path.exists()
+
+
+def test_flush_writes_pending_changes_on_close(settings_path):
+    store = SettingsStore(str(settings_path), write_delay=60)
+    store.set("batch_workers", 3)
+    store.save()
+    assert not settings_path.exists()
+
+    store.flush()
+    assert store._timer is None
+    assert json.loads(settings_path.read_text())["batch_workers"] == 3
+
+
+def test_failed_write_cleans_up_and_retries(settings_path, monkeypatch):
+    store = SettingsStore(str(settings_path))
+
+    def fail_replace(_src, _dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(settings_store.os, "replace", fail_replace)
+    store.set("batch_workers", 2)
+    store.save()
+    assert list(settings_path.parent.iterdir()) == []
+
+    monkeypatch.undo()
+    store.flush()
+    assert json.loads(settings_path.read_text())["batch_workers"] == 2
+
+
+def test_replacing_settings_keeps_the_file_mode(settings_path):
+    settings_path.write_text("{}")
+    settings_path.chmod(0o640)
+    store = SettingsStore(str(settings_path))
+    store.set("batch_workers", 4)
+    store.save()
+    assert settings_path.stat().st_mode & 0o777 == 0o640